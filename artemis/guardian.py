@@ -20,6 +20,7 @@ from artemis.security_summary import SecuritySummary
 from artemis.kill_switch import KillSwitch
 from artemis.event_trace import EventTrace
 from core.credentials import get_credential_store
+from core.lazy import deferred_imports, resolving_import
 from core.invariants import InvariantViolationError, FatalInvariantViolationError
 from datetime import datetime
 
@@ -54,10 +55,20 @@ class ArtemisGuardian:
         self._event_trace = EventTrace()
         self._last_escalation_reason: str | None = None
         self._last_transition_time: str = datetime.now().isoformat()
+        self._policy_epoch: int = 0
     
     def get_state(self) -> SecurityState:
         """Return the current security state."""
         return self._state
+
+    def policy_epoch(self) -> int:
+        """
+        Return a counter bumped on every state transition.
+
+        Results cached under one epoch were computed under the policy in
+        force then; keying caches by it invalidates them on any change.
+        """
+        return self._policy_epoch
     
     def set_secure(self) -> None:
         """
@@ -84,6 +95,7 @@ class ArtemisGuardian:
             self._state = SecurityState.SECURE
             self._last_escalation_reason = "Recovered to SECURE"
             self._last_transition_time = datetime.now().isoformat()
+            self._policy_epoch += 1
             self._record_event("security_state_transition", {
                 "state": self._state.name,
                 "reason": self._last_escalation_reason,
@@ -120,6 +132,7 @@ class ArtemisGuardian:
         self._state = SecurityState.DEGRADED
         self._last_escalation_reason = reason
         self._last_transition_time = datetime.now().isoformat()
+        self._policy_epoch += 1
         self._record_event("security_state_transition", {
             "state": self._state.name,
             "reason": reason,
@@ -155,6 +168,7 @@ class ArtemisGuardian:
         self._state = SecurityState.COMPROMISED
         self._last_escalation_reason = reason
         self._last_transition_time = datetime.now().isoformat()
+        self._policy_epoch += 1
         self._record_event("security_state_transition", {
             "state": self._state.name,
             "reason": reason,
@@ -197,6 +211,7 @@ class ArtemisGuardian:
         self._lockdown_reason = reason
         self._last_escalation_reason = reason
         self._last_transition_time = datetime.now().isoformat()
+        self._policy_epoch += 1
         self._record_event("security_state_transition", {
             "state": self._state.name,
             "reason": reason,
@@ -372,7 +387,23 @@ class ArtemisGuardian:
         if self._import_guard_installed:
             return
 
+        # Modules deferred with core.lazy.lazy_import before this point were
+        # declared as static imports; each may be loaded once, by its
+        # DeferredModule on first use. Checked first, since a set lookup is
+        # cheaper than the frame walk.
+        deferred = set(deferred_imports())
+
         def guarded_import(name, globals=None, locals=None, fromlist=(), level=0):
+            if (
+                level == 0
+                and not fromlist
+                and name in deferred
+                and resolving_import() == name
+            ):
+                module = self._original_import(name, globals, locals, fromlist, level)
+                deferred.discard(name)
+                return module
+
             if self._is_importlib_bootstrap_call():
                 return self._original_import(name, globals, locals, fromlist, level)
 
@@ -6,10 +6,10 @@ Evidence preserved
 Escalation irreversible without restart
 """
 
-import hashlib
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from artemis.file_hasher import hash_file
 from artemis.integrity_baseline import IntegrityBaseline
 
 
@@ -189,11 +189,4 @@ class IntegrityMonitor:
         Returns:
             Hex-encoded SHA-256 hash
         """
-        hasher = hashlib.sha256()
-        
-        with open(file_path, "rb") as f:
-            # Read in chunks to handle large files
-            while chunk := f.read(8192):
-                hasher.update(chunk)
-        
-        return hasher.hexdigest()
+        return hash_file(file_path)
@@ -4,16 +4,39 @@ Artemis Integrity Baseline - Cryptographic Record of System State
 Records SHA256 hashes of critical system directories at first secure boot.
 Used to detect tampering with code and audit logs.
 
+Verification rehashes only files whose (inode, size, mtime_ns, ctime_ns)
+changed since they last matched; the directory walk for added files is
+skipped while no directory's stat changed. Paranoid mode (or a forced
+or periodic full verification) rehashes everything.
+
+The baseline is saved as a Merkle tree (artemis.merkle): per-directory
+subtree hashes and a single root hash, so attestation compares one
+hash and a verification localizes changes to the directories whose
+hashes differ. Flat file->hash baselines from older versions still load.
+
 Artemis integrity violation
 Evidence preserved
 Escalation irreversible without restart
 """
 
-import hashlib
 import json
 import os
+import stat
+import time
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
+
+from artemis.file_hasher import hash_files
+from artemis.merkle import ROOT, MerkleTree
+
+BASELINE_FORMAT = "merkle-v1"
+
+# (st_ino, st_size, st_mtime_ns, st_ctime_ns)
+StatSignature = Tuple[int, int, int, int]
+
+# Files modified this recently are always rehashed: a write in the same
+# timestamp tick as the stat would leave the signature unchanged
+RACY_WINDOW_NS = 2_000_000_000
 
 
 class IntegrityBaseline:
@@ -28,6 +51,9 @@ class IntegrityBaseline:
     
     Created ONLY at first secure boot.
     Never modified after creation.
+    
+    Stat signatures are kept in memory only, next to the hash they were
+    verified against; they are a cache, not part of the baseline.
     """
     
     CRITICAL_DIRECTORIES = [
@@ -37,16 +63,39 @@ class IntegrityBaseline:
         "domains/",
     ]
     
-    def __init__(self, baseline_path: Optional[Path] = None):
+    def __init__(
+        self,
+        baseline_path: Optional[Path] = None,
+        paranoid: bool = False,
+        full_rehash_seconds: Optional[float] = None,
+        hash_workers: Optional[int] = None,
+    ):
         """
         Initialize integrity baseline.
         
         Args:
             baseline_path: Path to store/load baseline (optional)
+            paranoid: Rehash every file on every verification
+            full_rehash_seconds: Force a full verification when the last
+                one is older than this (None: only on demand)
+            hash_workers: Threads used to hash files (default: one per
+                core plus four, up to 16; 1 hashes serially)
         """
         self._baseline_path = baseline_path or Path("./.artemis_baseline")
         self._baseline: Dict[str, str] = {}
         self._loaded = False
+        self.paranoid = paranoid
+        self.full_rehash_seconds = full_rehash_seconds
+        self.hash_workers = hash_workers
+        
+        # rel_path -> (stat signature, hash) of files last seen matching
+        self._verified: Dict[str, Tuple[StatSignature, str]] = {}
+        self._verified_root: Optional[str] = None
+        # Directory stat signatures and the .py files found under them
+        self._tree: Optional[Tuple[Dict[str, Optional[StatSignature]], List[str]]] = None
+        self._last_full_verification: Optional[float] = None
+        self._last_verification: Dict[str, object] = {}
+        self._merkle: Optional[MerkleTree] = None
     
     def create_baseline(self, root_dir: Path) -> Dict[str, str]:
         """
@@ -68,28 +117,30 @@ class IntegrityBaseline:
                 "Cannot recreate without system restart."
             )
         
-        baseline = {}
+        signatures: Dict[str, StatSignature] = {}
+        root = os.fspath(root_dir)
+        self._tree = None
         
-        for dir_pattern in self.CRITICAL_DIRECTORIES:
-            dir_path = root_dir / dir_pattern
-            if not dir_path.exists():
+        # Walk all Python files in the critical directories (skips __pycache__)
+        for rel_path in sorted(self._python_files(root_dir)):
+            try:
+                signatures[rel_path] = self._stat_signature(os.path.join(root, rel_path))
+            except OSError:
+                # Skip unreadable files
                 continue
-            
-            # Walk all Python files in directory
-            for py_file in sorted(dir_path.rglob("*.py")):
-                # Skip __pycache__
-                if "__pycache__" in py_file.parts:
-                    continue
-                
-                try:
-                    file_hash = self._compute_hash(py_file)
-                    rel_path = str(py_file.relative_to(root_dir))
-                    baseline[rel_path] = file_hash
-                except Exception as e:
-                    # Skip unreadable files
-                    continue
+        
+        baseline = {}
+        hashes = self._hash_all(root, list(signatures))
+        for rel_path, file_hash in hashes.items():
+            # Skip unreadable files
+            if file_hash is None:
+                continue
+            baseline[rel_path] = file_hash
+            self._remember(rel_path, signatures[rel_path], file_hash)
         
         self._baseline = baseline
+        self._merkle = None
+        self._verified_root = str(root_dir)
         return baseline
     
     def save_baseline(self) -> None:
@@ -109,9 +160,17 @@ class IntegrityBaseline:
         if not self._baseline:
             raise ValueError("No baseline to save")
         
+        tree = self._merkle_tree()
+        record = {
+            "format": BASELINE_FORMAT,
+            "root": tree.root,
+            "directories": tree.hashes,
+            "files": self._baseline,
+        }
+        
         try:
             with open(self._baseline_path, "w") as f:
-                json.dump(self._baseline, f, indent=2)
+                json.dump(record, f, indent=2)
             try:
                 os.chmod(self._baseline_path, 0o444)
             except Exception as e:
@@ -123,11 +182,16 @@ class IntegrityBaseline:
         """
         Load baseline from disk.
         
+        Accepts the Merkle format and older flat file->hash maps. The
+        stored root hash is recomputed from the file hashes and must match.
+        
         Returns:
             Dict mapping file paths to SHA256 hashes
         
         Raises:
             FileNotFoundError: If baseline doesn't exist
+            RuntimeError: If the baseline is unreadable or its root hash
+                does not match its file hashes
         """
         if self._loaded and self._baseline:
             return self._baseline
@@ -137,13 +201,26 @@ class IntegrityBaseline:
         
         try:
             with open(self._baseline_path, "r") as f:
-                self._baseline = json.load(f)
+                record = json.load(f)
+            
+            if record.get("format") == BASELINE_FORMAT:
+                files = record["files"]
+                tree = MerkleTree(files)
+                if tree.root != record["root"]:
+                    raise ValueError("root hash does not match file hashes")
+            else:
+                # Flat baseline from before the Merkle format
+                files = record
+                tree = None
+            
+            self._baseline = files
+            self._merkle = tree
             self._loaded = True
             return self._baseline
         except Exception as e:
             raise RuntimeError(f"Failed to load integrity baseline: {e}")
     
-    def verify_files(self, root_dir: Path) -> tuple[bool, list]:
+    def verify_files(self, root_dir: Path, full: bool = False) -> tuple[bool, list]:
         """
         Verify all files against baseline.
         
@@ -151,8 +228,17 @@ class IntegrityBaseline:
         Evidence preserved
         Escalation irreversible without restart
         
+        Files whose stat signature is unchanged since they last matched
+        the baseline are not rehashed, unless this is a full verification
+        (full=True, paranoid mode, or full_rehash_seconds elapsed).
+        
+        The current root hash and the directories whose subtree hashes
+        changed are recorded in get_verification_stats(); only changed
+        files' ancestors are rehashed to get them.
+        
         Args:
             root_dir: Root directory to verify from
+            full: Rehash every file regardless of stat signatures
         
         Returns:
             Tuple of (all_valid, list_of_mismatches)
@@ -168,15 +254,46 @@ class IntegrityBaseline:
         if not self._baseline:
             raise RuntimeError("No baseline loaded")
         
+        started = time.perf_counter()
+        full = full or self.paranoid or self._full_rehash_due()
+        if full or self._verified_root != str(root_dir):
+            self._verified.clear()
+            self._tree = None
+            self._verified_root = str(root_dir)
+        
         mismatches = []
-        verified = set()
+        # Plain strings: pathlib joins would cost more than the stat itself
+        root = os.fspath(root_dir)
         
-        # Check each file in baseline
+        # Stat every baseline file; collect the ones that need hashing
+        missing = set()
+        to_hash: Dict[str, Optional[StatSignature]] = {}
         for rel_path, expected_hash in self._baseline.items():
-            verified.add(rel_path)
-            file_path = root_dir / rel_path
+            try:
+                signature = self._stat_signature(os.path.join(root, rel_path))
+            except FileNotFoundError:
+                self._verified.pop(rel_path, None)
+                missing.add(rel_path)
+                continue
+            except OSError:
+                signature = None
             
-            if not file_path.exists():
+            if signature is None or self._verified.get(rel_path) != (signature, expected_hash):
+                to_hash[rel_path] = signature
+        
+        added = [
+            rel_path for rel_path in self._python_files(root_dir)
+            if rel_path not in self._baseline
+        ]
+        
+        hashes = self._hash_all(root, list(to_hash) + added)
+        # Relative path -> current hash (None: missing or unreadable)
+        changes: Dict[str, Optional[str]] = {}
+        
+        # Check each file in baseline, in baseline order
+        for rel_path, expected_hash in self._baseline.items():
+            if rel_path in missing:
+                changes[rel_path] = None
                 mismatches.append({
                     "file": rel_path,
                     "baseline": expected_hash,
@@ -184,67 +301,168 @@ class IntegrityBaseline:
                     "status": "missing"
                 })
                 continue
+            if rel_path not in to_hash:
+                continue
             
-            try:
-                current_hash = self._compute_hash(file_path)
-                if current_hash != expected_hash:
-                    mismatches.append({
-                        "file": rel_path,
-                        "baseline": expected_hash[:16],  # Truncate for display
-                        "current": current_hash[:16],
-                        "status": "modified"
-                    })
-            except Exception as e:
+            current_hash = hashes[rel_path]
+            if current_hash != expected_hash:
+                changes[rel_path] = current_hash
+            
+            if current_hash is None:
+                self._verified.pop(rel_path, None)
                 mismatches.append({
                     "file": rel_path,
                     "baseline": expected_hash[:16],
                     "current": None,
                     "status": "error"
                 })
+            elif current_hash != expected_hash:
+                self._verified.pop(rel_path, None)
+                mismatches.append({
+                    "file": rel_path,
+                    "baseline": expected_hash[:16],  # Truncate for display
+                    "current": current_hash[:16],
+                    "status": "modified"
+                })
+            elif to_hash[rel_path] is not None:
+                self._remember(rel_path, to_hash[rel_path], current_hash)
         
         # Check for new files not in baseline
+        for rel_path in added:
+            if hashes[rel_path] is not None:
+                changes[rel_path] = hashes[rel_path]
+                mismatches.append({
+                    "file": rel_path,
+                    "baseline": None,
+                    "current": hashes[rel_path][:16],
+                    "status": "added"
+                })
+        
+        tree = self._merkle_tree()
+        if changes:
+            directory_hashes = tree.with_changes(changes)
+            root_hash = directory_hashes[ROOT]
+            changed_directories = tree.changed_directories(directory_hashes)
+        else:
+            root_hash = tree.root
+            changed_directories = []
+        
+        if full:
+            self._last_full_verification = time.monotonic()
+        self._last_verification = {
+            "mode": "full" if full else "stat",
+            "files": len(self._baseline),
+            "hashed": len(hashes),
+            "root": root_hash,
+            "changed_directories": changed_directories,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 3),
+        }
+        
+        is_valid = len(mismatches) == 0
+        return is_valid, mismatches
+    
+    def get_verification_stats(self) -> Dict[str, object]:
+        """Mode, files hashed, time taken and tree hashes of the last verification."""
+        return dict(self._last_verification)
+    
+    def root_hash(self) -> str:
+        """
+        Merkle root hash of the baseline.
+        
+        Equal roots prove identical baselines; compare with the "root" of
+        get_verification_stats() to attest the current tree.
+        
+        Raises:
+            RuntimeError: If no baseline is loaded
+        """
+        if not self._baseline:
+            raise RuntimeError("No baseline loaded")
+        return self._merkle_tree().root
+    
+    def _merkle_tree(self) -> MerkleTree:
+        if self._merkle is None:
+            self._merkle = MerkleTree(self._baseline)
+        return self._merkle
+    
+    def _full_rehash_due(self) -> bool:
+        """True if no full verification has run within full_rehash_seconds."""
+        if self.full_rehash_seconds is None:
+            return False
+        if self._last_full_verification is None:
+            return True
+        return time.monotonic() - self._last_full_verification >= self.full_rehash_seconds
+    
+    def _stat_signature(self, path) -> StatSignature:
+        st = os.stat(path)
+        return (st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+    
+    def _remember(self, rel_path: str, signature: StatSignature, file_hash: str) -> None:
+        """Record a file as matching, unless its timestamps are too recent to trust."""
+        now_ns = time.time_ns()
+        if max(signature[2], signature[3]) >= now_ns - RACY_WINDOW_NS:
+            self._verified.pop(rel_path, None)
+            return
+        self._verified[rel_path] = (signature, file_hash)
+    
+    def _dir_signature(self, path: str) -> Optional[StatSignature]:
+        """Stat signature of a directory, or None if it does not exist."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if not stat.S_ISDIR(st.st_mode):
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+    
+    def _python_files(self, root_dir: Path) -> List[str]:
+        """
+        Relative paths of .py files in the critical directories.
+        
+        Reuses the previous walk while every directory's stat signature
+        is unchanged (adding, removing or renaming an entry changes the
+        containing directory's mtime). The root and every critical
+        directory are always in that set, absent ones as None, so a
+        critical directory created after the walk forces a new one.
+        """
+        root = os.fspath(root_dir)
+        if self._tree is not None:
+            directories, files = self._tree
+            if all(self._dir_signature(d) == sig for d, sig in directories.items()):
+                return files
+        
+        directories: Dict[str, Optional[StatSignature]] = {root: self._dir_signature(root)}
+        files: List[str] = []
         for dir_pattern in self.CRITICAL_DIRECTORIES:
-            dir_path = root_dir / dir_pattern
-            if not dir_path.exists():
+            dir_path = os.path.join(root, dir_pattern)
+            directories[dir_path] = self._dir_signature(dir_path)
+            if directories[dir_path] is None:
                 continue
             
-            for py_file in dir_path.rglob("*.py"):
-                if "__pycache__" in py_file.parts:
-                    continue
-                
-                rel_path = str(py_file.relative_to(root_dir))
-                if rel_path not in verified:
-                    try:
-                        current_hash = self._compute_hash(py_file)
-                        mismatches.append({
-                            "file": rel_path,
-                            "baseline": None,
-                            "current": current_hash[:16],
-                            "status": "added"
-                        })
-                    except Exception:
-                        pass
+            for current, subdirs, names in os.walk(dir_path):
+                subdirs[:] = [d for d in subdirs if d != "__pycache__"]
+                directories[current] = self._dir_signature(current)
+                for name in names:
+                    if name.endswith(".py"):
+                        files.append(os.path.relpath(os.path.join(current, name), root))
         
-        is_valid = len(mismatches) == 0
-        return is_valid, mismatches
+        self._tree = (directories, files)
+        return files
     
-    def _compute_hash(self, file_path: Path) -> str:
+    def _hash_all(self, root: str, rel_paths: List[str]) -> Dict[str, Optional[str]]:
         """
-        Compute SHA256 hash of a file.
+        Compute SHA256 hashes of files, concurrently.
         
         Args:
-            file_path: Path to file
+            root: Root directory the paths are relative to
+            rel_paths: Relative file paths
         
         Returns:
-            Hex-encoded SHA256 hash
+            Dict mapping each relative path, in input order, to its
+            hex-encoded hash, or None if it could not be read
         """
-        hasher = hashlib.sha256()
-        
-        with open(file_path, "rb") as f:
-            while chunk := f.read(8192):
-                hasher.update(chunk)
-        
-        return hasher.hexdigest()
+        full_paths = {rel_path: os.path.join(root, rel_path) for rel_path in rel_paths}
+        hashes = hash_files(full_paths.values(), max_workers=self.hash_workers)
+        return {rel_path: hashes[path] for rel_path, path in full_paths.items()}
     
     def has_baseline(self) -> bool:
         """Check if baseline exists on disk."""
@@ -0,0 +1,133 @@
+"""
+Artemis Merkle Tree - Directory Hashes Over a File Baseline
+
+Each directory's hash covers the sorted (kind, name, hash) entries of
+its files and subdirectories; the root directory ("") covers the whole
+baseline. Comparing root hashes proves two baselines identical, and a
+change is localized by following the directories whose hashes differ.
+
+Applying file changes recomputes only the changed files' ancestors.
+Standard library only.
+"""
+
+import hashlib
+import os
+from typing import Dict, List, Mapping, Optional, Tuple
+
+ROOT = ""
+
+# name -> ("f" | "d", hash)
+Entries = Dict[str, Tuple[str, str]]
+
+
+def _depth(directory: str) -> int:
+    return directory.count(os.sep) + 1 if directory else 0
+
+
+def _hash_entries(entries: Entries) -> str:
+    hasher = hashlib.sha256()
+    for name in sorted(entries):
+        kind, value = entries[name]
+        hasher.update(f"{kind} {name} {value}\n".encode("utf-8"))
+    return hasher.hexdigest()
+
+
+class MerkleTree:
+    """
+    Directory hashes of a relative path -> SHA256 file map.
+
+    Immutable once built; with_changes() returns hashes for a modified
+    copy without touching this tree.
+    """
+
+    def __init__(self, file_hashes: Mapping[str, str]):
+        """
+        Build the tree.
+
+        Args:
+            file_hashes: Relative file path -> hex SHA256
+        """
+        self._entries: Dict[str, Entries] = {ROOT: {}}
+        for rel_path, file_hash in file_hashes.items():
+            parent, name = os.path.split(rel_path)
+            self._entries.setdefault(parent, {})[name] = ("f", file_hash)
+            while parent:
+                grandparent, name = os.path.split(parent)
+                self._entries.setdefault(grandparent, {}).setdefault(name, ("d", ""))
+                parent = grandparent
+
+        # Deepest first, so subdirectory hashes exist before their parents'
+        self.hashes: Dict[str, str] = {}
+        for directory in sorted(self._entries, key=_depth, reverse=True):
+            entries = self._entries[directory]
+            for name, (kind, _) in entries.items():
+                if kind == "d":
+                    entries[name] = ("d", self.hashes[os.path.join(directory, name)])
+            self.hashes[directory] = _hash_entries(entries)
+
+    @property
+    def root(self) -> str:
+        """Hash covering every file in the tree."""
+        return self.hashes[ROOT]
+
+    def with_changes(self, changes: Mapping[str, Optional[str]]) -> Dict[str, Optional[str]]:
+        """
+        Directory hashes after applying file changes.
+
+        Only the changed files' ancestor directories are recomputed.
+
+        Args:
+            changes: Relative file path -> new hash, or None if removed
+
+        Returns:
+            Hash of every recomputed directory (always including the
+            root), None for directories left empty
+        """
+        entries: Dict[str, Entries] = {}
+
+        def dirty(directory: str) -> Entries:
+            if directory not in entries:
+                entries[directory] = dict(self._entries.get(directory, {}))
+            return entries[directory]
+
+        dirty(ROOT)
+        for rel_path, file_hash in changes.items():
+            parent, name = os.path.split(rel_path)
+            if file_hash is None:
+                dirty(parent).pop(name, None)
+            else:
+                dirty(parent)[name] = ("f", file_hash)
+            while parent:
+                parent = os.path.split(parent)[0]
+                dirty(parent)
+
+        hashes: Dict[str, Optional[str]] = {}
+        for directory in sorted(entries, key=_depth, reverse=True):
+            own = entries[directory]
+            if directory == ROOT:
+                hashes[ROOT] = _hash_entries(own)
+                continue
+
+            parent, name = os.path.split(directory)
+            if own:
+                hashes[directory] = _hash_entries(own)
+                entries[parent][name] = ("d", hashes[directory])
+            else:
+                hashes[directory] = None
+                entries[parent].pop(name, None)
+        return hashes
+
+    def changed_directories(self, hashes: Mapping[str, Optional[str]]) -> List[str]:
+        """
+        Directories whose hash differs from this tree's.
+
+        Args:
+            hashes: Result of with_changes()
+
+        Returns:
+            Sorted relative directory paths ("" is the root)
+        """
+        return sorted(
+            directory for directory, value in hashes.items()
+            if value != self.hashes.get(directory)
+        )
@@ -1,5 +1,17 @@
 """Athena adapters package."""
 
-__all__ = ["extract_text_from_pdf", "scan_pdf_directory"]
+__all__ = [
+    "extract_text_from_pdf",
+    "iter_page_segments",
+    "iter_pdf_pages",
+    "page_for_offset",
+    "scan_pdf_directory",
+]
 
-from .pdf_adapter import extract_text_from_pdf, scan_pdf_directory
+from .pdf_adapter import (
+    extract_text_from_pdf,
+    iter_page_segments,
+    iter_pdf_pages,
+    page_for_offset,
+    scan_pdf_directory,
+)
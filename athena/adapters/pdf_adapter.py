@@ -4,8 +4,9 @@ PDF text extraction adapter for Athena.
 Extract text from PDF files with page tracking.
 """
 
+from bisect import bisect_right
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional
 
 try:
     from PyPDF2 import PdfReader
@@ -13,6 +14,68 @@ except ImportError:
     PdfReader = None
 
 
+def iter_pdf_pages(
+    pdf_path: Path,
+    transform: Optional[Callable[[str], str]] = None,
+) -> Iterator[tuple[int, int, str]]:
+    """
+    Stream page segments from a PDF file.
+    
+    Pages are extracted one at a time; the document is never held in
+    memory as a whole.
+    
+    Args:
+        pdf_path: Path to PDF file
+        transform: Optional function applied to each page's text
+            (e.g. clean_text) before it is wrapped in a page segment
+    
+    Yields:
+        (page_number, offset, segment) tuples, where offset is the absolute
+        position of the segment in the concatenated document text
+    
+    Raises:
+        ImportError: If PyPDF2 not installed
+        FileNotFoundError: If PDF not found
+    """
+    if PdfReader is None:
+        raise ImportError(
+            "PyPDF2 required for PDF support. Install with: pip install PyPDF2"
+        )
+
+    if not pdf_path.exists():
+        raise FileNotFoundError(f"PDF not found: {pdf_path}")
+
+    reader = PdfReader(str(pdf_path))
+    yield from iter_page_segments(
+        (page.extract_text() for page in reader.pages), transform=transform
+    )
+
+
+def iter_page_segments(
+    pages: Iterable[Optional[str]],
+    transform: Optional[Callable[[str], str]] = None,
+) -> Iterator[tuple[int, int, str]]:
+    """
+    Wrap page texts in page segments with absolute offsets.
+    
+    Args:
+        pages: Page texts in order (empty or None for blank pages)
+        transform: Optional function applied to each page's text
+    
+    Yields:
+        (page_number, offset, segment) tuples, as iter_pdf_pages
+    """
+    offset = 0
+
+    for page_num, text in enumerate(pages, start=1):
+        if text and transform is not None:
+            text = transform(text)
+        segment = f"\n--- Page {page_num} ---\n{text}\n" if text else ""
+
+        yield page_num, offset, segment
+        offset += len(segment)
+
+
 def extract_text_from_pdf(pdf_path: Path) -> tuple[str, dict]:
     """
     Extract text from PDF file.
@@ -37,25 +100,23 @@ def extract_text_from_pdf(pdf_path: Path) -> tuple[str, dict]:
         raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
     try:
-        reader = PdfReader(str(pdf_path))
-        pages = reader.pages
-        full_text = ""
+        parts = []
         page_breaks = {}  # Map position to page number
+        page_count = 0
 
-        for page_num, page in enumerate(pages, start=1):
-            page_breaks[len(full_text)] = page_num
-            text = page.extract_text()
-            if text:
-                full_text += f"\n--- Page {page_num} ---\n{text}\n"
+        for page_num, offset, segment in iter_pdf_pages(pdf_path):
+            page_breaks[offset] = page_num
+            parts.append(segment)
+            page_count = page_num
 
         metadata = {
-            "page_count": len(pages),
+            "page_count": page_count,
             "file_name": pdf_path.name,
             "file_path": str(pdf_path),
             "page_breaks": page_breaks,
         }
 
-        return full_text, metadata
+        return "".join(parts), metadata
 
     except Exception as e:
         raise RuntimeError(f"Failed to extract text from {pdf_path}: {e}")
@@ -82,6 +143,24 @@ def scan_pdf_directory(data_dir: Path) -> list[Path]:
     return sorted(pdf_files)
 
 
+def page_for_offset(
+    offsets: list[int], page_numbers: list[int], position: int
+) -> int:
+    """
+    Resolve the page containing a text position.
+    
+    Args:
+        offsets: Ascending page start offsets
+        page_numbers: Page number for each offset
+        position: Absolute text position
+    
+    Returns:
+        Page number (1 if position precedes every page break)
+    """
+    idx = bisect_right(offsets, position)
+    return page_numbers[idx - 1] if idx else 1
+
+
 def get_text_with_page_numbers(
     pdf_path: Path, text: str, page_breaks: dict
 ) -> list[tuple[str, int]]:
@@ -96,19 +175,16 @@ def get_text_with_page_numbers(
     Returns:
         List of (text_line, page_number) tuples
     """
-    lines = text.split("\n")
+    offsets = sorted(page_breaks)
+    page_numbers = [page_breaks[pos] for pos in offsets]
     result = []
-    current_page = 1
     text_position = 0
 
-    for line in lines:
-        # Update page number if we've reached a page break
-        for pos, page_num in sorted(page_breaks.items()):
-            if text_position >= pos:
-                current_page = page_num
-
+    for line in text.split("\n"):
         if line.strip():
-            result.append((line.strip(), current_page))
+            result.append(
+                (line.strip(), page_for_offset(offsets, page_numbers, text_position))
+            )
 
         text_position += len(line) + 1  # +1 for newline
 
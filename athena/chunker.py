@@ -1,21 +1,31 @@
 """
 Document Chunker - Semantic chunking with overlap.
+
+Single forward pass over the text: semantic boundaries are detected
+lazily and merged into chunks with a two-pointer overlap window, so
+chunking is linear in document length.
 """
 from __future__ import annotations
 
+import hashlib
+import logging
 import re
+import threading
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from enum import Enum
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple
 from uuid import uuid4
 
-import nltk
 from pydantic import BaseModel, Field
 
-from ..shared.logging.structured_logger import StructuredLogger
-from .document_ingestor import DocumentChunk, IngestedDocument
+if TYPE_CHECKING:
+    from .document_ingestor import IngestedDocument
+
+logger = logging.getLogger(__name__)
 
 
-class ChunkingStrategy(Enum):
+class ChunkingStrategy(str, Enum):
     """Chunking strategies."""
     FIXED = "fixed"  # Fixed size chunks
     SEMANTIC = "semantic"  # Semantic boundaries
@@ -43,6 +53,20 @@ class ChunkingConfig(BaseModel):
         use_enum_values = True
 
 
+class DocumentChunk(BaseModel):
+    """Document chunk with metadata."""
+    chunk_id: str = Field(default_factory=lambda: str(uuid4()))
+    document_id: str
+    content: str
+    chunk_index: int
+    start_position: int
+    end_position: int
+    page_number: Optional[int] = None
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+    embedding: Optional[List[float]] = None
+    checksum: str
+
+
 @dataclass
 class ChunkBoundary:
     """Chunk boundary information."""
@@ -52,6 +76,51 @@ class ChunkBoundary:
     boundary_type: Optional[str] = None  # paragraph, sentence, heading, etc.
 
 
+# Regex fallback: split after terminal punctuation that is followed by
+# whitespace. Zero-width, so pieces concatenate back to the input exactly.
+_SENTENCE_SPLIT = re.compile(r'(?<=[.!?])(?=\s)')
+
+# Sentence tokenizers, loaded at most once per process and language
+_sentence_tokenizers: Dict[str, Callable[[str], List[str]]] = {}
+_tokenizer_lock = threading.Lock()
+
+
+def _regex_sent_tokenize(text: str) -> List[str]:
+    """Offline sentence splitter used when NLTK punkt is unavailable."""
+    return _SENTENCE_SPLIT.split(text)
+
+
+def get_sentence_tokenizer(language: str = "english") -> Callable[[str], List[str]]:
+    """
+    Return a sentence tokenizer for a language.
+
+    NLTK punkt is used if it is installed with its data already present;
+    nothing is downloaded. Otherwise the regex tokenizer is used. The
+    result is cached for the life of the process.
+    """
+    tokenizer = _sentence_tokenizers.get(language)
+    if tokenizer is not None:
+        return tokenizer
+
+    with _tokenizer_lock:
+        tokenizer = _sentence_tokenizers.get(language)
+        if tokenizer is not None:
+            return tokenizer
+
+        try:
+            import nltk
+            nltk.data.find('tokenizers/punkt')
+
+            def tokenizer(text: str) -> List[str]:
+                return nltk.sent_tokenize(text, language=language)
+        except (ImportError, LookupError):
+            logger.debug("NLTK punkt unavailable, using regex sentence splitter")
+            tokenizer = _regex_sent_tokenize
+
+        _sentence_tokenizers[language] = tokenizer
+        return tokenizer
+
+
 class DocumentChunker:
     """
     Advanced document chunker with semantic boundary detection.
@@ -60,197 +129,167 @@ class DocumentChunker:
     - Multiple chunking strategies
     - Semantic boundary preservation
     - Overlap management
-    - Language-specific tokenization
+    - Language-specific tokenization (loaded lazily, once per process)
     """
+
+    # Compiled once for all instances
+    heading_pattern = re.compile(r'^(#+|\d+\.\s+|\b(CHAPTER|SECTION)\s+\d+)', re.IGNORECASE)
+    list_pattern = re.compile(r'^(\s*[\-\*•]\s+|\s*\d+\.\s+)')
     
     def __init__(self, config: Optional[ChunkingConfig] = None):
         self.config = config or ChunkingConfig()
-        self.logger = StructuredLogger(__name__)
         
-        # Download NLTK data if needed
-        try:
-            nltk.data.find('tokenizers/punkt')
-            nltk.data.find('taggers/averaged_perceptron_tagger')
-        except LookupError:
-            self.logger.info("Downloading NLTK data...")
-            nltk.download('punkt')
-            nltk.download('averaged_perceptron_tagger')
-        
-        # Compile regex patterns
-        self.heading_pattern = re.compile(r'^(#+|\d+\.\s+|\b(CHAPTER|SECTION)\s+\d+)', re.IGNORECASE)
-        self.list_pattern = re.compile(r'^(\s*[\-\*•]\s+|\s*\d+\.\s+)')
-        
-        self.logger.info(
-            "Document chunker initialized",
-            strategy=self.config.strategy,
-            chunk_size=self.config.chunk_size
+        logger.debug(
+            "Document chunker initialized (strategy=%s, chunk_size=%d)",
+            self.config.strategy,
+            self.config.chunk_size
         )
     
-    def _detect_semantic_boundaries(self, text: str) -> List[ChunkBoundary]:
+    def _is_heading(self, para: str) -> bool:
+        """Check if a paragraph looks like a heading."""
+        if '\n' in para:
+            return False
+        first_line = para.strip()
+        return len(first_line) < 100 and bool(
+            self.heading_pattern.match(first_line) or
+            first_line.isupper() or
+            first_line.endswith(':')
+        )
+
+    def _detect_semantic_boundaries(self, text: str) -> Iterator[ChunkBoundary]:
         """
         Detect semantic boundaries in text.
         
-        Returns list of (start, end) positions for semantic units.
+        Yields boundaries in ascending, non-overlapping order.
         """
-        boundaries = []
+        pos = 0
+        text_length = len(text)
         
-        # Split by paragraphs first
-        paragraphs = text.split('\n\n')
-        current_pos = 0
+        while pos <= text_length:
+            para_end = text.find('\n\n', pos)
+            if para_end == -1:
+                para_end = text_length
         
-        for para in paragraphs:
-            if not para.strip():
-                current_pos += 2  # Account for \n\n
-                continue
-            
-            para_start = current_pos
-            para_end = current_pos + len(para)
-            
-            # Check if this looks like a heading
-            lines = para.split('\n')
-            first_line = lines[0].strip() if lines else ""
+            para = text[pos:para_end]
             
-            is_heading = (
-                len(lines) == 1 and
-                len(first_line) < 100 and
-                (
-                    self.heading_pattern.match(first_line) or
-                    first_line.isupper() or
-                    first_line.endswith(':')
-                )
-            )
-            
-            if is_heading and self.config.respect_paragraphs:
-                # Treat heading as separate chunk
-                boundaries.append(ChunkBoundary(
-                    start=para_start,
-                    end=para_end,
-                    is_semantic=True,
-                    boundary_type="heading"
-                ))
-            else:
-                # Further split paragraph by sentences if needed
-                if self.config.respect_sentences and len(para) > self.config.max_chunk_size:
-                    sentences = self._split_sentences(para)
-                    sent_start = para_start
-                    
-                    for sentence in sentences:
-                        if not sentence.strip():
-                            continue
-                        
-                        sent_end = sent_start + len(sentence)
-                        boundaries.append(ChunkBoundary(
-                            start=sent_start,
-                            end=sent_end,
-                            is_semantic=True,
-                            boundary_type="sentence"
-                        ))
-                        sent_start = sent_end
+            if para.strip():
+                if self._is_heading(para) and self.config.respect_paragraphs:
+                    # Treat heading as separate chunk
+                    yield ChunkBoundary(
+                        start=pos,
+                        end=para_end,
+                        is_semantic=True,
+                        boundary_type="heading"
+                    )
+                elif self.config.respect_sentences and len(para) > self.config.max_chunk_size:
+                    # Further split long paragraphs by sentences
+                    yield from self._sentence_boundaries(para, pos)
                 else:
-                    boundaries.append(ChunkBoundary(
-                        start=para_start,
+                    yield ChunkBoundary(
+                        start=pos,
                         end=para_end,
                         is_semantic=True,
                         boundary_type="paragraph"
-                    ))
+                    )
             
-            current_pos = para_end + 2  # Account for \n\n
+            pos = para_end + 2  # Account for \n\n
         
-        return boundaries
+    def _sentence_boundaries(self, para: str, offset: int) -> Iterator[ChunkBoundary]:
+        """Yield sentence boundaries within a paragraph starting at offset."""
+        cursor = 0
+
+        for sentence in self._split_sentences(para):
+            stripped = sentence.strip()
+            if not stripped:
+                continue
+
+            # Tokenizers may drop whitespace; locate each sentence from the cursor
+            start = para.find(stripped, cursor)
+            if start == -1:
+                start = cursor
+            end = start + len(stripped)
+            cursor = end
+
+            yield ChunkBoundary(
+                start=offset + start,
+                end=offset + end,
+                is_semantic=True,
+                boundary_type="sentence"
+            )
     
     def _split_sentences(self, text: str) -> List[str]:
-        """Split text into sentences using NLTK."""
+        """Split text into sentences."""
+        tokenizer = get_sentence_tokenizer(self.config.language)
         try:
-            sentences = nltk.sent_tokenize(text, language=self.config.language)
-            return sentences
+            return tokenizer(text)
         except Exception:
-            # Fallback to simple period-based splitting
-            sentences = []
-            current = []
-            chars = list(text)
-            
-            for i, char in enumerate(chars):
-                current.append(char)
-                if char in '.!?':
-                    # Check if it's really end of sentence
-                    if i + 1 < len(chars) and chars[i + 1] in ' \t\n':
-                        sentences.append(''.join(current))
-                        current = []
-            
-            if current:
-                sentences.append(''.join(current))
-            
-            return sentences
+            return _regex_sent_tokenize(text)
     
     def _merge_boundaries_into_chunks(
         self,
-        boundaries: List[ChunkBoundary],
-        text: str
-    ) -> List[Tuple[int, int, bool]]:
+        boundaries: Iterator[ChunkBoundary]
+    ) -> Iterator[Tuple[int, int, bool]]:
         """
         Merge semantic boundaries into chunks based on configuration.
         
-        Returns list of (start, end, is_semantic) tuples.
+        Two-pointer window over the boundary stream: `window` holds the
+        boundaries of the current chunk, and on each flush its left edge
+        advances to the boundary containing the overlap start. Every
+        boundary enters and leaves the window once.
+
+        Yields (start, end, is_semantic) tuples.
         """
-        chunks = []
-        current_start = 0
-        current_length = 0
-        current_boundaries = []
+        window: List[ChunkBoundary] = []
+        lo = 0  # Left pointer into window
+        length = 0  # Sum of boundary lengths in window[lo:]
+        non_semantic = 0  # Non-semantic boundaries in window[lo:]
         
         for boundary in boundaries:
             boundary_length = boundary.end - boundary.start
             
-            # If adding this boundary would exceed max chunk size
-            if (current_length + boundary_length > self.config.chunk_size and 
-                current_length >= self.config.min_chunk_size):
+            # If adding this boundary would exceed chunk size, flush
+            if (len(window) > lo and
+                    length + boundary_length > self.config.chunk_size and
+                    length >= self.config.min_chunk_size):
                 
-                # Finalize current chunk
-                if current_boundaries:
-                    chunk_end = current_boundaries[-1].end
-                    is_semantic = all(b.is_semantic for b in current_boundaries)
-                    chunks.append((current_start, chunk_end, is_semantic))
+                chunk_start = window[lo].start
+                chunk_end = window[-1].end
+                yield (chunk_start, chunk_end, non_semantic == 0)
                 
-                # Start new chunk with overlap
-                if self.config.chunk_overlap > 0 and chunks:
-                    last_chunk_start, last_chunk_end, _ = chunks[-1]
-                    overlap_start = max(last_chunk_end - self.config.chunk_overlap, last_chunk_start)
+                # Start new chunk with overlap: keep trailing boundaries that
+                # reach into the last chunk_overlap characters
+                overlap_start = chunk_end - self.config.chunk_overlap
                     
-                    # Find boundary that contains overlap start
-                    for i, b in enumerate(boundaries):
-                        if b.start <= overlap_start <= b.end:
-                            current_start = b.start
-                            current_boundaries = boundaries[i:]
-                            current_length = sum(b.end - b.start for b in current_boundaries[:1])
-                            break
-                    else:
-                        current_start = boundary.start
-                        current_boundaries = [boundary]
-                        current_length = boundary_length
-                else:
-                    current_start = boundary.start
-                    current_boundaries = [boundary]
-                    current_length = boundary_length
-            else:
-                # Add boundary to current chunk
-                current_boundaries.append(boundary)
-                current_length += boundary_length
+                new_lo = lo + 1  # Always make progress
+                while new_lo < len(window) and window[new_lo].end <= overlap_start:
+                    new_lo += 1
+
+                for dropped in window[lo:new_lo]:
+                    length -= dropped.end - dropped.start
+                    non_semantic -= not dropped.is_semantic
+                lo = new_lo
+
+                # Compact the consumed prefix occasionally (amortized O(1))
+                if lo > 64 and lo * 2 > len(window):
+                    del window[:lo]
+                    lo = 0
+
+            # Add boundary to current chunk
+            window.append(boundary)
+            length += boundary_length
+            non_semantic += not boundary.is_semantic
         
         # Add final chunk
-        if current_boundaries:
-            chunk_end = current_boundaries[-1].end
-            is_semantic = all(b.is_semantic for b in current_boundaries)
-            chunks.append((current_start, chunk_end, is_semantic))
+        if len(window) > lo:
+            yield (window[lo].start, window[-1].end, non_semantic == 0)
         
-        return chunks
-    
-    def _fixed_size_chunking(self, text: str) -> List[Tuple[int, int, bool]]:
+    def _fixed_size_chunking(self, text: str) -> Iterator[Tuple[int, int, bool]]:
         """Simple fixed-size chunking."""
-        chunks = []
         text_length = len(text)
-        
-        for i in range(0, text_length, self.config.chunk_size - self.config.chunk_overlap):
-            chunk_start = i
-            chunk_end = min(i + self.config.chunk_size, text_length)
+        step = max(self.config.chunk_size - self.config.chunk_overlap, 1)
+    
+        for chunk_start in range(0, text_length, step):
+            chunk_end = min(chunk_start + self.config.chunk_size, text_length)
             
             # Adjust end to not break words if possible
             if chunk_end < text_length:
@@ -259,90 +298,83 @@ class DocumentChunker:
                     if text[j] in '.!?\n':
                         chunk_end = j + 1
                         break
-                # Try to end at word boundary
-                elif chunk_end < text_length and text[chunk_end] not in ' \t\n':
-                    for j in range(chunk_end, min(text_length, chunk_end + 100)):
-                        if text[j] in ' \t\n':
-                            chunk_end = j
-                            break
+                else:
+                    # Try to end at word boundary
+                    if text[chunk_end] not in ' \t\n':
+                        for j in range(chunk_end, min(text_length, chunk_end + 100)):
+                            if text[j] in ' \t\n':
+                                chunk_end = j
+                                break
             
-            chunks.append((chunk_start, chunk_end, False))
+            yield (chunk_start, chunk_end, False)
             
             if chunk_end >= text_length:
                 break
-        
-        return chunks
-    
-    def chunk_document(self, document: IngestedDocument) -> List[DocumentChunk]:
-        """
-        Chunk document based on configured strategy.
-        
-        Args:
-            document: Ingested document
-        
-        Returns:
-            List of document chunks
-        """
-        text = document.content
-        
+
+    def _chunk_ranges(self, text: str) -> Iterator[Tuple[int, int, bool]]:
+        """Select chunking strategy and yield chunk ranges."""
+        if self.config.strategy == ChunkingStrategy.FIXED:
+            return self._fixed_size_chunking(text)
+
+        # Semantic-based chunking
+        return self._merge_boundaries_into_chunks(self._detect_semantic_boundaries(text))
+
+    def _build_chunks(
+        self,
+        text: str,
+        document_id: str,
+        title: str
+    ) -> List[DocumentChunk]:
+        """Create DocumentChunks for text, honoring max_chunks."""
         if not text.strip():
             return []
-        
-        # Select chunking strategy
-        if self.config.strategy == ChunkingStrategy.FIXED:
-            chunk_ranges = self._fixed_size_chunking(text)
-        else:
-            # Semantic-based chunking
-            boundaries = self._detect_semantic_boundaries(text)
-            chunk_ranges = self._merge_boundaries_into_chunks(boundaries, text)
-        
-        # Create chunks
+
         chunks = []
-        for chunk_index, (start, end, is_semantic) in enumerate(chunk_ranges):
-            if chunk_index >= self.config.max_chunks:
-                break
-            
+        ranges = islice(self._chunk_ranges(text), self.config.max_chunks)
+
+        for chunk_index, (start, end, is_semantic) in enumerate(ranges):
             chunk_text = text[start:end].strip()
             if not chunk_text:
                 continue
-            
-            # Calculate checksum for chunk
-            import hashlib
-            checksum = hashlib.sha256(chunk_text.encode()).hexdigest()
-            
-            # Determine page number if available
-            page_number = None
-            if document.metadata.parser_metadata and 'pages' in document.metadata.parser_metadata:
-                # Simple approximation: assume uniform distribution
-                # This could be enhanced with actual page mapping from parser
-                pass
-            
+
             chunk = DocumentChunk(
-                document_id=document.document_id,
+                document_id=document_id,
                 content=chunk_text,
                 chunk_index=chunk_index,
                 start_position=start,
                 end_position=end,
-                page_number=page_number,
+                page_number=None,
                 metadata={
                     "is_semantic": is_semantic,
                     "strategy": self.config.strategy,
-                    "original_title": document.title
+                    "original_title": title
                 },
-                checksum=checksum
+                checksum=hashlib.sha256(chunk_text.encode()).hexdigest()
             )
-            
+
             chunks.append(chunk)
-        
-        self.logger.debug(
-            "Document chunked",
-            document_id=document.document_id,
-            chunks=len(chunks),
-            strategy=self.config.strategy
+
+        logger.debug(
+            "Document chunked (document_id=%s, chunks=%d, strategy=%s)",
+            document_id,
+            len(chunks),
+            self.config.strategy
         )
         
         return chunks
     
+    def chunk_document(self, document: IngestedDocument) -> List[DocumentChunk]:
+        """
+        Chunk document based on configured strategy.
+        
+        Args:
+            document: Ingested document
+        
+        Returns:
+            List of document chunks
+        """
+        return self._build_chunks(document.content, document.document_id, document.title)
+    
     def chunk_text(self, text: str, document_id: str = "generated") -> List[DocumentChunk]:
         """
         Chunk raw text.
@@ -354,23 +386,4 @@ class DocumentChunker:
         Returns:
             List of document chunks
         """
-        # Create a minimal document structure
-        document = IngestedDocument(
-            document_id=document_id,
-            title="Generated Text",
-            content=text,
-            metadata=DocumentMetadata(
-                document_id=document_id,
-                title="Generated Text",
-                document_type=DocumentType.TEXT,
-                file_name="generated.txt",
-                file_size=len(text),
-                file_extension=".txt",
-                checksum=hashlib.sha256(text.encode()).hexdigest(),
-                source_path="generated"
-            ),
-            checksum=hashlib.sha256(text.encode()).hexdigest(),
-            processing_time_ms=0.0
-        )
-        
-        return self.chunk_document(document)
\ No newline at end of file
+        return self._build_chunks(text, document_id, "Generated Text")
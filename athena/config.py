@@ -29,12 +29,35 @@ class AthenaConfig:
     chunk_size: int = 512
     chunk_overlap: int = 50
 
+    # Ingestion
+    ingest_batch_size: int = 64  # Chunks per embedding/index request
+
+    # Near-duplicate chunks: "off", "drop", or "link" (skip, and record the
+    # canonical chunk in dedup_links_path). Signatures persist in
+    # dedup_index_path, so duplicates are found across runs
+    dedup_mode: str = "off"
+    dedup_threshold: float = 0.9  # Estimated Jaccard similarity
+
     # Embedding
     embedding_model: str = "all-MiniLM-L6-v2"  # Local, offline
 
     # Search
     top_k: int = 5  # Sources per query
 
+    # Vector index: "chroma", or "local" (in-process NumPy index)
+    vector_backend: str = "chroma"
+    # Local index storage: "float32", "float16" or "int8" (per-vector scaled)
+    vector_storage: str = "float32"
+    rescore_factor: int = 4  # Quantized candidates re-scored in float32 per result
+
+    # Physical sharding: "none", "subject" or "module" (one index per value)
+    shard_by: str = "none"
+    shard_workers: int = 4  # Threads for fan-out over shards
+
+    # Seconds between checks for a newer published local index (hot-swap
+    # after an ingest in another process); 0 checks on every query
+    index_reload_interval: float = 2.0
+
     # Internal
     collection_name: str = "hearth_knowledge"
 
@@ -52,6 +75,41 @@ class AthenaConfig:
         """Path to ChromaDB persistent storage."""
         return self.index_dir / "chroma_db"
 
+    @property
+    def local_index_path(self) -> Path:
+        """Path to the local vector index."""
+        return self.index_dir / "local_index"
+
+    @property
+    def local_shards_path(self) -> Path:
+        """Directory of per-shard local vector indexes."""
+        return self.index_dir / "local_shards"
+
+    @property
+    def shard_catalog_path(self) -> Path:
+        """Path to the shard catalog."""
+        return self.index_dir / "shard_catalog.json"
+
+    @property
+    def dedup_links_path(self) -> Path:
+        """Path to the near-duplicate chunk -> canonical chunk links."""
+        return self.index_dir / "dedup_links.json"
+
+    @property
+    def dedup_index_path(self) -> Path:
+        """Path to the near-duplicate detector's MinHash signatures."""
+        return self.index_dir / "dedup_signatures.npz"
+
+    @property
+    def processed_index_path(self) -> Path:
+        """Path to the processed-document (checksum) index."""
+        return self.index_dir / "processed_index.db"
+
+    @property
+    def ocr_cache_path(self) -> Path:
+        """Path to the persistent OCR result cache."""
+        return self.index_dir / "ocr_cache.db"
+
     @property
     def is_valid(self) -> bool:
         """Check if configuration is usable."""
@@ -60,5 +118,14 @@ class AthenaConfig:
             and self.index_dir.is_dir()
             and self.chunk_size > 0
             and self.chunk_overlap >= 0
+            and self.ingest_batch_size > 0
+            and self.dedup_mode in ("off", "drop", "link")
+            and 0.0 < self.dedup_threshold <= 1.0
             and self.top_k > 0
+            and self.vector_backend in ("chroma", "local")
+            and self.vector_storage in ("float32", "float16", "int8")
+            and self.rescore_factor > 0
+            and self.shard_by in ("none", "subject", "module")
+            and self.shard_workers > 0
+            and self.index_reload_interval >= 0
         )
@@ -0,0 +1,285 @@
+"""
+Near-duplicate chunk detection for Athena ingestion.
+
+MinHash signatures over character shingles, with LSH banding to find
+candidate matches in sublinear time. Deterministic: no dependence on
+Python's randomized string hashing.
+
+Signatures can be saved and loaded, so detection spans separate runs;
+LSH buckets are rebuilt from them on load.
+"""
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64(0xFFFFFFFF)
+
+
+def optimal_bands(num_perm: int, threshold: float) -> tuple[int, int]:
+    """
+    Choose (bands, rows) with bands * rows == num_perm.
+
+    Picks the split whose LSH S-curve midpoint (1/b)^(1/r) is closest to
+    the Jaccard threshold.
+    """
+    best = (num_perm, 1)
+    best_error = float("inf")
+
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        error = abs((1.0 / bands) ** (1.0 / rows) - threshold)
+        if error < best_error:
+            best, best_error = (bands, rows), error
+
+    return best
+
+
+@dataclass
+class DedupStats:
+    """Counters for a detector's lifetime."""
+
+    chunks_seen: int = 0
+    duplicates: int = 0
+    text_bytes_saved: int = 0
+
+    @property
+    def embedding_calls_saved(self) -> int:
+        return self.duplicates
+
+
+@dataclass
+class NearDuplicateDetector:
+    """
+    Ingest-time near-duplicate detector.
+
+    Each accepted chunk becomes a canonical entry. A later chunk whose
+    estimated Jaccard similarity to a canonical chunk is at least
+    `threshold` is reported as its duplicate.
+
+    Entries may be tagged with the document they came from; forget()
+    drops a document's entries before it is re-ingested, so a document
+    is never a duplicate of its own previous version.
+    """
+
+    threshold: float = 0.9
+    num_perm: int = 128
+    shingle_size: int = 5
+    seed: int = 1
+    record_links: bool = True
+    links: dict = field(default_factory=dict)  # duplicate id -> canonical id
+    link_documents: dict = field(default_factory=dict)  # duplicate id -> document id
+    stats: DedupStats = field(default_factory=DedupStats)
+
+    def __post_init__(self):
+        if not 0.0 < self.threshold <= 1.0:
+            raise ValueError("threshold must be in (0, 1]")
+
+        rng = np.random.default_rng(self.seed)
+        # Keep a, b, x below 2**32 so a * x + b fits in uint64
+        self._a = rng.integers(1, 1 << 32, size=(self.num_perm, 1), dtype=np.uint64)
+        self._b = rng.integers(0, 1 << 32, size=(self.num_perm, 1), dtype=np.uint64)
+
+        self.bands, self.rows = optimal_bands(self.num_perm, self.threshold)
+        # Band key -> chunk ids; dicts rather than sets keep lookups in
+        # insertion order, so ties resolve the same way every run
+        self._buckets: list[dict[bytes, dict[str, None]]] = [{} for _ in range(self.bands)]
+        self._signatures: dict[str, np.ndarray] = {}  # chunk id -> signature
+        self._documents: dict[str, Optional[str]] = {}  # chunk id -> document id
+        self._document_chunks: dict[Optional[str], dict[str, None]] = {}
+        self._document_links: dict[str, set[str]] = {}  # document id -> duplicate ids
+        for duplicate_id, document_id in self.link_documents.items():
+            self._document_links.setdefault(document_id, set()).add(duplicate_id)
+
+    def _shingle_hashes(self, text: str) -> np.ndarray:
+        """Polynomial rolling hashes of byte k-shingles (uint32 range)."""
+        data = np.frombuffer(" ".join(text.lower().split()).encode("utf-8"), dtype=np.uint8)
+        k = self.shingle_size
+
+        if len(data) < k:
+            data = np.pad(data, (0, k - len(data)))
+
+        windows = np.lib.stride_tricks.sliding_window_view(data, k).astype(np.uint64)
+        powers = np.uint64(257) ** np.arange(k - 1, -1, -1, dtype=np.uint64)
+        hashes = (windows * powers).sum(axis=1) & _MAX_HASH
+        return np.unique(hashes)
+
+    def signature(self, text: str) -> np.ndarray:
+        """MinHash signature of a text."""
+        hashes = self._shingle_hashes(text)[np.newaxis, :]
+        permuted = ((self._a * hashes + self._b) % _MERSENNE_PRIME) & _MAX_HASH
+        return permuted.min(axis=1)
+
+    def _band_keys(self, signature: np.ndarray) -> list[bytes]:
+        return [
+            signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+    def find(self, signature: np.ndarray) -> Optional[str]:
+        """Return the id of the most similar canonical chunk above threshold."""
+        candidates: dict[str, None] = {}
+        for band, key in enumerate(self._band_keys(signature)):
+            candidates.update(self._buckets[band].get(key, {}))
+
+        best_id = None
+        best_similarity = -1.0
+        for chunk_id in candidates:
+            similarity = float(np.mean(self._signatures[chunk_id] == signature))
+            if similarity > best_similarity:
+                best_id, best_similarity = chunk_id, similarity
+
+        return best_id if best_similarity >= self.threshold else None
+
+    def add(self, signature: np.ndarray, chunk_id: str, document_id: Optional[str] = None) -> None:
+        """Register a canonical chunk (replacing any entry with the same id)."""
+        if chunk_id in self._signatures:
+            self._remove(chunk_id)
+
+        self._signatures[chunk_id] = signature
+        self._documents[chunk_id] = document_id
+        self._document_chunks.setdefault(document_id, {})[chunk_id] = None
+        for band, key in enumerate(self._band_keys(signature)):
+            self._buckets[band].setdefault(key, {})[chunk_id] = None
+
+    def _remove(self, chunk_id: str) -> None:
+        signature = self._signatures.pop(chunk_id)
+        document_id = self._documents.pop(chunk_id)
+        chunks = self._document_chunks[document_id]
+        del chunks[chunk_id]
+        if not chunks:
+            del self._document_chunks[document_id]
+
+        for band, key in enumerate(self._band_keys(signature)):
+            bucket = self._buckets[band][key]
+            del bucket[chunk_id]
+            if not bucket:
+                del self._buckets[band][key]
+
+    def forget(self, document_id: str) -> None:
+        """
+        Drop a document's canonical entries and the links from its chunks.
+
+        Links from other documents' chunks to this document's chunks are
+        kept: chunk ids are positional, so a re-ingest recreates them.
+        """
+        for chunk_id in list(self._document_chunks.get(document_id, ())):
+            self._remove(chunk_id)
+
+        for duplicate_id in self._document_links.pop(document_id, ()):
+            del self.link_documents[duplicate_id]
+            self.links.pop(duplicate_id, None)
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def load_links(self, links: dict, link_documents: dict) -> None:
+        """Restore duplicate links (and their documents) saved by a caller."""
+        self.links.update(links)
+        for duplicate_id, document_id in link_documents.items():
+            self._link_document(duplicate_id, document_id)
+
+    def _link_document(self, duplicate_id: str, document_id: str) -> None:
+        previous = self.link_documents.get(duplicate_id)
+        if previous is not None:
+            self._document_links[previous].discard(duplicate_id)
+        self.link_documents[duplicate_id] = document_id
+        self._document_links.setdefault(document_id, set()).add(duplicate_id)
+
+    def save(self, path: Path) -> None:
+        """
+        Write the canonical signatures (atomic replace).
+
+        Args:
+            path: Destination .npz file
+        """
+        chunk_ids = list(self._signatures)
+        documents = [self._documents[chunk_id] for chunk_id in chunk_ids]
+        signatures = (
+            np.stack([self._signatures[chunk_id] for chunk_id in chunk_ids])
+            if chunk_ids else np.zeros((0, self.num_perm), dtype=np.uint64)
+        )
+
+        tmp_path = path.with_name(path.name + ".tmp")
+        with tmp_path.open("wb") as f:
+            np.savez(
+                f,
+                params=np.array([self.num_perm, self.shingle_size, self.seed], dtype=np.int64),
+                chunk_ids=np.array(chunk_ids, dtype=str),
+                documents=np.array([d or "" for d in documents], dtype=str),
+                has_document=np.array([d is not None for d in documents], dtype=bool),
+                signatures=signatures,
+            )
+        os.replace(tmp_path, path)
+
+    def load(self, path: Path) -> bool:
+        """
+        Add canonical signatures written by save().
+
+        Signatures made with a different num_perm, shingle_size or seed
+        are not comparable and are ignored.
+
+        Args:
+            path: File written by save()
+
+        Returns:
+            True if signatures were loaded
+        """
+        if not path.exists():
+            return False
+
+        with np.load(path, allow_pickle=False) as data:
+            if list(data["params"]) != [self.num_perm, self.shingle_size, self.seed]:
+                return False
+            documents = [
+                str(d) if has else None
+                for d, has in zip(data["documents"], data["has_document"], strict=True)
+            ]
+            for chunk_id, document_id, signature in zip(
+                data["chunk_ids"], documents, data["signatures"], strict=True
+            ):
+                self.add(signature, str(chunk_id), document_id)
+        return True
+
+    def check(
+        self,
+        text: str,
+        chunk_id: str,
+        document_id: Optional[str] = None,
+        duplicate_id: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Check a chunk, registering it as canonical if it is new.
+
+        Args:
+            text: Chunk text
+            chunk_id: Identifier the chunk would be indexed under
+            document_id: Document the chunk belongs to
+            duplicate_id: Key for the link if the chunk is a duplicate
+                (default: chunk_id)
+
+        Returns:
+            Canonical chunk id if the chunk is a near-duplicate, else None
+        """
+        self.stats.chunks_seen += 1
+        signature = self.signature(text)
+        canonical = self.find(signature)
+
+        if canonical is None:
+            self.add(signature, chunk_id, document_id)
+            return None
+
+        self.stats.duplicates += 1
+        self.stats.text_bytes_saved += len(text.encode("utf-8"))
+        if self.record_links:
+            duplicate_id = duplicate_id or chunk_id
+            self.links[duplicate_id] = canonical
+            if document_id is not None:
+                self._link_document(duplicate_id, document_id)
+        return canonical
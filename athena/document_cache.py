@@ -0,0 +1,306 @@
+"""
+Processed-document cache for Athena ingestion.
+
+Byte-bounded in-memory LRU for hot documents in front of a small on-disk
+checksum -> document-id index, so deduplication survives restarts without
+keeping every ingested document in memory.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+# Read size for checksumming; large blocks keep syscalls and update() calls low
+CHECKSUM_BLOCK_SIZE = 1024 * 1024
+
+# Files modified this recently are always rehashed: a rewrite in the same
+# timestamp tick as the stat would leave (size, mtime, ctime) unchanged
+RACY_WINDOW_NS = 2_000_000_000
+
+# Stored checksums kept; the least recently written are pruned beyond this
+MAX_CHECKSUMS = 100_000
+
+
+def file_checksum(file_path: Path, block_size: int = CHECKSUM_BLOCK_SIZE) -> str:
+    """
+    SHA-256 of a file, read in large blocks into a reused buffer.
+
+    Args:
+        file_path: File to hash
+        block_size: Read size in bytes
+
+    Returns:
+        Hex digest
+    """
+    sha256_hash = hashlib.sha256()
+    buffer = bytearray(block_size)
+    view = memoryview(buffer)
+
+    with open(file_path, "rb", buffering=0) as f:
+        while True:
+            read = f.readinto(buffer)
+            if not read:
+                break
+            sha256_hash.update(view[:read])
+
+    return sha256_hash.hexdigest()
+
+
+@dataclass
+class IndexEntry:
+    """On-disk record of a processed document (no content)."""
+
+    checksum: str
+    document_id: str
+    metadata_json: str
+
+
+class ProcessedDocumentCache:
+    """
+    Two-level processed-document cache.
+
+    - Hot level: in-memory LRU bounded by estimated bytes
+    - Cold level: SQLite index of checksum -> document id and metadata,
+      plus a (path, inode, size, mtime_ns, ctime_ns) -> checksum memo
+      that lets unchanged files skip hashing entirely, bounded to the
+      max_checksums most recently written paths
+    """
+
+    def __init__(
+        self,
+        index_path: Optional[Path] = None,
+        max_bytes: int = 64 * 1024 * 1024,
+        sizeof: Optional[Callable[[Any], int]] = None,
+        max_checksums: int = MAX_CHECKSUMS,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            index_path: SQLite index location (None keeps the cache in memory only)
+            max_bytes: Budget for hot documents
+            sizeof: Estimates the in-memory size of a cached value
+            max_checksums: Paths kept in the checksum memo
+        """
+        self.index_path = Path(index_path) if index_path else None
+        self.max_bytes = max_bytes
+        self.max_checksums = max_checksums
+        self._sizeof = sizeof or (lambda value: len(str(value)))
+
+        self._hot: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        self.hot_bytes = 0
+        self.hits = 0
+        self.cold_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if self.index_path:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.index_path, timeout=30.0)
+
+    def _ensure_schema(self) -> None:
+        """Create index tables if not exists."""
+        conn = self._connect()
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS processed_documents (
+                    checksum TEXT PRIMARY KEY,
+                    document_id TEXT NOT NULL,
+                    metadata TEXT NOT NULL
+                )
+            """)
+            # The memo is disposable; drop one from before ino/ctime were recorded
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(file_checksums)")}
+            if columns and "ctime_ns" not in columns:
+                conn.execute("DROP TABLE file_checksums")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS file_checksums (
+                    path TEXT PRIMARY KEY,
+                    ino INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    ctime_ns INTEGER NOT NULL,
+                    checksum TEXT NOT NULL
+                )
+            """)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def checksum(self, file_path: Path) -> str:
+        """
+        Checksum a file, reusing the stored value when its stat is unchanged.
+
+        The stored value is keyed on inode, size, mtime and ctime; files
+        modified within RACY_WINDOW_NS are always rehashed and not stored.
+
+        Args:
+            file_path: File to checksum
+
+        Returns:
+            SHA-256 hex digest
+        """
+        if not self.index_path:
+            return file_checksum(file_path)
+
+        path = str(Path(file_path).resolve())
+        stat = os.stat(path)
+        signature = (stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns)
+        racy = max(stat.st_mtime_ns, stat.st_ctime_ns) >= time.time_ns() - RACY_WINDOW_NS
+
+        conn = self._connect()
+        try:
+            if not racy:
+                row = conn.execute(
+                    """
+                    SELECT ino, size, mtime_ns, ctime_ns, checksum
+                    FROM file_checksums WHERE path = ?
+                    """,
+                    (path,)
+                ).fetchone()
+                if row and tuple(row[:4]) == signature:
+                    return row[4]
+
+            checksum = file_checksum(file_path)
+            if racy:
+                conn.execute("DELETE FROM file_checksums WHERE path = ?", (path,))
+            else:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO file_checksums
+                        (path, ino, size, mtime_ns, ctime_ns, checksum)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (path, *signature, checksum)
+                )
+                # REPLACE gives the row a new rowid, so rowids follow write order
+                conn.execute(
+                    """
+                    DELETE FROM file_checksums
+                    WHERE rowid <= (SELECT MAX(rowid) FROM file_checksums) - ?
+                    """,
+                    (self.max_checksums,)
+                )
+            conn.commit()
+            return checksum
+        finally:
+            conn.close()
+
+    def forget(self, file_path: Path) -> None:
+        """Drop the stored checksum for a path (e.g. a deleted temp file)."""
+        if not self.index_path:
+            return
+
+        conn = self._connect()
+        try:
+            conn.execute(
+                "DELETE FROM file_checksums WHERE path = ?",
+                (str(Path(file_path).resolve()),)
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get(self, checksum: str) -> Optional[Any]:
+        """Return a hot document, marking it most recently used."""
+        entry = self._hot.get(checksum)
+        if entry is None:
+            return None
+        self._hot.move_to_end(checksum)
+        self.hits += 1
+        return entry[0]
+
+    def lookup(self, checksum: str) -> Optional[IndexEntry]:
+        """Return the on-disk record for a checksum, if any."""
+        if not self.index_path:
+            self.misses += 1
+            return None
+
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT document_id, metadata FROM processed_documents WHERE checksum = ?",
+                (checksum,)
+            ).fetchone()
+        finally:
+            conn.close()
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.cold_hits += 1
+        return IndexEntry(checksum=checksum, document_id=row[0], metadata_json=row[1])
+
+    def put(self, checksum: str, document_id: str, value: Any, metadata_json: str = "{}") -> None:
+        """
+        Record a processed document.
+
+        Args:
+            checksum: File checksum
+            document_id: Document identifier
+            value: Full document kept in the hot level
+            metadata_json: Serialized metadata persisted in the index
+        """
+        if self.index_path:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO processed_documents (checksum, document_id, metadata)
+                    VALUES (?, ?, ?)
+                    """,
+                    (checksum, document_id, metadata_json)
+                )
+                conn.commit()
+            finally:
+                conn.close()
+
+        size = self._sizeof(value)
+        if size > self.max_bytes:
+            # Too large to keep hot; the index entry still dedups it
+            return
+
+        if checksum in self._hot:
+            self.hot_bytes -= self._hot.pop(checksum)[1]
+
+        self._hot[checksum] = (value, size)
+        self.hot_bytes += size
+
+        while self.hot_bytes > self.max_bytes:
+            _, (_, evicted_size) = self._hot.popitem(last=False)
+            self.hot_bytes -= evicted_size
+            self.evictions += 1
+
+    def clear_hot(self) -> None:
+        """Drop hot documents; the on-disk index is kept."""
+        self._hot.clear()
+        self.hot_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._hot)
+
+    def __contains__(self, checksum: str) -> bool:
+        return checksum in self._hot
+
+    def get_stats(self) -> dict:
+        """Get cache statistics."""
+        return {
+            "hot_documents": len(self._hot),
+            "hot_bytes": self.hot_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "cold_hits": self.cold_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "persistent": self.index_path is not None,
+        }
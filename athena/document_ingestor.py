@@ -10,7 +10,6 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, BinaryIO, Dict, List, Optional, Tuple
-from uuid import uuid4
 
 import pdfplumber
 import pytesseract
@@ -22,20 +21,10 @@ from python_docx import Document as DocxDocument
 from ..core.kernel import IService, ServiceInfo, ServiceStatus
 from ..shared.logging.structured_logger import StructuredLogger
 from ..shared.schemas.knowledge import DocumentMetadata, DocumentType
-
-
-class DocumentChunk(BaseModel):
-    """Document chunk with metadata."""
-    chunk_id: str = Field(default_factory=lambda: str(uuid4()))
-    document_id: str
-    content: str
-    chunk_index: int
-    start_position: int
-    end_position: int
-    page_number: Optional[int] = None
-    metadata: Dict[str, Any] = Field(default_factory=dict)
-    embedding: Optional[List[float]] = None
-    checksum: str
+from .chunker import DocumentChunk
+from .config import AthenaConfig
+from .document_cache import ProcessedDocumentCache
+from .ocr_engine import OCREngine, OCRSettings
 
 
 class IngestedDocument(BaseModel):
@@ -47,6 +36,17 @@ class IngestedDocument(BaseModel):
     metadata: DocumentMetadata
     checksum: str
     processing_time_ms: float
+    is_duplicate: bool = False  # Checksum was already ingested
+
+
+def _estimate_document_size(document: IngestedDocument) -> int:
+    """Rough in-memory footprint of an ingested document, in bytes."""
+    size = 1024 + len(document.content)
+    for chunk in document.chunks:
+        size += 256 + len(chunk.content)
+        if chunk.embedding:
+            size += 8 * len(chunk.embedding)
+    return size
 
 
 class IDocumentParser(ABC):
@@ -66,9 +66,18 @@ class IDocumentParser(ABC):
 class PDFParser(IDocumentParser):
     """PDF document parser with OCR fallback."""
     
-    def __init__(self, enable_ocr: bool = True, ocr_lang: str = "eng"):
+    def __init__(
+        self,
+        enable_ocr: bool = True,
+        ocr_lang: str = "eng",
+        ocr_engine: Optional[OCREngine] = None,
+        ocr_cache_path: Optional[Path] = None
+    ):
         self.enable_ocr = enable_ocr
         self.ocr_lang = ocr_lang
+        self.ocr_engine = ocr_engine or OCREngine(
+            OCRSettings(lang=ocr_lang, cache_path=ocr_cache_path)
+        )
         self.logger = StructuredLogger(__name__)
     
     def supports(self, file_extension: str) -> bool:
@@ -76,7 +85,6 @@ class PDFParser(IDocumentParser):
     
     async def parse(self, file_path: Path) -> Tuple[str, Dict[str, Any]]:
         """Parse PDF file."""
-        content_parts = []
         metadata = {
             "pages": 0,
             "has_text": False,
@@ -84,26 +92,33 @@ class PDFParser(IDocumentParser):
         }
         
         try:
-            # Try to extract text normally
+            # Single open: text layer and document info together
             with pdfplumber.open(file_path) as pdf:
                 metadata["pages"] = len(pdf.pages)
+                page_texts = [page.extract_text() or "" for page in pdf.pages]
+                doc_info = pdf.metadata or {}
+            
+            ocr_pages = [
+                page_num
+                for page_num, text in enumerate(page_texts, 1)
+                if self.ocr_engine.needs_ocr(text)
+            ]
+            metadata["has_text"] = len(ocr_pages) < len(page_texts)
+            
+            if self.enable_ocr and ocr_pages:
+                # Scanned pages go to the parallel OCR engine
+                ocr_results = await self.ocr_engine.ocr_pages(file_path, ocr_pages)
+                for page_num, result in ocr_results.items():
+                    if result.text:
+                        page_texts[page_num - 1] = result.text
+                        metadata["ocr_used"] = True
                 
-                for page_num, page in enumerate(pdf.pages, 1):
-                    text = page.extract_text()
-                    
-                    if text and len(text.strip()) > 50:
-                        content_parts.append(text)
-                        metadata["has_text"] = True
-                    elif self.enable_ocr:
-                        # Use OCR for scanned PDFs
-                        image = page.to_image(resolution=300)
-                        ocr_text = pytesseract.image_to_string(
-                            image.original,
-                            lang=self.ocr_lang
-                        )
-                        if ocr_text:
-                            content_parts.append(ocr_text)
-                            metadata["ocr_used"] = True
+                metadata["ocr_pages"] = len(ocr_results)
+                metadata["ocr_cached_pages"] = sum(
+                    1 for r in ocr_results.values() if r.cached
+                )
+            
+            content_parts = [text for text in page_texts if text.strip()]
             
             # Fallback to pypdf if pdfplumber fails
             if not content_parts:
@@ -118,20 +133,16 @@ class PDFParser(IDocumentParser):
             
             content = "\n\n".join(content_parts)
             
-            # Extract metadata from PDF
-            with open(file_path, 'rb') as f:
-                reader = PdfReader(f)
-                doc_info = reader.metadata
-                if doc_info:
-                    metadata.update({
-                        "author": doc_info.author,
-                        "creator": doc_info.creator,
-                        "producer": doc_info.producer,
-                        "subject": doc_info.subject,
-                        "title": doc_info.title,
-                        "creation_date": str(doc_info.get('/CreationDate', '')),
-                        "modification_date": str(doc_info.get('/ModDate', ''))
-                    })
+            if doc_info:
+                metadata.update({
+                    "author": doc_info.get("Author"),
+                    "creator": doc_info.get("Creator"),
+                    "producer": doc_info.get("Producer"),
+                    "subject": doc_info.get("Subject"),
+                    "title": doc_info.get("Title"),
+                    "creation_date": str(doc_info.get("CreationDate", "")),
+                    "modification_date": str(doc_info.get("ModDate", ""))
+                })
             
             return content, metadata
             
@@ -308,14 +319,38 @@ class DocumentIngestor(IService):
     - OCR for scanned documents
     - Encoding detection
     - Checksum verification
+    - Bounded, persistent deduplication cache
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        cache_index_path: Optional[Path] = None,
+        cache_max_bytes: int = 64 * 1024 * 1024,
+        config: Optional[AthenaConfig] = None,
+        ocr_cache_path: Optional[Path] = None
+    ):
+        """
+        Initialize ingestor.
+        
+        Args:
+            cache_index_path: Processed-document index location (None:
+                in memory only, unless config)
+            cache_max_bytes: Budget for hot documents
+            config: Athena configuration; supplies cache locations under
+                its index directory when they are not given explicitly
+            ocr_cache_path: Persistent OCR cache (None: none, unless config)
+        """
         self.logger = StructuredLogger(__name__)
         
+        if config is not None:
+            if cache_index_path is None:
+                cache_index_path = config.processed_index_path
+            if ocr_cache_path is None:
+                ocr_cache_path = config.ocr_cache_path
+        
         # Register parsers
         self.parsers: List[IDocumentParser] = [
-            PDFParser(),
+            PDFParser(ocr_cache_path=ocr_cache_path),
             DOCXParser(),
             ImageParser(),
             TextParser()
@@ -328,8 +363,12 @@ class DocumentIngestor(IService):
             dependencies=[]
         )
         
-        # Cache for processed files
-        self.processed_cache: Dict[str, IngestedDocument] = {}
+        # Hot documents in a byte-bounded LRU, checksums indexed on disk
+        self.processed_cache = ProcessedDocumentCache(
+            index_path=cache_index_path,
+            max_bytes=cache_max_bytes,
+            sizeof=_estimate_document_size
+        )
         
         self.logger.info("Document ingestor initialized")
     
@@ -341,7 +380,7 @@ class DocumentIngestor(IService):
     async def stop(self) -> None:
         """Stop ingestor service."""
         self.service_info.status = ServiceStatus.STOPPED
-        self.processed_cache.clear()
+        self.processed_cache.clear_hot()
         self.logger.info("Document ingestor stopped")
     
     def get_service_info(self) -> ServiceInfo:
@@ -366,15 +405,36 @@ class DocumentIngestor(IService):
         return None
     
     def _calculate_checksum(self, file_path: Path) -> str:
-        """Calculate SHA-256 checksum of file."""
-        sha256_hash = hashlib.sha256()
+        """Calculate SHA-256 checksum of file (skipped if its stat is unchanged)."""
+        return self.processed_cache.checksum(file_path)
+    
+    def _lookup_processed(self, checksum: str) -> Optional[IngestedDocument]:
+        """Check hot cache, then the persistent index, for a known checksum."""
+        cached = self.processed_cache.get(checksum)
+        if cached is not None:
+            self.logger.debug("Using cached document", checksum=checksum[:16])
+            return cached.model_copy(update={"is_duplicate": True})
         
-        with open(file_path, "rb") as f:
-            # Read file in chunks to handle large files
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
+        entry = self.processed_cache.lookup(checksum)
+        if entry is None:
+            return None
         
-        return sha256_hash.hexdigest()
+        # Ingested by an earlier process; content is not retained
+        self.logger.debug(
+            "Document already ingested",
+            checksum=checksum[:16],
+            document_id=entry.document_id
+        )
+        metadata = DocumentMetadata.model_validate_json(entry.metadata_json)
+        return IngestedDocument(
+            document_id=entry.document_id,
+            title=metadata.title,
+            content="",
+            metadata=metadata,
+            checksum=checksum,
+            processing_time_ms=0.0,
+            is_duplicate=True
+        )
     
     def _extract_title(self, content: str, metadata: Dict[str, Any]) -> str:
         """Extract or generate document title."""
@@ -420,9 +480,9 @@ class DocumentIngestor(IService):
         checksum = self._calculate_checksum(file_path)
         
         # Check cache
-        if checksum in self.processed_cache:
-            self.logger.debug("Using cached document", checksum=checksum[:16])
-            return self.processed_cache[checksum].copy()
+        cached = self._lookup_processed(checksum)
+        if cached is not None:
+            return cached
         
         # Get file extension and parser
         file_extension = file_path.suffix.lower()
@@ -485,7 +545,12 @@ class DocumentIngestor(IService):
         result.processing_time_ms = (end_time - start_time) * 1000
         
         # Cache result
-        self.processed_cache[checksum] = result
+        self.processed_cache.put(
+            checksum,
+            document_id,
+            result,
+            metadata_json=metadata.model_dump_json()
+        )
         
         self.logger.info(
             "Document ingested",
@@ -509,6 +574,11 @@ class DocumentIngestor(IService):
         
         Useful for API uploads.
         """
+        # Re-uploads short-circuit before touching disk
+        cached = self._lookup_processed(hashlib.sha256(file_bytes).hexdigest())
+        if cached is not None:
+            return cached
+        
         # Create temporary file
         with tempfile.NamedTemporaryFile(
             suffix=Path(file_name).suffix,
@@ -522,6 +592,7 @@ class DocumentIngestor(IService):
             return result
         finally:
             # Cleanup temporary file
+            self.processed_cache.forget(tmp_path)
             tmp_path.unlink(missing_ok=True)
     
     async def batch_ingest(
@@ -4,13 +4,15 @@ Manual document ingestion for Athena.
 Explicit user command only. No background watchers.
 """
 
+import json
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
-from .adapters import extract_text_from_pdf, scan_pdf_directory
+from .adapters import iter_page_segments, iter_pdf_pages, page_for_offset, scan_pdf_directory
 from .config import AthenaConfig
 from .retriever import AthenaRetriever
-from .utils import chunk_text, clean_text
+from .utils import clean_text, iter_chunks
 
 
 class AthenaIngestor:
@@ -19,6 +21,10 @@ class AthenaIngestor:
     
     Designed for explicit user commands only.
     No background watchers, no automatic ingestion.
+    
+    PDFs are processed as a stream: pages are extracted one at a time,
+    chunked with absolute offsets, and indexed in bounded batches, so
+    memory stays flat regardless of document length.
     """
 
     def __init__(self, config: AthenaConfig, retriever: AthenaRetriever):
@@ -32,11 +38,25 @@ class AthenaIngestor:
         self.config = config
         self.retriever = retriever
 
+        # Near-duplicate detector shared across ingests (None when off)
+        self.dedup = None
+        if config.dedup_mode != "off":
+            from .dedup import NearDuplicateDetector
+
+            self.dedup = NearDuplicateDetector(
+                threshold=config.dedup_threshold,
+                record_links=config.dedup_mode == "link",
+            )
+            self.dedup.load(config.dedup_index_path)
+            if self.dedup.record_links:
+                self._load_links()
+
     def ingest_pdf(
         self,
         pdf_path: Path,
         subject: Optional[str] = None,
         module: Optional[str] = None,
+        persist: bool = True,
     ) -> dict:
         """
         Ingest a single PDF file.
@@ -45,6 +65,7 @@ class AthenaIngestor:
             pdf_path: Path to PDF
             subject: Optional subject category
             module: Optional module category
+            persist: Write the index to disk afterwards
         
         Returns:
             Dict with ingestion stats
@@ -54,52 +75,186 @@ class AthenaIngestor:
             return {"success": False, "error": f"File not found: {pdf_path}"}
 
         try:
-            # Extract text
-            text, metadata = extract_text_from_pdf(pdf_path)
-            text = clean_text(text)
-
-            if not text:
-                return {"success": False, "error": "No text extracted from PDF"}
-
-            # Chunk text
-            chunks = chunk_text(
-                text,
-                chunk_size=self.config.chunk_size,
-                chunk_overlap=self.config.chunk_overlap,
+            return self._ingest_segments(
+                iter_pdf_pages(pdf_path, transform=clean_text),
+                pdf_path.name,
+                subject,
+                module,
+                empty_error="No text extracted from PDF",
+                persist=persist,
             )
+        except Exception as e:
+            return {"success": False, "error": str(e)}
 
-            # Extract page numbers from metadata
-            page_breaks = metadata.get("page_breaks", {})
-
-            # Prepare documents with page numbers
-            documents = []
-            for chunk in chunks:
-                # Find which page this chunk is on
-                page_num = 1
-                for pos, pnum in sorted(page_breaks.items()):
-                    if text.find(chunk) >= pos:
-                        page_num = pnum
-
-                documents.append({"text": chunk, "page_number": page_num})
-
-            # Add to index
-            self.retriever.add_documents(
-                documents,
-                file_name=pdf_path.name,
-                subject=subject or "uncategorized",
-                module=module or "general",
+    def ingest_pages(
+        self,
+        pages: Iterable[str],
+        file_name: str,
+        subject: Optional[str] = None,
+        module: Optional[str] = None,
+        persist: bool = True,
+    ) -> dict:
+        """
+        Ingest already-extracted page texts through the same pipeline as PDFs.
+        
+        Args:
+            pages: Page texts in order
+            file_name: Name the chunks are indexed under
+            subject: Optional subject category
+            module: Optional module category
+            persist: Write the index to disk afterwards
+        
+        Returns:
+            Dict with ingestion stats
+        """
+        try:
+            return self._ingest_segments(
+                iter_page_segments(pages, transform=clean_text),
+                file_name,
+                subject,
+                module,
+                empty_error="No text to ingest",
+                persist=persist,
             )
-
-            return {
-                "success": True,
-                "file_name": pdf_path.name,
-                "chunks_created": len(documents),
-                "text_length": len(text),
-            }
-
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    def _ingest_segments(
+        self,
+        segments: Iterable[tuple[int, int, str]],
+        file_name: str,
+        subject: Optional[str],
+        module: Optional[str],
+        empty_error: str,
+        persist: bool,
+    ) -> dict:
+        """Chunk, dedup and index a stream of (page, offset, segment) tuples."""
+        # Page offsets in the cleaned text stream, filled while streaming
+        page_offsets: list[int] = []
+        page_numbers: list[int] = []
+        stats = {"text_length": 0}
+
+        def page_segments():
+            for page_num, offset, segment in segments:
+                if segment:
+                    page_offsets.append(offset)
+                    page_numbers.append(page_num)
+                stats["text_length"] = offset + len(segment)
+                yield segment
+
+        # Stream pages -> chunks -> bounded index batches
+        batch = []
+        chunks_created = 0
+        duplicates = 0
+
+        if self.dedup is not None:
+            # A re-ingested document replaces its previous chunks rather
+            # than duplicating them
+            self.dedup.forget(file_name)
+
+        for start, chunk in iter_chunks(
+            page_segments(),
+            chunk_size=self.config.chunk_size,
+            chunk_overlap=self.config.chunk_overlap,
+        ):
+            if self.dedup is not None:
+                chunk_id = f"{file_name}_{chunks_created + len(batch)}"
+                # Skipped chunks get no index id; link them by offset
+                duplicate_id = f"{file_name}@{start}"
+                if self.dedup.check(chunk, chunk_id, file_name, duplicate_id) is not None:
+                    # Near-duplicate: no embedding call, no index entry
+                    duplicates += 1
+                    continue
+
+            page_num = page_for_offset(page_offsets, page_numbers, start)
+            batch.append({"text": chunk, "page_number": page_num})
+
+            if len(batch) >= self.config.ingest_batch_size:
+                self._flush_batch(batch, file_name, subject, module, chunks_created)
+                chunks_created += len(batch)
+                batch = []
+
+        if batch:
+            self._flush_batch(batch, file_name, subject, module, chunks_created)
+            chunks_created += len(batch)
+
+        if not chunks_created and not duplicates:
+            return {"success": False, "error": empty_error}
+
+        if persist:
+            self._persist()
+
+        result = {
+            "success": True,
+            "file_name": file_name,
+            "chunks_created": chunks_created,
+            "text_length": stats["text_length"],
+        }
+        if self.dedup is not None:
+            result["duplicates_skipped"] = duplicates
+        return result
+
+    def _persist(self) -> None:
+        """Write the index, dedup signatures and (link mode) duplicate links to disk."""
+        self.retriever.persist()
+        if self.dedup is not None:
+            self.dedup.save(self.config.dedup_index_path)
+            if self.dedup.record_links:
+                self._save_links()
+
+    def _load_links(self) -> None:
+        """Restore duplicate links recorded by earlier ingests."""
+        path = self.config.dedup_links_path
+        if not path.exists():
+            return
+        with path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        self.dedup.load_links(data.get("links", {}), data.get("documents", {}))
+
+    def _save_links(self) -> None:
+        """Persist duplicate chunk -> canonical chunk links (atomic replace)."""
+        path = self.config.dedup_links_path
+        tmp_path = path.with_name(path.name + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(
+                {"links": self.dedup.links, "documents": self.dedup.link_documents},
+                f,
+                indent=2,
+                sort_keys=True,
+            )
+        os.replace(tmp_path, path)
+
+    def canonical_for(self, duplicate_id: str) -> Optional[str]:
+        """
+        Indexed chunk a skipped near-duplicate was linked to (link mode).
+
+        Args:
+            duplicate_id: "<file_name>@<offset>" of the skipped chunk
+
+        Returns:
+            Canonical chunk id, or None if not a recorded duplicate
+        """
+        if self.dedup is None:
+            return None
+        return self.dedup.links.get(duplicate_id)
+
+    def _flush_batch(
+        self,
+        documents: list[dict],
+        file_name: str,
+        subject: Optional[str],
+        module: Optional[str],
+        start_index: int,
+    ) -> None:
+        """Send one bounded batch of chunks to the index for embedding."""
+        self.retriever.add_documents(
+            documents,
+            file_name=file_name,
+            subject=subject or "uncategorized",
+            module=module or "general",
+            start_index=start_index,
+        )
+
     def ingest_directory(
         self,
         directory: Optional[Path] = None,
@@ -136,23 +291,29 @@ class AthenaIngestor:
             }
 
         total_chunks = 0
+        total_duplicates = 0
         successful = 0
         failed = []
 
         for pdf_file in pdf_files:
-            result = self.ingest_pdf(pdf_file, subject=subject, module=module)
+            result = self.ingest_pdf(pdf_file, subject=subject, module=module, persist=False)
 
             if result["success"]:
                 successful += 1
                 total_chunks += result.get("chunks_created", 0)
+                total_duplicates += result.get("duplicates_skipped", 0)
             else:
                 failed.append({"file": pdf_file.name, "error": result.get("error")})
 
+        if successful:
+            self._persist()
+
         return {
             "success": True,
             "files_found": len(pdf_files),
             "files_processed": successful,
             "total_chunks": total_chunks,
+            "total_duplicates_skipped": total_duplicates,
             "failed": failed if failed else None,
         }
 
@@ -2,19 +2,33 @@
 Athena Knowledge Store - Minimal, synchronous, read-only lookup.
 
 Design goals for v0.1:
-- Plain JSON storage
+- Plain JSON storage (append-only JSON Lines log)
 - No embeddings, no ranking, no inference
 - Human-readable and inspectable
+
+Storage: one JSON object per line. Adds append a single line; the log is
+rewritten only on compaction (legacy JSON-array files, or when skipped
+records pile up).
+
+Lookup: an in-memory token inverted index and trigram index narrow
+substring queries to candidate items before the exact check, so search
+does not scan every item. Indexes are brought up to date incrementally
+on the first search after items are loaded or added.
 """
 from __future__ import annotations
 
 import json
+import os
+import re
+import threading
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterable, List, Optional, Set
 from uuid import uuid4
 
+_TOKEN_RE = re.compile(r"\w+")
+
 
 @dataclass
 class KnowledgeItem:
@@ -25,42 +39,171 @@ class KnowledgeItem:
     timestamp: str = datetime.now().isoformat()
 
 
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
 class KnowledgeStore:
-    """Minimal read-only knowledge store backed by a JSON file."""
+    """Minimal read-only knowledge store backed by an append-only JSONL file."""
+
+    # Compact once skipped (invalid/duplicate) records exceed this share of the log
+    COMPACTION_RATIO = 0.5
+    COMPACTION_MIN_DEAD = 100
 
     def __init__(self, store_path: str = "./data/knowledge.json"):
         self.store_path = Path(store_path)
         self.store_path.parent.mkdir(parents=True, exist_ok=True)
         self._items: List[KnowledgeItem] = []
+        self._ids: Set[str] = set()
+        self._token_index: Dict[str, Set[int]] = {}
+        self._trigram_index: Dict[str, Set[int]] = {}
+        self._indexed = 0  # Items [0, _indexed) are in the indexes
+        self._index_lock = threading.Lock()  # Searches may run on worker threads
+        self._dead_records = 0
+        self._legacy_format = False
         self._load()
 
     def _load(self) -> None:
+        self._reset()
         if not self.store_path.exists():
-            self._items = []
             return
         try:
             with self.store_path.open("r", encoding="utf-8") as f:
-                raw = json.load(f)
-                self._items = [KnowledgeItem(**item) for item in raw if self._is_valid_item(item)]
+                first = f.read(1)
+                while first and first.isspace():
+                    first = f.read(1)
+                f.seek(0)
+
+                if first == "[":
+                    # v0.1 format: a single JSON array
+                    self._legacy_format = True
+                    records: Iterable = json.load(f)
+                else:
+                    records = self._read_lines(f)
+
+                for raw in records:
+                    if self._is_valid_item(raw) and raw["id"] not in self._ids:
+                        self._track_item(KnowledgeItem(**raw))
+                    else:
+                        self._dead_records += 1
         except Exception:
             # Fail closed: if load fails, operate with empty store
-            self._items = []
+            self._reset()
+
+    def _reset(self) -> None:
+        self._items = []
+        self._ids = set()
+        self._token_index = {}
+        self._trigram_index = {}
+        self._indexed = 0
+        self._dead_records = 0
+        self._legacy_format = False
+
+    @staticmethod
+    def _read_lines(f) -> Iterable:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                # Torn or corrupt line: skip it, compaction drops it later
+                yield None
 
     @staticmethod
     def _is_valid_item(item: dict) -> bool:
         required_keys = {"id", "title", "content", "source", "timestamp"}
         return isinstance(item, dict) and required_keys.issubset(item.keys())
 
+    def _track_item(self, item: KnowledgeItem) -> None:
+        self._items.append(item)
+        self._ids.add(item.id)
+
+    def _ensure_indexed(self) -> None:
+        """Bring the token and trigram indexes up to date with _items."""
+        if self._indexed == len(self._items):
+            return
+        with self._index_lock:
+            self._index_new_items()
+
+    def _index_new_items(self) -> None:
+        for ordinal in range(self._indexed, len(self._items)):
+            item = self._items[ordinal]
+            title = item.title.lower()
+            content = item.content.lower()
+
+            for token in set(_TOKEN_RE.findall(title)) | set(_TOKEN_RE.findall(content)):
+                self._token_index.setdefault(token, set()).add(ordinal)
+            for trigram in _trigrams(title) | _trigrams(content):
+                self._trigram_index.setdefault(trigram, set()).add(ordinal)
+
+        self._indexed = len(self._items)
+
     def add_item(self, title: str, content: str, source: str = "manual_import") -> KnowledgeItem:
         """Append a new knowledge item to disk (utility for manual population)."""
         item = KnowledgeItem(id=str(uuid4()), title=title, content=content, source=source, timestamp=datetime.now().isoformat())
-        self._items.append(item)
-        self._persist()
+        self._track_item(item)
+
+        if self._needs_compaction():
+            self.compact()
+        else:
+            self._append(item)
         return item
 
-    def _persist(self) -> None:
-        with self.store_path.open("w", encoding="utf-8") as f:
-            json.dump([asdict(item) for item in self._items], f, ensure_ascii=True, indent=2)
+    def _append(self, item: KnowledgeItem) -> None:
+        line = (json.dumps(asdict(item), ensure_ascii=True) + "\n").encode("ascii")
+        with self.store_path.open("a+b") as f:
+            # A crash mid-append leaves a line without its newline; end it
+            # so the new record is not glued onto the torn one
+            if f.seek(0, os.SEEK_END):
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    line = b"\n" + line
+            f.write(line)
+
+    def _needs_compaction(self) -> bool:
+        if self._legacy_format:
+            return True
+        return (
+            self._dead_records >= self.COMPACTION_MIN_DEAD
+            and self._dead_records > len(self._items) * self.COMPACTION_RATIO
+        )
+
+    def compact(self) -> None:
+        """Rewrite the log with only live items (atomic replace)."""
+        tmp_path = self.store_path.with_name(self.store_path.name + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            for item in self._items:
+                f.write(json.dumps(asdict(item), ensure_ascii=True) + "\n")
+        os.replace(tmp_path, self.store_path)
+        self._dead_records = 0
+        self._legacy_format = False
+
+    def _candidates(self, query_lower: str) -> Optional[Iterable[int]]:
+        """Item ordinals that may contain query_lower, or None to scan all."""
+        self._ensure_indexed()
+
+        if len(query_lower) >= 3:
+            postings = []
+            for trigram in _trigrams(query_lower):
+                posting = self._trigram_index.get(trigram)
+                if not posting:
+                    return []
+                postings.append(posting)
+            postings.sort(key=len)
+            return sorted(postings[0].intersection(*postings[1:]))
+
+        if _TOKEN_RE.fullmatch(query_lower):
+            # Short word query: occurrences lie inside tokens, so scan the
+            # vocabulary rather than the items
+            matched: Set[int] = set()
+            for token, posting in self._token_index.items():
+                if query_lower in token:
+                    matched |= posting
+            return sorted(matched)
+
+        return None
 
     def search(self, query: str, limit: int = 5) -> List[KnowledgeItem]:
         """Simple keyword search over title or content (case-insensitive)."""
@@ -68,8 +211,13 @@ class KnowledgeStore:
         if not query_lower:
             return []
 
+        candidates = self._candidates(query_lower)
+        if candidates is None:
+            candidates = range(len(self._items))
+
         matches = []
-        for item in self._items:
+        for ordinal in candidates:
+            item = self._items[ordinal]
             if query_lower in item.title.lower() or query_lower in item.content.lower():
                 matches.append(item)
             if len(matches) >= limit:
@@ -0,0 +1,280 @@
+"""
+OCR Engine - Parallel, cached OCR for scanned PDF pages.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+try:
+    import pdfplumber
+except ImportError:
+    pdfplumber = None
+
+try:
+    import pytesseract
+except ImportError:
+    pytesseract = None
+
+
+class OCRSettings(BaseModel):
+    """OCR configuration (picklable, shipped to worker processes)."""
+    lang: str = "eng"
+    base_dpi: int = Field(ge=72, le=1200, default=200)
+    retry_dpi: int = Field(ge=72, le=1200, default=400)
+    min_confidence: float = Field(ge=0.0, le=100.0, default=70.0)
+    min_text_chars: int = 50  # Text layers shorter than this need OCR
+    max_workers: Optional[int] = None  # Defaults to CPU count
+    pages_per_task: int = Field(ge=1, default=4)
+    cache_path: Optional[Path] = None  # None disables the persistent cache
+
+
+class OCRPageResult(BaseModel):
+    """OCR result for a single page."""
+    page_number: int
+    text: str
+    confidence: float  # Mean word confidence, 0-100
+    dpi: int
+    cached: bool = False
+
+
+class OCRCache:
+    """
+    Persistent OCR result cache.
+
+    Keyed by (page image hash, dpi, lang) so re-ingesting the same scan
+    never re-runs tesseract, even across processes.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Worker processes share the file; wait on locks instead of failing
+        return sqlite3.connect(self.db_path, timeout=30.0)
+
+    def _ensure_schema(self) -> None:
+        """Create cache table if not exists."""
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS ocr_cache (
+                    image_hash TEXT NOT NULL,
+                    dpi INTEGER NOT NULL,
+                    lang TEXT NOT NULL,
+                    text TEXT NOT NULL,
+                    confidence REAL NOT NULL,
+                    PRIMARY KEY (image_hash, dpi, lang)
+                )
+            """)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get(self, image_hash: str, dpi: int, lang: str) -> Optional[Tuple[str, float]]:
+        """Return cached (text, confidence) or None."""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                """
+                SELECT text, confidence FROM ocr_cache
+                WHERE image_hash = ? AND dpi = ? AND lang = ?
+                """,
+                (image_hash, dpi, lang)
+            ).fetchone()
+            return (row[0], row[1]) if row else None
+        finally:
+            conn.close()
+
+    def put(self, image_hash: str, dpi: int, lang: str, text: str, confidence: float) -> None:
+        """Store an OCR result."""
+        conn = self._connect()
+        try:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO ocr_cache (image_hash, dpi, lang, text, confidence)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (image_hash, dpi, lang, text, confidence)
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+
+def needs_ocr(page_text: Optional[str], settings: OCRSettings) -> bool:
+    """Check whether a page's text layer is too thin to be useful."""
+    return not page_text or len(page_text.strip()) <= settings.min_text_chars
+
+
+def _hash_image(image: Any) -> str:
+    """Content hash of a rendered page image."""
+    digest = hashlib.sha256()
+    digest.update(f"{image.mode}:{image.size}".encode())
+    digest.update(image.tobytes())
+    return digest.hexdigest()
+
+
+def _render_page(page: Any, dpi: int) -> Any:
+    """Render a pdfplumber page to a PIL image."""
+    return page.to_image(resolution=dpi).original
+
+
+def _run_tesseract(image: Any, lang: str) -> Tuple[str, float]:
+    """
+    OCR an image in a single tesseract pass.
+
+    Returns text rebuilt from word boxes and the mean word confidence.
+    """
+    data = pytesseract.image_to_data(
+        image,
+        lang=lang,
+        output_type=pytesseract.Output.DICT
+    )
+
+    lines: Dict[Tuple[int, int, int], List[str]] = {}
+    confidences = []
+
+    for i, word in enumerate(data["text"]):
+        conf = float(data["conf"][i])
+        if conf < 0 or not word.strip():
+            continue
+        key = (data["block_num"][i], data["par_num"][i], data["line_num"][i])
+        lines.setdefault(key, []).append(word)
+        confidences.append(conf)
+
+    text = "\n".join(" ".join(words) for words in lines.values())
+    confidence = sum(confidences) / len(confidences) if confidences else 0.0
+
+    return text, confidence
+
+
+def _ocr_page(page: Any, page_number: int, settings: OCRSettings, cache: Optional[OCRCache]) -> OCRPageResult:
+    """
+    OCR one page with adaptive DPI.
+
+    Runs at base_dpi first and retries at retry_dpi only when the mean
+    confidence falls below min_confidence. The best attempt wins.
+    """
+    best: Optional[OCRPageResult] = None
+
+    for dpi in (settings.base_dpi, settings.retry_dpi):
+        if best is not None and dpi <= best.dpi:
+            break
+
+        image = _render_page(page, dpi)
+        image_hash = _hash_image(image)
+
+        cached = cache.get(image_hash, dpi, settings.lang) if cache else None
+        if cached is not None:
+            text, confidence = cached
+        else:
+            text, confidence = _run_tesseract(image, settings.lang)
+            if cache:
+                cache.put(image_hash, dpi, settings.lang, text, confidence)
+
+        result = OCRPageResult(
+            page_number=page_number,
+            text=text,
+            confidence=confidence,
+            dpi=dpi,
+            cached=cached is not None
+        )
+
+        if best is None or result.confidence >= best.confidence:
+            best = result
+
+        if best.confidence >= settings.min_confidence:
+            break
+
+    return best
+
+
+def _ocr_page_batch(pdf_path: str, page_numbers: List[int], settings: OCRSettings) -> List[OCRPageResult]:
+    """Worker entry point: OCR a batch of pages, opening the PDF once."""
+    cache = OCRCache(settings.cache_path) if settings.cache_path else None
+
+    with pdfplumber.open(pdf_path) as pdf:
+        return [
+            _ocr_page(pdf.pages[page_number - 1], page_number, settings, cache)
+            for page_number in page_numbers
+        ]
+
+
+class OCREngine:
+    """
+    Page-parallel OCR engine for scanned PDFs.
+
+    Features:
+    - Process pool over pages (tesseract is CPU bound)
+    - Adaptive DPI with high-resolution retry for low-confidence pages
+    - Text-layer check so only pages that need OCR are rendered
+    - Persistent cache keyed by (page image hash, dpi, lang)
+    """
+
+    def __init__(self, settings: Optional[OCRSettings] = None):
+        self.settings = settings or OCRSettings()
+        self.max_workers = self.settings.max_workers or os.cpu_count() or 1
+
+    @property
+    def available(self) -> bool:
+        """Check if OCR dependencies are installed."""
+        return pdfplumber is not None and pytesseract is not None
+
+    def needs_ocr(self, page_text: Optional[str]) -> bool:
+        """Check whether a page must be OCR'd."""
+        return needs_ocr(page_text, self.settings)
+
+    async def ocr_pages(self, pdf_path: Path, page_numbers: List[int]) -> Dict[int, OCRPageResult]:
+        """
+        OCR the given pages of a PDF.
+
+        Args:
+            pdf_path: Path to PDF file
+            page_numbers: 1-based page numbers to OCR
+
+        Returns:
+            Map of page number to OCR result
+        """
+        if not page_numbers:
+            return {}
+
+        if not self.available:
+            raise ImportError(
+                "pdfplumber and pytesseract required for OCR. "
+                "Install with: pip install pdfplumber pytesseract"
+            )
+
+        size = self.settings.pages_per_task
+        batches = [
+            page_numbers[i:i + size]
+            for i in range(0, len(page_numbers), size)
+        ]
+
+        loop = asyncio.get_running_loop()
+
+        if len(batches) == 1 or self.max_workers == 1:
+            # Not worth spawning processes
+            results = await loop.run_in_executor(
+                None, _ocr_page_batch, str(pdf_path), page_numbers, self.settings
+            )
+            return {r.page_number: r for r in results}
+
+        workers = min(self.max_workers, len(batches))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            batch_results = await asyncio.gather(*[
+                loop.run_in_executor(pool, _ocr_page_batch, str(pdf_path), batch, self.settings)
+                for batch in batches
+            ])
+
+        return {r.page_number: r for results in batch_results for r in results}
@@ -1,21 +1,44 @@
 """
 Vector search retriever for Athena.
 
-Wraps ChromaDB for deterministic, read-only search.
+Wraps ChromaDB for deterministic, read-only search, or the in-process
+VectorIndex when config.vector_backend is "local".
+
+With config.shard_by set, the index is split physically into one
+collection/index per subject or module. Scoped queries search a single
+shard; unscoped queries fan out to all shards in parallel and the
+per-shard rankings are heap-merged.
+
+Local indexes are published as immutable, memory-mapped versions.
+Retrievers in other processes (e.g. API workers) map them read-only,
+sharing pages through the OS page cache, and swap to a newer version
+published by an ingest without restarting.
 """
 
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
-try:
-    import chromadb
-    from chromadb.config import Settings
-except ImportError:
-    chromadb = None
+from core.lazy import lazy_import, module_available
 
 from .config import AthenaConfig
 from .models import SourceDocument, QueryResult
+from .shards import DEFAULT_SHARD, ShardCatalog, ShardInfo, merge_ranked
 from .utils import chunk_text, clean_text
+from .vector_index import VectorIndex, current_version
+
+# Importing chromadb costs most of a second; only the Chroma backend needs it
+chromadb = lazy_import("chromadb")
+chromadb_config = lazy_import("chromadb.config")
+chromadb_embeddings = lazy_import("chromadb.utils.embedding_functions")
+
+EmbeddingFunction = Callable[[list[str]], list[list[float]]]
+
+# Below this many chunks, thread handoff costs more than searching serially
+PARALLEL_FANOUT_MIN_CHUNKS = 20_000
 
 
 class AthenaRetriever:
@@ -26,20 +49,38 @@ class AthenaRetriever:
     Deterministic: same query → same results (within index bounds).
     """
 
-    def __init__(self, config: AthenaConfig):
+    def __init__(
+        self,
+        config: AthenaConfig,
+        embedding_function: Optional[EmbeddingFunction] = None,
+    ):
         """
         Initialize retriever with configuration.
         
         Args:
             config: AthenaConfig instance
+            embedding_function: Embeds texts and queries, for either
+                backend (defaults to ChromaDB's local embedding model)
         """
         self.config = config
         self._client = None
-        self._collection = None
         self._doc_metadata = {}
-        self._chromadb_available = chromadb is not None
-        
-        if not self._chromadb_available and config.enabled:
+        self._chromadb_available = module_available("chromadb")
+        self._use_local = config.vector_backend == "local"
+        self._sharded = config.shard_by != "none"
+        self._embedding_function = embedding_function
+
+        # Shard key -> open collection / loaded local index
+        self._catalog = ShardCatalog(config.shard_catalog_path if self._sharded else None)
+        self._collections: dict = {}
+        self._local_indexes: dict[str, VectorIndex] = {}
+        self._dirty_shards: set[str] = set()
+        self._last_refresh = time.monotonic()
+        self._refresh_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        needs_chromadb = not (self._use_local and embedding_function is not None)
+        if needs_chromadb and not self._chromadb_available and config.enabled:
             # Only warn if Athena is actually enabled
             import warnings
             warnings.warn(
@@ -48,27 +89,187 @@ class AthenaRetriever:
             )
 
     def _ensure_client(self):
-        """Lazy-load ChromaDB client."""
-        if not self._chromadb_available:
+        """Lazy-load ChromaDB client and the embedding function."""
+        if not self._sharded:
+            # Single shard at the pre-sharding locations
+            self._catalog.get_or_create(DEFAULT_SHARD)
+
+        if self._use_local:
+            return self._ensure_embedder()
+
+        if not self._chromadb_available or not self._ensure_embedder():
             return False
         
         if self._client is None:
-            if chromadb is None:
-                return False
-                
-            settings = Settings(
+            settings = chromadb_config.Settings(
                 chroma_db_impl="duckdb+parquet",
                 persist_directory=str(self.config.chroma_db_path),
                 anonymized_telemetry=False,
             )
             self._client = chromadb.Client(settings)
-            self._collection = self._client.get_or_create_collection(
-                name=self.config.collection_name,
-                metadata={"hnsw:space": "cosine"},
-            )
         
         return True
 
+    def _ensure_embedder(self) -> bool:
+        """Lazy-load the embedding function."""
+        if self._embedding_function is None:
+            if not self._chromadb_available:
+                return False
+            self._embedding_function = chromadb_embeddings.DefaultEmbeddingFunction()
+
+        return True
+
+    def _shard_key(self, subject: str, module: str) -> str:
+        """Shard a chunk belongs to."""
+        if not self._sharded:
+            return DEFAULT_SHARD
+        return subject if self.config.shard_by == "subject" else module
+
+    def _shard_collection(self, info: ShardInfo):
+        """Open (or create) the Chroma collection for a shard."""
+        collection = self._collections.get(info.key)
+        if collection is None:
+            name = self.config.collection_name
+            if info.key != DEFAULT_SHARD:
+                name = f"{name}_{info.name}"
+            # Chroma embeds added documents with the same function the
+            # retriever embeds queries with
+            collection = self._client.get_or_create_collection(
+                name=name,
+                metadata={"hnsw:space": "cosine"},
+                embedding_function=self._embedding_function,
+            )
+            self._collections[info.key] = collection
+        return collection
+
+    def _shard_index_path(self, info: ShardInfo) -> Path:
+        if info.key == DEFAULT_SHARD:
+            return self.config.local_index_path
+        return self.config.local_shards_path / info.name
+
+    def _shard_index(self, info: ShardInfo) -> Optional[VectorIndex]:
+        """Loaded local index for a shard, or None if it has no data yet."""
+        index = self._local_indexes.get(info.key)
+        if index is None:
+            path = self._shard_index_path(info)
+            if current_version(path) is not None:
+                index = self._local_indexes[info.key] = VectorIndex.load(path)
+        return index
+
+    def refresh(self) -> bool:
+        """
+        Swap in index versions published since they were loaded.
+
+        Each shard's index reference is replaced in one assignment, so
+        in-flight queries finish on the version they started with.
+        Shards with unsaved local changes are left alone.
+
+        Returns:
+            True if any shard was swapped or added
+        """
+        if not self._use_local:
+            return False
+
+        with self._refresh_lock:
+            self._last_refresh = time.monotonic()
+            changed = self._catalog.reload()
+
+            for info in list(self._catalog):
+                index = self._local_indexes.get(info.key)
+                if index is None or info.key in self._dirty_shards:
+                    continue
+                path = self._shard_index_path(info)
+                if current_version(path) not in (None, index.version):
+                    self._local_indexes[info.key] = VectorIndex.load(path)
+                    changed = True
+
+            return changed
+
+    def _maybe_refresh(self) -> None:
+        """Refresh at most once per config.index_reload_interval."""
+        if self._refresh_lock.locked():
+            return  # Another thread is already refreshing
+        if time.monotonic() - self._last_refresh >= self.config.index_reload_interval:
+            self.refresh()
+
+    def _shard_count(self, info: ShardInfo) -> int:
+        if self._use_local:
+            index = self._shard_index(info)
+            return len(index) if index is not None else 0
+        return self._shard_collection(info).count()
+
+    def _indexed_count(self) -> int:
+        """Number of indexed chunks across all shards."""
+        return sum(self._shard_count(info) for info in self._catalog)
+
+    def _route(
+        self,
+        subject_filter: Optional[str],
+        module_filter: Optional[str],
+    ) -> tuple[list[ShardInfo], Optional[dict]]:
+        """
+        Pick the shards a query must search and the filter left to apply.
+
+        A filter on the shard field selects one shard and is satisfied by
+        the shard itself; any other filter is applied within shards.
+        """
+        where_filter = {}
+        if subject_filter:
+            where_filter["subject"] = subject_filter
+        if module_filter:
+            where_filter["module"] = module_filter
+
+        if self.config.shard_by in where_filter:
+            info = self._catalog.get(where_filter.pop(self.config.shard_by))
+            shards = [info] if info is not None else []
+        else:
+            shards = list(self._catalog)
+
+        return shards, where_filter or None
+
+    def _search_shard(
+        self,
+        info: ShardInfo,
+        query_vector: list[float],
+        top_k: int,
+        where_filter: Optional[dict],
+    ) -> list[tuple[float, str, dict]]:
+        """Search one shard; returns (similarity, text, metadata), best first."""
+        if self._use_local:
+            index = self._local_indexes.get(info.key)
+            if index is None:
+                return []
+            return [
+                (score, index.documents[row], index.metadatas[row])
+                for row, score in index.search(query_vector, top_k=top_k, where=where_filter)
+            ]
+
+        results = self._shard_collection(info).query(
+            query_embeddings=[query_vector],
+            n_results=top_k,
+            where=where_filter,
+        )
+        return self._ranked_results(results)
+
+    def _fan_out(self, shards: list[ShardInfo], search, total_chunks: int) -> list:
+        """
+        Run search over shards.
+
+        Parallel when there are several shards, more than one worker and
+        enough chunks to amortize the thread handoff; vector search
+        releases the GIL, so shards are scanned concurrently.
+        """
+        workers = min(self.config.shard_workers, os.cpu_count() or 1, len(shards))
+        if workers <= 1 or total_chunks < PARALLEL_FANOUT_MIN_CHUNKS:
+            return [search(info) for info in shards]
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=min(self.config.shard_workers, os.cpu_count() or 1),
+                thread_name_prefix="athena-shard",
+            )
+        return list(self._executor.map(search, shards))
+
     def query(
         self,
         question: str,
@@ -106,7 +307,11 @@ class AthenaRetriever:
                 metadata={"unavailable": True},
             )
 
-        if not self._collection or self._collection.count() == 0:
+        if self._use_local:
+            self._maybe_refresh()
+
+        total_indexed = self._indexed_count()
+        if total_indexed == 0:
             # No documents indexed
             return QueryResult(
                 question=question,
@@ -115,33 +320,33 @@ class AthenaRetriever:
                 metadata={"indexed": False},
             )
 
-        # Build metadata filter
-        where_filter = None
-        if subject_filter or module_filter:
-            where_filter = {}
-            if subject_filter:
-                where_filter["subject"] = subject_filter
-            if module_filter:
-                where_filter["module"] = module_filter
-
         top_k = top_k or self.config.top_k
+        shards, where_filter = self._route(subject_filter, module_filter)
 
         try:
-            results = self._collection.query(
-                query_texts=[question],
-                n_results=top_k,
-                where=where_filter if where_filter else None,
-            )
+            # Embedded once here, not once per shard searched
+            query_vector = None
+            if shards:
+                query_vector = self._embedding_function([question])[0]
 
-            sources = self._format_results(results)
+            def search(info: ShardInfo):
+                return self._search_shard(info, query_vector, top_k, where_filter)
+
+            ranked = self._fan_out(shards, search, total_indexed)
+
+            sources = [
+                self._to_source(text, metadata, similarity)
+                for similarity, text, metadata in merge_ranked(ranked, top_k)
+            ]
 
             return QueryResult(
                 question=question,
                 sources=sources,
-                total_indexed=self._collection.count(),
+                total_indexed=total_indexed,
                 metadata={
                     "searched": True,
                     "filters": {"subject": subject_filter, "module": module_filter},
+                    "shards_searched": len(shards),
                 },
             )
 
@@ -150,7 +355,7 @@ class AthenaRetriever:
             return QueryResult(
                 question=question,
                 sources=[],
-                total_indexed=self._collection.count(),
+                total_indexed=total_indexed,
                 metadata={"error": str(e)},
             )
 
@@ -160,6 +365,7 @@ class AthenaRetriever:
         file_name: str,
         subject: Optional[str] = None,
         module: Optional[str] = None,
+        start_index: int = 0,
     ):
         """
         Add documents to index (explicit ingestion only).
@@ -169,15 +375,17 @@ class AthenaRetriever:
             file_name: Source filename
             subject: Optional subject category
             module: Optional module category
+            start_index: Chunk index of the first document, for batched adds
         """
-        if not self._collection:
-            self._ensure_client()
+        self._ensure_client()
 
+        subject = subject or "uncategorized"
+        module = module or "general"
         ids = []
         texts = []
         metadatas = []
 
-        for idx, doc in enumerate(documents):
+        for idx, doc in enumerate(documents, start=start_index):
             doc_id = f"{file_name}_{idx}"
             ids.append(doc_id)
             texts.append(doc["text"])
@@ -185,13 +393,54 @@ class AthenaRetriever:
                 {
                     "file_name": file_name,
                     "page_number": doc.get("page_number", 0),
-                    "subject": subject or "uncategorized",
-                    "module": module or "general",
+                    "subject": subject,
+                    "module": module,
                     "chunk_index": idx,
+                    "chunk_id": doc_id,
                 }
             )
 
-        self._collection.add(ids=ids, documents=texts, metadatas=metadatas)
+        info = self._catalog.get_or_create(self._shard_key(subject, module))
+
+        if self._use_local:
+            self._add_local(info, ids, texts, metadatas)
+        else:
+            self._shard_collection(info).add(ids=ids, documents=texts, metadatas=metadatas)
+
+        # Re-added ids replace their chunks, so count what the shard holds
+        info.count = self._shard_count(info)
+
+    def _add_local(
+        self,
+        info: ShardInfo,
+        ids: list[str],
+        texts: list[str],
+        metadatas: list[dict],
+    ) -> None:
+        """Embed and add documents to a shard's local index."""
+        vectors = self._embedding_function(texts)
+
+        index = self._shard_index(info)
+        if index is None:
+            index = self._local_indexes[info.key] = VectorIndex(
+                dim=len(vectors[0]),
+                storage=self.config.vector_storage,
+                rescore_factor=self.config.rescore_factor,
+            )
+
+        index.add(ids, vectors, metadatas, documents=texts)
+        self._dirty_shards.add(info.key)
+
+    def persist(self) -> None:
+        """
+        Publish changed local shards and the shard catalog (ChromaDB
+        persists itself).
+        """
+        for key in sorted(self._dirty_shards):
+            info = self._catalog.get(key)
+            self._local_indexes[key].save(self._shard_index_path(info))
+        self._dirty_shards.clear()
+        self._catalog.save()
 
     def get_index_stats(self) -> dict:
         """
@@ -200,7 +449,7 @@ class AthenaRetriever:
         Returns:
             Dict with count, file list, etc.
         """
-        if not self._ensure_client() or not self._collection:
+        if not self._ensure_client():
             return {
                 "total_chunks": 0,
                 "collection_name": self.config.collection_name,
@@ -209,46 +458,56 @@ class AthenaRetriever:
             }
 
         stats = {
-            "total_chunks": self._collection.count(),
+            "total_chunks": self._indexed_count(),
             "collection_name": self.config.collection_name,
             "embedding_model": self.config.embedding_model,
             "available": True,
         }
 
+        if self._use_local:
+            stats["vector_storage"] = self.config.vector_storage
+            stats["index_bytes"] = sum(
+                index.nbytes for index in
+                (self._shard_index(info) for info in self._catalog) if index is not None
+            )
+
+        if self._sharded:
+            stats["shard_by"] = self.config.shard_by
+            stats["shards"] = {info.key: self._shard_count(info) for info in self._catalog}
+
         return stats
 
-    def _format_results(self, results: dict) -> list[SourceDocument]:
+    def _ranked_results(self, results: dict) -> list[tuple[float, str, dict]]:
         """
-        Format ChromaDB results into SourceDocument objects.
+        Convert a ChromaDB query result to (similarity, text, metadata) tuples.
         
         Args:
             results: ChromaDB query result
         
         Returns:
-            List of SourceDocument objects
+            Tuples in ChromaDB's order (best first)
         """
-        sources = []
-
         if not results or not results["documents"]:
-            return sources
+            return []
 
         documents = results.get("documents", [[]])[0]
         metadatas = results.get("metadatas", [[]])[0]
         distances = results.get("distances", [[]])[0]
 
-        for text, metadata, distance in zip(documents, metadatas, distances):
-            # Convert distance to similarity (cosine distance to similarity)
-            similarity = 1 - distance if distance else 0.0
-
-            source = SourceDocument(
-                text=text,
-                file_name=metadata.get("file_name", "unknown"),
-                page_number=metadata.get("page_number"),
-                subject=metadata.get("subject"),
-                module=metadata.get("module"),
-                chunk_id=metadata.get("chunk_id"),
-                similarity_score=similarity,
-            )
-            sources.append(source)
+        # Convert distance to similarity (cosine distance to similarity)
+        return [
+            (1 - distance if distance is not None else 0.0, text, metadata)
+            for text, metadata, distance in zip(documents, metadatas, distances)
+        ]
 
-        return sources
+    def _to_source(self, text: str, metadata: dict, similarity: float) -> SourceDocument:
+        """Build a SourceDocument from a stored chunk."""
+        return SourceDocument(
+            text=text,
+            file_name=metadata.get("file_name", "unknown"),
+            page_number=metadata.get("page_number"),
+            subject=metadata.get("subject"),
+            module=metadata.get("module"),
+            chunk_id=metadata.get("chunk_id"),
+            similarity_score=similarity,
+        )
@@ -0,0 +1,130 @@
+"""
+Shard catalog for Athena's index.
+
+With config.shard_by set to "subject" or "module", each distinct value
+gets its own physical index (a Chroma collection or a local
+VectorIndex). The catalog records which shards exist, so queries can be
+routed to one shard or fanned out to all of them.
+"""
+
+import heapq
+import json
+import os
+import re
+import zlib
+from dataclasses import asdict, dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+SHARD_FIELDS = ("subject", "module")
+
+# Key of the single shard used when sharding is off
+DEFAULT_SHARD = ""
+
+
+def shard_slug(key: str) -> str:
+    """
+    Filesystem- and Chroma-safe name for a shard key.
+
+    Readable prefix plus a CRC32 suffix, so distinct keys that slugify to
+    the same prefix (e.g. "C++" and "C#") stay distinct.
+    """
+    prefix = re.sub(r"[^a-z0-9]+", "_", key.lower()).strip("_")[:32] or "shard"
+    return f"{prefix}_{zlib.crc32(key.encode('utf-8')):08x}"
+
+
+@dataclass
+class ShardInfo:
+    """Catalog entry for one shard."""
+
+    key: str
+    name: str
+    count: int = 0
+
+
+class ShardCatalog:
+    """
+    JSON-backed list of shards.
+
+    Written atomically (temp file + rename) when shards are added and
+    when the index is persisted.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Initialize catalog.
+
+        Args:
+            path: Catalog file (None keeps the catalog in memory only)
+        """
+        self.path = Path(path) if path else None
+        self._shards: dict[str, ShardInfo] = {}
+        self.reload()
+
+    def reload(self) -> bool:
+        """
+        Pick up shards another process added to the catalog file.
+
+        Returns:
+            True if new shards were found
+        """
+        if not self.path or not self.path.exists():
+            return False
+
+        with self.path.open("r", encoding="utf-8") as f:
+            raw_shards = json.load(f).get("shards", [])
+
+        # Copy-on-write: concurrent readers keep iterating the old dict
+        shards = dict(self._shards)
+        for raw in raw_shards:
+            if raw["key"] not in shards:
+                shards[raw["key"]] = ShardInfo(**raw)
+
+        added = len(shards) > len(self._shards)
+        self._shards = shards
+        return added
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._shards
+
+    def __iter__(self) -> Iterator[ShardInfo]:
+        return iter(self._shards.values())
+
+    def __len__(self) -> int:
+        return len(self._shards)
+
+    def get(self, key: str) -> Optional[ShardInfo]:
+        return self._shards.get(key)
+
+    def get_or_create(self, key: str) -> ShardInfo:
+        """Return the shard for a key, registering it if new."""
+        info = self._shards.get(key)
+        if info is None:
+            name = "default" if key == DEFAULT_SHARD else shard_slug(key)
+            info = ShardInfo(key=key, name=name)
+            self._shards = {**self._shards, key: info}
+            self.save()
+        return info
+
+    def save(self) -> None:
+        """Write the catalog to disk."""
+        if not self.path:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump({"shards": [asdict(info) for info in self._shards.values()]}, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+def merge_ranked(results: Iterable[list[tuple]], top_k: int) -> list[tuple]:
+    """
+    Merge per-shard result lists, each sorted best first by item[0].
+
+    A k-way heap merge: only the heads of the shard lists are compared,
+    so the cost is O(top_k * log shards).
+    """
+    merged = heapq.merge(*results, key=lambda item: -item[0])
+    return list(islice(merged, top_k))
@@ -4,7 +4,91 @@ Text chunking utilities for Athena.
 Split documents into overlapping chunks while preserving structure.
 """
 
-from typing import Optional
+from typing import Iterable, Iterator, Optional
+
+
+def _chunk_end(
+    text: str,
+    start: int,
+    chunk_size: int,
+    preserve_paragraphs: bool,
+) -> int:
+    """Find the end of the chunk starting at `start` within `text`."""
+    end = min(start + chunk_size, len(text))
+
+    # If not at end of text and preserve_paragraphs, find paragraph boundary
+    if end < len(text) and preserve_paragraphs:
+        # Look for newline within last 50 chars
+        last_newline = text.rfind("\n", max(start, end - 50), end)
+        if last_newline > start:
+            end = last_newline
+
+    return end
+
+
+def iter_chunks(
+    segments: Iterable[str],
+    chunk_size: int = 512,
+    chunk_overlap: int = 50,
+    preserve_paragraphs: bool = True,
+) -> Iterator[tuple[int, str]]:
+    """
+    Split a stream of text segments into overlapping chunks.
+    
+    Segments are treated as one concatenated document. Only the unconsumed
+    tail of the stream is buffered, so memory stays bounded by the chunk
+    size plus the largest segment.
+    
+    Args:
+        segments: Iterable of text pieces (e.g. pages)
+        chunk_size: Target chunk size (characters)
+        chunk_overlap: Overlap between chunks
+        preserve_paragraphs: Avoid splitting within paragraphs
+    
+    Yields:
+        (start_offset, chunk) tuples; start_offset is the absolute position
+        of the (stripped) chunk in the concatenated text
+    """
+    buffer = ""
+    base = 0  # Absolute offset of buffer[0]
+    start = 0  # Chunk start, relative to buffer
+
+    def emit(chunk_start: int, chunk_end: int) -> Optional[tuple[int, str]]:
+        raw = buffer[chunk_start:chunk_end]
+        chunk = raw.strip()
+        if not chunk:
+            return None
+        return base + chunk_start + len(raw) - len(raw.lstrip()), chunk
+
+    for segment in segments:
+        if not segment:
+            continue
+        buffer = buffer[start:] + segment
+        base += start
+        start = 0
+
+        # A chunk is final once text beyond its window has arrived
+        while len(buffer) - start > chunk_size:
+            end = _chunk_end(buffer, start, chunk_size, preserve_paragraphs)
+            item = emit(start, end)
+            if item:
+                yield item
+            start = max(end - chunk_overlap, start + 1)
+
+    if base + len(buffer) < chunk_size:
+        # Short documents are returned whole, unstripped
+        if buffer:
+            yield 0, buffer
+        return
+
+    while start < len(buffer):
+        end = _chunk_end(buffer, start, chunk_size, preserve_paragraphs)
+        item = emit(start, end)
+        if item:
+            yield item
+
+        # Move start position with overlap
+        start = max(end - chunk_overlap, start + 1) if end < len(buffer) else len(buffer)
 
 
 def chunk_text(
@@ -25,31 +109,15 @@ def chunk_text(
     Returns:
         List of text chunks
     """
-    if not text or len(text) < chunk_size:
-        return [text] if text else []
-
-    chunks = []
-    start = 0
-
-    while start < len(text):
-        # Find chunk end
-        end = min(start + chunk_size, len(text))
-
-        # If not at end of text and preserve_paragraphs, find paragraph boundary
-        if end < len(text) and preserve_paragraphs:
-            # Look for newline within last 50 chars
-            last_newline = text.rfind("\n", max(start, end - 50), end)
-            if last_newline > start:
-                end = last_newline
-
-        chunk = text[start:end].strip()
-        if chunk:
-            chunks.append(chunk)
-
-        # Move start position with overlap
-        start = end - chunk_overlap if end < len(text) else len(text)
-
-    return chunks
+    return [
+        chunk
+        for _, chunk in iter_chunks(
+            [text],
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            preserve_paragraphs=preserve_paragraphs,
+        )
+    ]
 
 
 def clean_text(text: str) -> str:
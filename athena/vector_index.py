@@ -0,0 +1,444 @@
+"""
+Local vector index for Athena.
+
+Exact brute-force cosine search over NumPy arrays, with optional
+quantized storage:
+
+- float32: full precision, scored directly
+- float16: half the memory, approximate scores
+- int8: per-vector scaled, a quarter of the memory, approximate scores
+
+Quantized indexes score every vector approximately, then re-score the
+best `top_k * rescore_factor` candidates exactly against float32 vectors.
+
+Saved indexes are immutable, versioned directories. Loading maps every
+array and the document texts read-only, so processes serving the same
+index share its pages through the OS page cache, and float32 rows are
+only paged in when re-scored.
+"""
+
+import collections.abc
+import json
+import os
+import re
+import shutil
+from pathlib import Path
+from typing import Optional, Sequence
+
+import numpy as np
+
+STORAGE_TYPES = ("float32", "float16", "int8")
+
+# On-disk layout: <root>/CURRENT names the published <root>/vNNNNNN
+FORMAT_VERSION = 1
+CURRENT_FILE = "CURRENT"
+_VERSION_RE = re.compile(r"v\d{6}")
+
+# Rows dequantized per block; small enough that the float32 buffer stays
+# in cache between the conversion and the matrix-vector product
+_SCORE_BLOCK = 256
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+class VectorIndex:
+    """
+    In-process vector index with quantized storage and exact re-scoring.
+
+    Vectors are L2-normalized on add, so scores are cosine similarities.
+    Ids are unique: adding an existing id replaces its row.
+    """
+
+    def __init__(self, dim: int, storage: str = "float32", rescore_factor: int = 4):
+        """
+        Initialize index.
+
+        Args:
+            dim: Embedding dimensions
+            storage: "float32", "float16" or "int8"
+            rescore_factor: Candidates re-scored per requested result
+        """
+        if storage not in STORAGE_TYPES:
+            raise ValueError(f"Unknown storage type: {storage}")
+
+        self.dim = dim
+        self.storage = storage
+        self.rescore_factor = max(1, rescore_factor)
+
+        self._count = 0
+        self._codes = np.empty((0, dim), dtype=np.int8 if storage == "int8" else storage)
+        self._scales = np.empty(0, dtype=np.float32)  # int8 only
+        self._exact = np.empty((0, dim), dtype=np.float32)  # quantized only
+        self.ids: list[str] = []
+        self.metadatas: list[dict] = []
+        self.documents: Sequence[str] = []
+        self.version: Optional[str] = None  # Set when saved or loaded
+        self._field_rows: dict[tuple, list[int]] = {}
+        self._rows: dict[str, int] = {}  # id -> row
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def quantized(self) -> bool:
+        return self.storage != "float32"
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes scanned per query (search codes plus scales)."""
+        return self._count * self._codes.itemsize * self.dim + self._count * (
+            self._scales.itemsize if self.storage == "int8" else 0
+        )
+
+    def _grow(self, extra: int) -> None:
+        """Ensure capacity for `extra` more rows (amortized doubling)."""
+        needed = self._count + extra
+        capacity = self._codes.shape[0]
+        if needed <= capacity:
+            return
+
+        new_capacity = max(needed, capacity * 2, 64)
+
+        def grown(array: np.ndarray, shape: tuple) -> np.ndarray:
+            fresh = np.empty(shape, dtype=array.dtype)
+            fresh[:self._count] = array[:self._count]
+            return fresh
+
+        self._codes = grown(self._codes, (new_capacity, self.dim))
+        if self.storage == "int8":
+            self._scales = grown(self._scales, (new_capacity,))
+        if self.quantized:
+            self._exact = grown(self._exact, (new_capacity, self.dim))
+
+    def _ensure_writable(self) -> None:
+        """Copy arrays mapped read-only by load() before rows are overwritten."""
+        if not self._codes.flags.writeable:
+            self._codes = np.array(self._codes)
+        if self.storage == "int8" and not self._scales.flags.writeable:
+            self._scales = np.array(self._scales)
+        if self.quantized and not self._exact.flags.writeable:
+            self._exact = np.array(self._exact)
+
+    def add(
+        self,
+        ids: Sequence[str],
+        vectors: Sequence[Sequence[float]],
+        metadatas: Optional[Sequence[dict]] = None,
+        documents: Optional[Sequence[str]] = None,
+    ) -> None:
+        """
+        Add or replace vectors (upsert by id).
+
+        An id already in the index has its vector, codes, metadata and
+        document overwritten in place; if an id repeats within one call,
+        the last occurrence wins.
+
+        Args:
+            ids: Identifier per vector
+            vectors: Embeddings, shape (n, dim)
+            metadatas: Optional metadata dict per vector
+            documents: Optional source text per vector
+        """
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        if len(ids) != len(vectors):
+            raise ValueError("ids and vectors must have the same length")
+
+        metadatas = metadatas or [{} for _ in ids]
+        documents = documents or ["" for _ in ids]
+
+        # Keep only the last occurrence of an id repeated within this call
+        last = {doc_id: i for i, doc_id in enumerate(ids)}
+        keep = sorted(last.values())
+        ids = [ids[i] for i in keep]
+        vectors = _normalize(vectors[keep])
+        metadatas = [metadatas[i] for i in keep]
+        documents = [documents[i] for i in keep]
+
+        existing = [doc_id in self._rows for doc_id in ids]
+        n_new = existing.count(False)
+        self._grow(n_new)
+        if any(existing):
+            self._ensure_writable()
+
+        next_row = self._count
+        row_list = []
+        for doc_id, replaced in zip(ids, existing, strict=True):
+            if replaced:
+                row_list.append(self._rows[doc_id])
+            else:
+                row_list.append(next_row)
+                next_row += 1
+        rows = np.array(row_list, dtype=np.int64)
+
+        if self.storage == "int8":
+            scales = np.abs(vectors).max(axis=1) / 127.0
+            scales[scales == 0] = 1.0
+            self._codes[rows] = np.clip(np.rint(vectors / scales[:, None]), -127, 127)
+            self._scales[rows] = scales
+        else:
+            self._codes[rows] = vectors
+
+        if self.quantized:
+            self._exact[rows] = vectors
+
+        if not isinstance(self.documents, list):
+            self.documents = list(self.documents)  # Copy-on-write for loaded indexes
+
+        for doc_id, row, replaced, metadata, document in zip(
+            ids, row_list, existing, metadatas, documents, strict=True
+        ):
+            if replaced:
+                for key, value in self.metadatas[row].items():
+                    field_rows = self._field_rows[(key, value)]
+                    field_rows.remove(row)
+                    if not field_rows:
+                        del self._field_rows[(key, value)]
+                self.metadatas[row] = dict(metadata)
+                self.documents[row] = document
+            else:
+                self._rows[doc_id] = row
+                self.ids.append(doc_id)
+                self.metadatas.append(dict(metadata))
+                self.documents.append(document)
+            for key, value in metadata.items():
+                self._field_rows.setdefault((key, value), []).append(row)
+
+        self._count += n_new
+
+    def _approximate_scores(self, query: np.ndarray) -> np.ndarray:
+        """Score every stored vector against a normalized query."""
+        if self.storage == "float32":
+            return self._codes[:self._count] @ query
+
+        scores = np.empty(self._count, dtype=np.float32)
+        buffer = np.empty((_SCORE_BLOCK, self.dim), dtype=np.float32)
+        for start in range(0, self._count, _SCORE_BLOCK):
+            end = min(start + _SCORE_BLOCK, self._count)
+            block = buffer[:end - start]
+            block[...] = self._codes[start:end]
+            np.matmul(block, query, out=scores[start:end])
+        if self.storage == "int8":
+            scores *= self._scales[:self._count]
+        return scores
+
+    def _filter_mask(self, where: dict) -> np.ndarray:
+        """Rows matching every key/value in `where`."""
+        mask = np.ones(self._count, dtype=bool)
+        for key, value in where.items():
+            field_mask = np.zeros(self._count, dtype=bool)
+            field_mask[self._field_rows.get((key, value), [])] = True
+            mask &= field_mask
+        return mask
+
+    def search(
+        self,
+        query: Sequence[float],
+        top_k: int = 5,
+        where: Optional[dict] = None,
+    ) -> list[tuple[int, float]]:
+        """
+        Find the most similar vectors.
+
+        Args:
+            query: Query embedding
+            top_k: Number of results
+            where: Optional exact-match metadata filter
+
+        Returns:
+            List of (row, cosine similarity), best first; see ids,
+            metadatas and documents for row details
+        """
+        if self._count == 0 or top_k <= 0:
+            return []
+
+        query = _normalize(np.asarray(query, dtype=np.float32).reshape(self.dim))
+        scores = self._approximate_scores(query)
+
+        if where:
+            mask = self._filter_mask(where)
+            if not mask.any():
+                return []
+            scores[~mask] = -np.inf
+            available = int(mask.sum())
+        else:
+            available = self._count
+
+        k = min(available, top_k * self.rescore_factor if self.quantized else top_k)
+        candidates = np.argpartition(-scores, k - 1)[:k]
+
+        if self.quantized:
+            # Exact float32 re-score of the shortlist
+            candidates = np.sort(candidates)  # Sequential reads from mapped storage
+            scores_c = self._exact[candidates] @ query
+        else:
+            scores_c = scores[candidates]
+
+        order = np.argsort(-scores_c, kind="stable")[:top_k]
+        return [(int(candidates[i]), float(scores_c[i])) for i in order]
+
+    def save(self, directory: Path, keep_versions: int = 2) -> str:
+        """
+        Write the index as a new immutable version.
+
+        The version is written under a temporary name, renamed into
+        place, and then published by atomically replacing CURRENT, so
+        readers see either the old or the new version, never a partial
+        one. Older versions beyond keep_versions are removed; processes
+        that still map them keep reading the unlinked files.
+
+        Args:
+            directory: Index root directory
+            keep_versions: Published versions to keep on disk
+
+        Returns:
+            Name of the new version
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        existing = _versions(directory)
+        version = f"v{(int(existing[-1][1:]) + 1) if existing else 1:06d}"
+
+        tmp_dir = directory / f".tmp-{version}-{os.getpid()}"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir()
+        self._write(tmp_dir)
+        tmp_dir.rename(directory / version)
+
+        tmp_pointer = directory / f".CURRENT-{os.getpid()}"
+        tmp_pointer.write_text(version, encoding="utf-8")
+        os.replace(tmp_pointer, directory / CURRENT_FILE)
+
+        for old in _versions(directory)[:-keep_versions]:
+            shutil.rmtree(directory / old, ignore_errors=True)
+
+        self.version = version
+        return version
+
+    def _write(self, directory: Path) -> None:
+        np.save(directory / "codes.npy", self._codes[:self._count])
+        if self.storage == "int8":
+            np.save(directory / "scales.npy", self._scales[:self._count])
+        if self.quantized:
+            np.save(directory / "exact.npy", self._exact[:self._count])
+
+        # Documents as one UTF-8 blob plus row offsets, so readers can map
+        # them instead of materializing every string
+        encoded = [text.encode("utf-8") for text in self.documents]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(data) for data in encoded], out=offsets[1:])
+        np.save(directory / "document_offsets.npy", offsets)
+        with (directory / "documents.bin").open("wb") as f:
+            f.writelines(encoded)
+
+        with (directory / "entries.json").open("w", encoding="utf-8") as f:
+            json.dump({"ids": self.ids, "metadatas": self.metadatas}, f)
+        with (directory / "index.json").open("w", encoding="utf-8") as f:
+            json.dump({
+                "format": FORMAT_VERSION,
+                "dim": self.dim,
+                "storage": self.storage,
+                "rescore_factor": self.rescore_factor,
+                "count": self._count,
+            }, f)
+
+    @classmethod
+    def load(cls, directory: Path, mmap: bool = True) -> "VectorIndex":
+        """
+        Load the current version of an index written by save().
+
+        Args:
+            directory: Index root directory
+            mmap: Map arrays and documents read-only instead of reading
+                them into RAM; mapped pages are shared between processes
+                through the OS page cache
+
+        Raises:
+            FileNotFoundError: If no version has been published
+        """
+        directory = Path(directory)
+
+        # A writer may prune the version we just resolved; re-resolve then
+        for attempt in range(3):
+            version = current_version(directory)
+            if version is None:
+                raise FileNotFoundError(f"No index published in {directory}")
+            try:
+                index = cls._load_version(directory / version, mmap)
+            except FileNotFoundError:
+                if attempt == 2:
+                    raise
+                continue
+            index.version = version
+            return index
+
+    @classmethod
+    def _load_version(cls, path: Path, mmap: bool) -> "VectorIndex":
+        with (path / "index.json").open("r", encoding="utf-8") as f:
+            info = json.load(f)
+        with (path / "entries.json").open("r", encoding="utf-8") as f:
+            entries = json.load(f)
+
+        index = cls(info["dim"], info["storage"], info["rescore_factor"])
+        mmap_mode = "r" if mmap and info["count"] else None
+
+        index._codes = np.load(path / "codes.npy", mmap_mode=mmap_mode)
+        if index.storage == "int8":
+            index._scales = np.load(path / "scales.npy", mmap_mode=mmap_mode)
+        if index.quantized:
+            index._exact = np.load(path / "exact.npy", mmap_mode=mmap_mode)
+
+        offsets = np.load(path / "document_offsets.npy", mmap_mode=mmap_mode)
+        if mmap_mode and offsets[-1]:
+            blob = np.memmap(path / "documents.bin", dtype=np.uint8, mode="r")
+        else:
+            blob = np.fromfile(path / "documents.bin", dtype=np.uint8)
+        index.documents = MappedTexts(blob, offsets)
+
+        index._count = info["count"]
+        index.ids = entries["ids"]
+        index.metadatas = entries["metadatas"]
+        for row, metadata in enumerate(index.metadatas):
+            for key, value in metadata.items():
+                index._field_rows.setdefault((key, value), []).append(row)
+        index._rows = {doc_id: row for row, doc_id in enumerate(index.ids)}
+
+        return index
+
+
+class MappedTexts(collections.abc.Sequence):
+    """Read-only sequence of strings stored as a UTF-8 blob with offsets."""
+
+    def __init__(self, blob: np.ndarray, offsets: np.ndarray):
+        self._blob = blob
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, row: int) -> str:
+        if not -len(self) <= row < len(self):
+            raise IndexError(row)
+        row %= len(self)
+        start, end = self._offsets[row], self._offsets[row + 1]
+        return self._blob[start:end].tobytes().decode("utf-8")
+
+
+def _versions(directory: Path) -> list[str]:
+    """Published and unpublished version directories, oldest first."""
+    return sorted(
+        entry.name for entry in directory.iterdir()
+        if entry.is_dir() and _VERSION_RE.fullmatch(entry.name)
+    )
+
+
+def current_version(directory: Path) -> Optional[str]:
+    """Name of the published index version in a directory, if any."""
+    try:
+        return (Path(directory) / CURRENT_FILE).read_text(encoding="utf-8").strip() or None
+    except FileNotFoundError:
+        return None
@@ -0,0 +1,103 @@
+"""
+Concurrent session throughput for HestiaAgent.process.
+
+Runs 1, 8 and 32 simultaneous sessions, each sending a fixed mix of
+messages (domain, store and plain chat intents) back to back, with the
+domain handlers running inline on the event loop (the old behaviour)
+and offloaded to the handler pool. Domain handlers are given a fixed
+blocking delay to stand in for slow I/O; the real handlers are
+in-memory and return in microseconds.
+
+Usage:
+    python benchmarks/bench_agent_concurrency.py [--handler-ms 20] [--requests 20]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from hestia.agent import HestiaAgent
+
+MESSAGES = [
+    "debug this stack trace",
+    "hello there",
+    "rephrase this sentence",
+    "how does sleep affect memory",
+    "what is a genre",
+    "explain asset allocation",
+    "help me get started",
+]
+DOMAINS = ("hephaestus", "hermes", "apollo", "dionysus", "pluto")
+
+
+def slow(handle, seconds: float):
+    def handler(user_input: str) -> str:
+        time.sleep(seconds)
+        return handle(user_input)
+    return handler
+
+
+async def run_sessions(agent: HestiaAgent, sessions: int, requests: int) -> dict:
+    latencies = []
+
+    async def session(offset: int):
+        for i in range(requests):
+            started = time.perf_counter()
+            await agent.process(MESSAGES[(offset + i) % len(MESSAGES)])
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(session(s) for s in range(sessions)))
+    elapsed = time.perf_counter() - started
+
+    values = np.asarray(latencies)
+    return {
+        "sessions": sessions,
+        "requests_per_s": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(float(np.percentile(values, 50)), 2),
+        "p99_ms": round(float(np.percentile(values, 99)), 2),
+    }
+
+
+async def main_async(args) -> dict:
+    report = {"handler_ms": args.handler_ms, "requests_per_session": args.requests}
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode, offload in (("inline", False), ("offloaded", True)):
+            agent = HestiaAgent({
+                "enable_athena": False,
+                "memory_db_path": os.path.join(tmp, "memory.db"),
+                "offload_handlers": offload,
+                "handler_workers": args.workers,
+            })
+            for name in DOMAINS:
+                domain = getattr(agent, name)
+                domain.handle = slow(domain.handle, args.handler_ms / 1000)
+
+            report[mode] = [
+                await run_sessions(agent, sessions, args.requests) for sessions in args.sessions
+            ]
+            await agent.cleanup()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--handler-ms", type=float, default=20)
+    parser.add_argument("--requests", type=int, default=20, help="Messages per session")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(main_async(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Throughput benchmark for athena.chunker.DocumentChunker.
+
+Chunks synthetic documents of increasing size and reports MB/s. Linear
+chunking shows flat MB/s as documents grow.
+
+Usage:
+    python benchmarks/bench_chunker.py [--sizes-mb 1 4 16] [--repeat 3]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from athena.chunker import ChunkingConfig, ChunkingStrategy, DocumentChunker
+
+
+def make_document(size_bytes: int, seed: int = 0) -> str:
+    """Build deterministic prose with headings, short and long paragraphs."""
+    rng = random.Random(seed)
+    words = ["knowledge", "chunk", "overlap", "semantic", "index", "vector",
+             "paragraph", "retrieval", "query", "document", "boundary", "offset"]
+    parts = []
+    total = 0
+    section = 0
+
+    while total < size_bytes:
+        if rng.random() < 0.05:
+            section += 1
+            part = f"SECTION {section}"
+        else:
+            sentences = rng.randint(2, 60)  # Some paragraphs exceed max_chunk_size
+            part = " ".join(
+                " ".join(rng.choice(words) for _ in range(rng.randint(6, 20))).capitalize() + "."
+                for _ in range(sentences)
+            )
+        parts.append(part)
+        total += len(part) + 2
+
+    return "\n\n".join(parts)
+
+
+def run(sizes_mb: list[float], repeat: int) -> list[dict]:
+    results = []
+
+    for strategy in (ChunkingStrategy.SEMANTIC, ChunkingStrategy.FIXED):
+        config = ChunkingConfig(strategy=strategy, chunk_size=1000, chunk_overlap=200, max_chunks=1000)
+        chunker = DocumentChunker(config)
+
+        for size_mb in sizes_mb:
+            text = make_document(int(size_mb * 1024 * 1024))
+            ranges = 0
+            best = float("inf")
+
+            for _ in range(repeat):
+                start = time.perf_counter()
+                ranges = sum(1 for _ in chunker._chunk_ranges(text))
+                best = min(best, time.perf_counter() - start)
+
+            results.append({
+                "strategy": strategy.value,
+                "size_mb": size_mb,
+                "chunks": ranges,
+                "seconds": round(best, 4),
+                "mb_per_s": round(len(text) / (1024 * 1024) / best, 2),
+            })
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes-mb", type=float, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    results = run(args.sizes_mb, args.repeat)
+    for row in results:
+        print(f"{row['strategy']:>9} {row['size_mb']:>6} MB  {row['chunks']:>7} chunks  {row['mb_per_s']:>8} MB/s")
+    print(json.dumps({"benchmark": "chunker_throughput", "results": results}))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Per-plan cost of IntegrityBaseline.verify_files.
+
+Builds a synthetic tree of .py files under the critical directories,
+creates a baseline, and times repeated verifications: full rehashes (the
+old behaviour, and paranoid mode) against the stat-signature fast path
+that rehashes only changed files. Also times a verification right after
+one file has been edited.
+
+Usage:
+    python benchmarks/bench_integrity.py [--files 500] [--file-kb 8] [--runs 20]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from artemis import integrity_baseline
+from artemis.integrity_baseline import IntegrityBaseline
+
+
+def build_tree(root: Path, files: int, file_kb: int) -> list:
+    paths = []
+    dirs = IntegrityBaseline.CRITICAL_DIRECTORIES
+    for i in range(files):
+        path = root / dirs[i % len(dirs)] / f"pkg{i % 16}" / f"module_{i}.py"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(os.urandom(file_kb * 512).hex().encode())
+        paths.append(path)
+
+    # Age the tree past the racy window, as a checkout on disk would be
+    old_ns = time.time_ns() - 3600 * 1_000_000_000
+    for path in paths:
+        os.utime(path, ns=(old_ns, old_ns))
+    return paths
+
+
+def time_ms(fn, runs: int) -> list:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=500)
+    parser.add_argument("--file-kb", type=int, default=8)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    # ctime is always "now" for a freshly built tree; ignore the window here
+    integrity_baseline.RACY_WINDOW_NS = 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        paths = build_tree(root, args.files, args.file_kb)
+        baseline = IntegrityBaseline(baseline_path=root / ".artemis_baseline")
+        baseline.create_baseline(root)
+
+        full = time_ms(lambda: baseline.verify_files(root, full=True), args.runs)
+        fast = time_ms(lambda: baseline.verify_files(root), args.runs)
+
+        # Same-size edit of one file, then the next verification
+        edited = paths[0]
+        edited.write_bytes(edited.read_bytes()[::-1])
+        os.utime(edited, ns=(time.time_ns() - 10**9, time.time_ns() - 10**9))
+        started = time.perf_counter()
+        is_valid, mismatches = baseline.verify_files(root)
+        after_edit_ms = (time.perf_counter() - started) * 1000
+
+    report = {
+        "files": args.files,
+        "file_kb": args.file_kb,
+        "full_p50_ms": round(float(np.percentile(full, 50)), 3),
+        "stat_p50_ms": round(float(np.percentile(fast, 50)), 3),
+        "speedup": round(float(np.percentile(full, 50) / np.percentile(fast, 50)), 1),
+        "after_edit_ms": round(after_edit_ms, 3),
+        "after_edit_detected": not is_valid and mismatches[0]["status"] == "modified",
+        "after_edit_hashed": baseline.get_verification_stats()["hashed"],
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Boot-time cost of creating and fully verifying an integrity baseline.
+
+Builds a synthetic tree (10k .py files by default) under the critical
+directories, then times create_baseline and a full verify_files with
+serial hashing (hash_workers=1) and with the thread pool. Files are read
+from the page cache after the first pass; use --cold to drop it between
+runs (Linux, root only) for disk-bound numbers.
+
+Usage:
+    python benchmarks/bench_integrity_boot.py [--files 10000] [--file-kb 8] [--runs 3]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from artemis.file_hasher import DEFAULT_WORKERS
+from artemis.integrity_baseline import IntegrityBaseline
+
+
+def build_tree(root: Path, files: int, file_kb: int) -> None:
+    dirs = IntegrityBaseline.CRITICAL_DIRECTORIES
+    for i in range(files):
+        path = root / dirs[i % len(dirs)] / f"pkg{i % 64}" / f"module_{i}.py"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(os.urandom(file_kb * 512).hex().encode())
+
+
+def drop_caches() -> None:
+    subprocess.run(["sync"], check=True)
+    with open("/proc/sys/vm/drop_caches", "w") as f:
+        f.write("3\n")
+
+
+def boot(root: Path, workers: int, cold: bool) -> tuple:
+    """Create then fully verify a baseline; returns (create_ms, verify_ms, baseline)."""
+    baseline = IntegrityBaseline(baseline_path=root / ".artemis_baseline", hash_workers=workers)
+    if cold:
+        drop_caches()
+    started = time.perf_counter()
+    hashes = baseline.create_baseline(root)
+    created = time.perf_counter()
+    if cold:
+        drop_caches()
+    is_valid, _ = baseline.verify_files(root, full=True)
+    verified = time.perf_counter()
+    assert is_valid
+    return (created - started) * 1000, (verified - created) * 1000, hashes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=10_000)
+    parser.add_argument("--file-kb", type=int, default=8)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--cold", action="store_true", help="Drop the page cache before each pass")
+    args = parser.parse_args()
+
+    report = {
+        "files": args.files,
+        "file_kb": args.file_kb,
+        "cpus": os.cpu_count(),
+        "workers": args.workers,
+        "cold": args.cold,
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        build_tree(root, args.files, args.file_kb)
+
+        results = {}
+        for label, workers in (("serial", 1), ("parallel", args.workers)):
+            runs = [boot(root, workers, args.cold) for _ in range(args.runs)]
+            results[label] = runs[-1][2]
+            report[f"{label}_create_p50_ms"] = round(float(np.percentile([r[0] for r in runs], 50)), 1)
+            report[f"{label}_verify_p50_ms"] = round(float(np.percentile([r[1] for r in runs], 50)), 1)
+
+    report["speedup"] = round(report["serial_create_p50_ms"] / report["parallel_create_p50_ms"], 2)
+    report["identical_baselines"] = list(results["serial"].items()) == list(results["parallel"].items())
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Intent classification throughput for Hestia.
+
+Compares IntentClassifier.classify and classify_many against the
+previous per-tier substring walk, over a deterministic mix of short
+commands and longer messages, and counts the messages the two disagree
+on (substring hits inside other words such as "hi" in "this").
+
+Usage:
+    python benchmarks/bench_intent.py [--messages 5000] [--repeat 5]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hestia.intent_classifier import IntentClassifier
+
+COMMANDS = [
+    "hello", "hi there", "help me", "show my memories", "what do you remember",
+    "search my notes for entropy", "find documents about rust", "debug this function",
+    "rewrite this paragraph", "how much sleep do I need", "recommend a song",
+    "explain asset allocation", "what do my notes say about thermodynamics",
+]
+FILLER = (
+    "this that thing something billion article fund artist therapy history whatever "
+    "monday meeting schedule tomorrow weather coffee train station office window "
+    "garden letter phone family dinner weekend project deadline question answer"
+).split()
+
+
+def legacy_classify(tiers: list[tuple], text: str) -> str:
+    """The per-tier substring walk classify() used before the compiled matcher."""
+    text_lower = text.lower().strip()
+    for intent, patterns in tiers:
+        for pattern in patterns:
+            if pattern in text_lower:
+                return intent
+    return "general"
+
+
+def build_messages(count: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    messages = []
+    for _ in range(count):
+        words = [rng.choice(FILLER) for _ in range(rng.choice((0, 3, 8, 30)))]
+        if rng.random() < 0.6:
+            words.insert(rng.randint(0, len(words)), rng.choice(COMMANDS))
+        messages.append(" ".join(words) or rng.choice(COMMANDS))
+    return messages
+
+
+def rate(func, messages: list[str], repeat: int) -> float:
+    """Best-of-repeat classifications per second."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(messages)
+        best = min(best, time.perf_counter() - started)
+    return round(len(messages) / best)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    classifier = IntentClassifier()
+    tiers = classifier._tiers()
+    messages = build_messages(args.messages, args.seed)
+
+    started = time.perf_counter()
+    IntentClassifier()
+    build_ms = (time.perf_counter() - started) * 1000
+
+    report = {
+        "messages": len(messages),
+        "mean_words": round(sum(len(m.split()) for m in messages) / len(messages), 1),
+        "build_ms": round(build_ms, 3),
+        "per_second": {
+            "legacy": rate(lambda ms: [legacy_classify(tiers, m) for m in ms], messages, args.repeat),
+            "classify": rate(lambda ms: [classifier.classify(m) for m in ms], messages, args.repeat),
+            "classify_many": rate(classifier.classify_many, messages, args.repeat),
+        },
+        "disagreements": sum(
+            legacy_classify(tiers, m) != classifier.classify(m) for m in messages
+        ),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Overload behaviour of OllamaClient admission control.
+
+Starts a local stand-in for Ollama that serves one generation at a time
+(as a single local model does) with a fixed service time, then offers
+requests at a multiple of its capacity with Poisson arrivals. Compares
+an effectively unbounded queue, which is how the client behaved before
+admission control, with bounded queues. Reports latency percentiles of
+completed requests, rejections and goodput.
+
+Usage:
+    python benchmarks/bench_llm_admission.py [--service-ms 50] [--load 1.5] [--seconds 5]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from aiohttp import web
+
+from hestia.ollama_client import OllamaBusyError, OllamaClient
+
+
+async def start_model(service_s: float) -> tuple:
+    """A one-at-a-time fake model; returns (runner, base_url)."""
+    model = asyncio.Lock()
+
+    async def generate(request):
+        await request.json()
+        async with model:
+            await asyncio.sleep(service_s)
+        return web.json_response({"response": "ok", "done": True})
+
+    app = web.Application()
+    app.router.add_post("/api/generate", generate)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+async def run_load(url: str, max_queue: int, deadline, args) -> dict:
+    client = OllamaClient(base_url=url, timeout=600, max_concurrency=1, max_queue=max_queue)
+    await client.initialize()
+    rng = random.Random(args.seed)
+    rate = args.load * 1000 / args.service_ms
+    latencies, rejected, failed = [], 0, 0
+
+    async def one():
+        nonlocal rejected, failed
+        started = time.perf_counter()
+        try:
+            await client.generate("hello", deadline=deadline)
+            latencies.append((time.perf_counter() - started) * 1000)
+        except OllamaBusyError:
+            rejected += 1
+        except RuntimeError:
+            failed += 1
+
+    tasks = []
+    started = time.perf_counter()
+    while time.perf_counter() - started < args.seconds:
+        tasks.append(asyncio.create_task(one()))
+        await asyncio.sleep(rng.expovariate(rate))
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - started
+    stats = client.get_stats()
+    await client.cleanup()
+
+    values = np.asarray(latencies or [0.0])
+    return {
+        "max_queue": max_queue,
+        "deadline_s": deadline,
+        "offered": len(tasks),
+        "completed": len(latencies),
+        "rejected": rejected,
+        "timed_out": failed,
+        "goodput_per_s": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(float(np.percentile(values, 50)), 1),
+        "p99_ms": round(float(np.percentile(values, 99)), 1),
+        "max_ms": round(float(values.max()), 1),
+        "queue_wait_p95_ms": stats["queue_wait_p95_ms"],
+    }
+
+
+async def main_async(args) -> dict:
+    runner, url = await start_model(args.service_ms / 1000)
+    try:
+        runs = [await run_load(url, 10**6, None, args)]
+        for max_queue in args.queues:
+            runs.append(await run_load(url, max_queue, args.deadline, args))
+    finally:
+        await runner.cleanup()
+    return {
+        "service_ms": args.service_ms,
+        "load": args.load,
+        "seconds": args.seconds,
+        "runs": runs,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--service-ms", type=float, default=50)
+    parser.add_argument("--load", type=float, default=1.5, help="Offered load / capacity")
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--queues", type=int, nargs="+", default=[2, 8])
+    parser.add_argument("--deadline", type=float, default=None,
+                        help="Per-request deadline in seconds for bounded runs")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(main_async(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
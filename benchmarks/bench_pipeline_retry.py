@@ -0,0 +1,115 @@
+"""
+Retry latency of a three-domain PIPELINE with and without step memoization.
+
+Each domain method sleeps for a fixed time to stand in for an LLM call.
+The last step fails on its first attempt (a model timeout) and succeeds
+when the pipeline is retried. Reports the retry latency when every step
+re-executes (a fresh memo per run, the old behaviour) and when completed
+steps are reused, plus a replay of the unchanged pipeline and a replay
+with only the last step's args changed.
+
+Usage:
+    python benchmarks/bench_pipeline_retry.py [--step-ms 50] [--runs 5]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from hestia.context_engine import ContextEngine, StepMemo
+
+PIPELINE = """
+PIPELINE:
+  - athena.query(q="carbon capture and storage")
+  - hermes.rewrite(style="executive summary")
+  - hephaestus.explain(level="basic")
+END
+"""
+
+
+class SlowDomain:
+    """Domain whose methods take step_s each; explain() fails `failures` times."""
+
+    def __init__(self, name: str, step_s: float, failures: int = 0):
+        self.name = name
+        self.step_s = step_s
+        self.failures = failures
+
+    def _call(self, what: str) -> str:
+        time.sleep(self.step_s)
+        return f"{self.name} {what}"
+
+    def query(self, q, context=()):
+        return self._call(f"answered {q} with {len(context)} entries")
+
+    def rewrite(self, style, context=()):
+        return self._call(f"rewrote {context[-1].content} as {style}")
+
+    def explain(self, level, context=()):
+        if self.failures:
+            self.failures -= 1
+            time.sleep(self.step_s)
+            raise TimeoutError("model timed out")
+        return self._call(f"explained {context[-1].content} at {level} level")
+
+
+def timed(fn) -> float:
+    started = time.perf_counter()
+    fn()
+    return (time.perf_counter() - started) * 1000
+
+
+def run_once(step_s: float, memoize: bool) -> dict:
+    context = ContextEngine()
+    context.append("User is preparing a policy briefing")
+    domains = {
+        "athena": SlowDomain("Athena", step_s),
+        "hermes": SlowDomain("Hermes", step_s),
+        "hephaestus": SlowDomain("Hephaestus", step_s, failures=1),
+    }
+    pipeline = context.parse_pipeline(PIPELINE)
+    memo = StepMemo()
+
+    def execute(p=pipeline):
+        return context.execute_pipeline(p, domains, policy_epoch=0, memo=memo if memoize else StepMemo())
+
+    try:
+        execute()
+    except RuntimeError:
+        pass
+
+    changed = context.parse_pipeline(PIPELINE.replace("basic", "advanced"))
+    return {
+        "retry_ms": timed(execute),
+        "replay_ms": timed(execute),
+        "replay_changed_last_step_ms": timed(lambda: execute(changed)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--step-ms", type=float, default=50)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    # The first attempt's step failure is expected; keep its error log off stderr
+    logging.getLogger("hestia.context_engine").setLevel(logging.CRITICAL)
+
+    report = {"step_ms": args.step_ms, "runs": args.runs}
+    for mode, memoize in (("no_memo", False), ("memo", True)):
+        runs = [run_once(args.step_ms / 1000, memoize) for _ in range(args.runs)]
+        report[mode] = {
+            key: round(float(np.median([run[key] for run in runs])), 2) for key in runs[0]
+        }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Quantized storage report for the local vector index.
+
+Builds float32, float16 and int8 indexes over the same synthetic
+clustered embeddings and reports, per format: bytes scanned per query,
+search throughput, and recall@k against exact float32 brute force,
+with and without float32 re-scoring.
+
+Usage:
+    python benchmarks/bench_quantization.py [--vectors 100000] [--dim 384] [--k 10]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from athena.vector_index import VectorIndex
+
+
+def clustered(n: int, dim: int, clusters: int, rng: np.random.Generator) -> np.ndarray:
+    centers = rng.normal(size=(clusters, dim)).astype(np.float32)
+    noise = rng.normal(size=(n, dim)).astype(np.float32)
+    return centers[rng.integers(0, clusters, n)] + 0.5 * noise
+
+
+def recall(index: VectorIndex, queries: np.ndarray, truth: list[set], k: int) -> float:
+    found = sum(
+        len(expected & {row for row, _ in index.search(query, top_k=k)})
+        for query, expected in zip(queries, truth, strict=True)
+    )
+    return found / (k * len(queries))
+
+
+def run(n: int, dim: int, num_queries: int, k: int, rescore_factor: int, seed: int) -> dict:
+    rng = np.random.default_rng(seed)
+    vectors = clustered(n, dim, 256, rng)
+    queries = clustered(num_queries, dim, 256, rng)
+    ids = [str(i) for i in range(n)]
+
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    unit_queries = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+    truth = [set(np.argsort(-(unit @ q))[:k]) for q in unit_queries]
+
+    report = {"vectors": n, "dim": dim, "queries": num_queries, "k": k,
+              "rescore_factor": rescore_factor, "formats": {}}
+    baseline = None
+
+    for storage in ("float32", "float16", "int8"):
+        index = VectorIndex(dim, storage=storage, rescore_factor=rescore_factor)
+        index.add(ids, vectors)
+
+        index.search(queries[0], top_k=k)  # Warm up
+        started = time.perf_counter()
+        for query in queries:
+            index.search(query, top_k=k)
+        qps = num_queries / (time.perf_counter() - started)
+
+        result = {
+            "search_bytes": index.nbytes,
+            "bytes_per_vector": index.nbytes / n,
+            "qps": round(qps, 1),
+            "recall_at_k": recall(index, queries, truth, k),
+        }
+        if index.quantized:
+            index.rescore_factor = 1  # Quantized ranking alone
+            result["recall_at_k_no_rescore"] = recall(index, queries, truth, k)
+
+        if baseline is None:
+            baseline = result
+        else:
+            result["memory_reduction"] = round(1 - result["search_bytes"] / baseline["search_bytes"], 3)
+            result["qps_ratio"] = round(result["qps"] / baseline["qps"], 2)
+            result["recall_delta"] = round(result["recall_at_k"] - baseline["recall_at_k"], 4)
+
+        report["formats"][storage] = result
+
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--vectors", type=int, default=100_000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--rescore-factor", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(json.dumps(
+        run(args.vectors, args.dim, args.queries, args.k, args.rescore_factor, args.seed),
+        indent=2,
+    ))
+
+
+if __name__ == "__main__":
+    main()
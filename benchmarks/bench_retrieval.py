@@ -0,0 +1,271 @@
+"""
+Offline retrieval benchmark for Athena.
+
+Runs the real ingest and query path (AthenaIngestor -> iter_chunks ->
+AthenaRetriever on the local vector index) over a deterministic
+synthetic corpus and query set, with a deterministic hashing embedder,
+so results are comparable across runs and machines without models or
+network access.
+
+Reports ingest throughput, query latency percentiles (unscoped and
+scoped to one subject), index size on disk and in RAM, and recall@k
+against exact brute-force search over the same chunks and embeddings.
+
+Usage:
+    python benchmarks/bench_retrieval.py [--chunk-size 512] [--chunk-overlap 50]
+        [--top-k 5] [--storage float32] [--shard-by none] [--docs 40]
+        [--output result.json]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+import zlib
+from itertools import pairwise
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from athena.config import AthenaConfig
+from athena.ingestor import AthenaIngestor
+from athena.retriever import AthenaRetriever
+from athena.vector_index import VectorIndex
+
+TOPICS = {
+    "thermodynamics": "entropy enthalpy heat work cycle carnot isothermal adiabatic "
+                      "reservoir efficiency temperature pressure volume gas",
+    "fluids": "viscosity laminar turbulent reynolds boundary layer pipe flow "
+              "bernoulli pressure velocity drag lift nozzle",
+    "circuits": "voltage current resistor capacitor inductor impedance kirchhoff "
+                "node mesh phasor transient power source ground",
+    "algorithms": "sorting graph tree heap recursion complexity dynamic programming "
+                  "greedy search hashing queue stack traversal",
+    "statistics": "mean variance distribution sample hypothesis regression "
+                  "confidence interval estimator likelihood bayes prior posterior",
+    "chemistry": "molecule bond reaction equilibrium acid base oxidation catalyst "
+                 "enthalpy mole solution concentration rate",
+}
+FILLER = "the a of and to in is for that with as by on this which are be from".split()
+
+
+class HashingEmbedder:
+    """Deterministic bag-of-words and bigram embedder (no model, no network)."""
+
+    def __init__(self, dim: int = 256):
+        self.dim = dim
+
+    def _features(self, text: str) -> list[str]:
+        words = [w for w in text.lower().split() if w.isalpha()]
+        return words + [f"{a}_{b}" for a, b in pairwise(words)]
+
+    def __call__(self, texts: list[str]) -> list[list[float]]:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature in self._features(text):
+                h = zlib.crc32(feature.encode("utf-8"))
+                vectors[row, h % self.dim] += 1.0 if h & 0x80000000 else -1.0
+        return vectors.tolist()
+
+
+def sentence(rng: random.Random, vocabulary: list[str]) -> str:
+    words = [rng.choice(vocabulary) if rng.random() < 0.6 else rng.choice(FILLER)
+             for _ in range(rng.randint(8, 18))]
+    return " ".join(words).capitalize() + "."
+
+
+def build_corpus(docs: int, pages: int, seed: int) -> list[dict]:
+    """Synthetic course notes: each document mixes a main and a side topic."""
+    rng = random.Random(seed)
+    names = sorted(TOPICS)
+    corpus = []
+
+    for doc in range(docs):
+        subject = names[doc % len(names)]
+        side = rng.choice(names)
+        vocabulary = TOPICS[subject].split() * 3 + TOPICS[side].split()
+        corpus.append({
+            "file_name": f"{subject}_{doc:03d}.pdf",
+            "subject": subject,
+            "pages": [
+                " ".join(sentence(rng, vocabulary) for _ in range(rng.randint(12, 24)))
+                for _ in range(pages)
+            ],
+        })
+
+    return corpus
+
+
+def build_queries(corpus: list[dict], count: int, seed: int) -> list[tuple[str, str]]:
+    """
+    Queries are word windows sampled from corpus pages, lightly perturbed.
+
+    Returns (query, subject of the source document) pairs.
+    """
+    rng = random.Random(seed + 1)
+    queries = []
+
+    for _ in range(count):
+        doc = rng.choice(corpus)
+        words = rng.choice(doc["pages"]).split()
+        start = rng.randrange(max(1, len(words) - 12))
+        window = [w.strip(".").lower() for w in words[start:start + 12]]
+        queries.append((" ".join(w for w in window if rng.random() > 0.2), doc["subject"]))
+
+    return queries
+
+
+def percentiles(samples_ms: list[float]) -> dict:
+    values = np.asarray(samples_ms)
+    return {
+        "p50_ms": round(float(np.percentile(values, 50)), 3),
+        "p95_ms": round(float(np.percentile(values, 95)), 3),
+        "p99_ms": round(float(np.percentile(values, 99)), 3),
+        "mean_ms": round(float(values.mean()), 3),
+    }
+
+
+def dir_size(path: Path) -> int:
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+def run(args) -> dict:
+    embedder = HashingEmbedder(args.embedding_dim)
+    corpus = build_corpus(args.docs, args.pages, args.seed)
+    queries = build_queries(corpus, args.queries, args.seed)
+    corpus_bytes = sum(len(page.encode("utf-8")) for doc in corpus for page in doc["pages"])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config = AthenaConfig(
+            enabled=True,
+            data_dir=Path(tmp) / "notes",
+            index_dir=Path(tmp) / "index",
+            chunk_size=args.chunk_size,
+            chunk_overlap=args.chunk_overlap,
+            top_k=args.top_k,
+            vector_backend="local",
+            vector_storage=args.storage,
+            rescore_factor=args.rescore_factor,
+            shard_by=args.shard_by,
+        )
+        retriever = AthenaRetriever(config, embedding_function=embedder)
+        ingestor = AthenaIngestor(config, retriever)
+
+        # Ingest
+        started = time.perf_counter()
+        chunks = 0
+        for doc in corpus:
+            result = ingestor.ingest_pages(
+                doc["pages"], doc["file_name"], subject=doc["subject"], persist=False
+            )
+            chunks += result.get("chunks_created", 0)
+        retriever.persist()
+        ingest_seconds = time.perf_counter() - started
+
+        # Query latency through the public API
+        retriever.query(queries[0][0])  # Warm up
+        latencies = []
+        results = []
+        for query, _ in queries:
+            started = time.perf_counter()
+            result = retriever.query(query)
+            latencies.append((time.perf_counter() - started) * 1000)
+            results.append([source.chunk_id for source in result.sources])
+
+        scoped_latencies = []
+        for query, subject in queries:
+            started = time.perf_counter()
+            retriever.query(query, subject_filter=subject)
+            scoped_latencies.append((time.perf_counter() - started) * 1000)
+
+        # Index size: files on disk, and RAM of freshly loaded indexes
+        index_dirs = [config.local_index_path]
+        if config.local_shards_path.is_dir():
+            index_dirs = sorted(config.local_shards_path.iterdir())
+        disk_bytes = sum(dir_size(path) for path in index_dirs)
+        tracemalloc.start()
+        loaded = [VectorIndex.load(path) for path in index_dirs]
+        ram_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        # Recall@k against exact brute force over the same embeddings
+        all_ids = [doc_id for index in loaded for doc_id in index.ids]
+        exact = np.asarray(
+            embedder([text for index in loaded for text in index.documents]), dtype=np.float64
+        )
+        exact /= np.maximum(np.linalg.norm(exact, axis=1, keepdims=True), 1e-12)
+        found = 0
+        for (query, _), ids in zip(queries, results, strict=True):
+            q = np.asarray(embedder([query])[0], dtype=np.float64)
+            q /= max(np.linalg.norm(q), 1e-12)
+            truth = {all_ids[i] for i in np.argsort(-(exact @ q), kind="stable")[:args.top_k]}
+            found += len(truth & set(ids))
+
+    return {
+        "config": {
+            "chunk_size": args.chunk_size,
+            "chunk_overlap": args.chunk_overlap,
+            "top_k": args.top_k,
+            "storage": args.storage,
+            "rescore_factor": args.rescore_factor,
+            "shard_by": args.shard_by,
+            "embedding_dim": args.embedding_dim,
+        },
+        "corpus": {
+            "documents": len(corpus),
+            "pages": len(corpus) * args.pages,
+            "bytes": corpus_bytes,
+            "chunks": chunks,
+            "queries": len(queries),
+            "seed": args.seed,
+        },
+        "ingest": {
+            "seconds": round(ingest_seconds, 3),
+            "chunks_per_second": round(chunks / ingest_seconds, 1),
+            "mb_per_second": round(corpus_bytes / ingest_seconds / 1e6, 3),
+        },
+        "query_latency": percentiles(latencies),
+        "scoped_query_latency": percentiles(scoped_latencies),
+        "index": {
+            "shards": len(loaded),
+            "disk_bytes": disk_bytes,
+            "ram_bytes": ram_bytes,
+            "search_bytes": sum(index.nbytes for index in loaded),
+        },
+        "recall_at_k": round(found / (args.top_k * len(queries)), 4),
+    }
+
+
+def main():
+    defaults = AthenaConfig.__dataclass_fields__
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--chunk-size", type=int, default=defaults["chunk_size"].default)
+    parser.add_argument("--chunk-overlap", type=int, default=defaults["chunk_overlap"].default)
+    parser.add_argument("--top-k", type=int, default=defaults["top_k"].default)
+    parser.add_argument("--storage", default=defaults["vector_storage"].default,
+                        choices=("float32", "float16", "int8"))
+    parser.add_argument("--rescore-factor", type=int, default=defaults["rescore_factor"].default)
+    parser.add_argument("--shard-by", default=defaults["shard_by"].default,
+                        choices=("none", "subject", "module"))
+    parser.add_argument("--embedding-dim", type=int, default=256)
+    parser.add_argument("--docs", type=int, default=40)
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Also write the JSON report here")
+    args = parser.parse_args()
+
+    report = json.dumps(run(args), indent=2)
+    print(report)
+    if args.output:
+        args.output.write_text(report + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
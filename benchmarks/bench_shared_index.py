@@ -0,0 +1,133 @@
+"""
+Shared-index memory report for multi-worker serving.
+
+Publishes one local index, then starts N worker processes (spawned, so
+nothing is inherited from the parent) that each load it and serve
+queries, as uvicorn workers would. Reports per-worker and total memory
+from /proc/<pid>/smaps_rollup (Linux) with the index memory-mapped
+versus read into RAM, and the time to hot-swap to a new version.
+
+PSS (proportional set size) splits shared pages between the processes
+that map them, so the PSS total is the real RAM cost of N workers.
+
+Usage:
+    python benchmarks/bench_shared_index.py [--workers 4] [--vectors 100000] [--dim 384]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from athena.vector_index import VectorIndex
+
+
+def memory_kb() -> dict:
+    """Rss, Pss and private memory of this process, in KiB."""
+    fields = {}
+    with open("/proc/self/smaps_rollup", encoding="utf-8") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1])
+    return {
+        "rss": fields.get("Rss", 0),
+        "pss": fields.get("Pss", 0),
+        "private": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+    }
+
+
+def worker(root: str, mmap: bool, queries: np.ndarray, ready, results) -> None:
+    baseline = memory_kb()
+    index = VectorIndex.load(Path(root), mmap=mmap)
+    for query in queries:
+        for row, _ in index.search(query, top_k=5):
+            index.documents[row]
+
+    # Measure once every worker has loaded, so shared pages are counted
+    # against all of them
+    ready.wait()
+    after = memory_kb()
+    results.put({key: after[key] - baseline[key] for key in after})
+    ready.wait()
+
+
+def run_workers(root: Path, workers: int, mmap: bool, queries: np.ndarray) -> dict:
+    ctx = multiprocessing.get_context("spawn")
+    ready = ctx.Barrier(workers)
+    results = ctx.Queue()
+    processes = [
+        ctx.Process(target=worker, args=(str(root), mmap, queries, ready, results))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    samples = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+
+    return {
+        "per_worker_rss_mb": round(np.mean([s["rss"] for s in samples]) / 1024, 1),
+        "per_worker_private_mb": round(np.mean([s["private"] for s in samples]) / 1024, 1),
+        "total_pss_mb": round(sum(s["pss"] for s in samples) / 1024, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--vectors", type=int, default=100_000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--storage", default="float32", choices=("float32", "float16", "int8"))
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    vectors = rng.normal(size=(args.vectors, args.dim)).astype(np.float32)
+    queries = rng.normal(size=(args.queries, args.dim)).astype(np.float32)
+
+    index = VectorIndex(args.dim, storage=args.storage)
+    index.add(
+        [str(i) for i in range(args.vectors)],
+        vectors,
+        documents=[f"Chunk {i}. " + "lorem ipsum dolor sit amet " * 15 for i in range(args.vectors)],
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "index"
+        index.save(root)
+        index_bytes = sum(f.stat().st_size for f in root.rglob("*") if f.is_file())
+
+        report = {
+            "workers": args.workers,
+            "vectors": args.vectors,
+            "dim": args.dim,
+            "storage": args.storage,
+            "index_mb": round(index_bytes / 2**20, 1),
+            "in_ram": run_workers(root, args.workers, False, queries),
+            "mmap": run_workers(root, args.workers, True, queries),
+        }
+
+        # Hot-swap: publish a new version and time a reader's switch
+        reader = VectorIndex.load(root)
+        index.add(["new"], vectors[:1], documents=["new chunk"])
+        index.save(root)
+        started = time.perf_counter()
+        reader = VectorIndex.load(root)
+        report["hot_swap_load_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        report["hot_swap_version"] = reader.version
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Cold-start time of the HEARTH entry point.
+
+Starts fresh interpreters that do what a status command does: import
+main.py's module graph, construct the agent and answer one
+deterministic request. Reports wall time per process (interpreter start
+included) and the in-process split, checked against a one-second
+target. With --profile, one extra run records the import tree and lists
+the modules with the highest self time.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 5] [--profile]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TARGET_MS = 1000
+
+STATUS = """
+import time
+started = time.perf_counter()
+import main
+from hestia.agent import HestiaAgent
+imported = time.perf_counter()
+agent = HestiaAgent({"enable_athena": False, "memory_db_path": %(db)r})
+constructed = time.perf_counter()
+import asyncio
+asyncio.run(agent.process("hello"))
+answered = time.perf_counter()
+import json
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "construct_ms": (constructed - imported) * 1000,
+    "first_request_ms": (answered - constructed) * 1000,
+}))
+"""
+
+PROFILE = """
+from core.import_profile import ImportProfiler
+profiler = ImportProfiler().start()
+import main
+profiler.stop()
+import json
+print(json.dumps({
+    "total_ms": profiler.total_ms(),
+    "slowest": {r.name: round(r.self_ms, 1) for r in profiler.slowest(%(limit)d)},
+}))
+"""
+
+
+def run(code: str) -> tuple:
+    started = time.perf_counter()
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    wall_ms = (time.perf_counter() - started) * 1000
+    return wall_ms, json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--profile", action="store_true", help="Also list the slowest imports")
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    db = os.path.join(ROOT, "data", "bench_startup.db")
+    walls, phases = [], []
+    try:
+        for _ in range(args.runs):
+            wall_ms, split = run(STATUS % {"db": db})
+            walls.append(wall_ms)
+            phases.append(split)
+    finally:
+        if os.path.exists(db):
+            os.remove(db)
+
+    report = {
+        "runs": args.runs,
+        "target_ms": TARGET_MS,
+        "wall_p50_ms": round(float(np.percentile(walls, 50)), 1),
+        "wall_max_ms": round(max(walls), 1),
+        "within_target": max(walls) < TARGET_MS,
+    }
+    for key in ("import_ms", "construct_ms", "first_request_ms"):
+        report[key.replace("_ms", "_p50_ms")] = round(
+            float(np.percentile([split[key] for split in phases], 50)), 1
+        )
+
+    if args.profile:
+        _, profile = run(PROFILE % {"limit": args.limit})
+        report["profiled_import_ms"] = round(profile["total_ms"], 1)
+        report["slowest_imports"] = profile["slowest"]
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+Startup import profiler.
+
+Records how long each module's body takes to execute, as a tree of who
+imported whom, so slow startup can be traced to the import that causes
+it. Works like `python -X importtime` but from inside the process: it
+can be switched on by the entry point, and it keeps recording after
+startup, so deferred imports show up at the point of first use.
+
+Enabled with `--profile-imports` on main.py or HEARTH_PROFILE_IMPORTS=1.
+It hooks sys.meta_path rather than builtins.__import__, so it does not
+interfere with the Artemis import guard.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from importlib.abc import MetaPathFinder
+from typing import Any, Dict, List, Optional, Sequence
+
+ENV_VAR = "HEARTH_PROFILE_IMPORTS"
+ARGV_FLAG = "--profile-imports"
+
+
+@dataclass
+class ImportRecord:
+    """One module import and the imports made while executing it."""
+    name: str
+    total_ms: float = 0.0
+    children: List["ImportRecord"] = field(default_factory=list)
+
+    @property
+    def self_ms(self) -> float:
+        """Time in this module's own body, excluding nested imports."""
+        return self.total_ms - sum(child.total_ms for child in self.children)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "module": self.name,
+            "total_ms": round(self.total_ms, 3),
+            "self_ms": round(self.self_ms, 3),
+            "children": [child.to_dict() for child in self.children],
+        }
+
+
+class _TimedLoader:
+    """Wraps a module loader, timing exec_module; everything else is forwarded."""
+
+    def __init__(self, loader: Any, profiler: "ImportProfiler"):
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        record = self._profiler._enter(module.__name__)
+        started = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            record.total_ms = (time.perf_counter() - started) * 1000
+            self._profiler._exit()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+
+class ImportProfiler(MetaPathFinder):
+    """
+    Meta path finder that times every module import while started.
+
+    Finding is delegated to the finders behind it; only the loader of the
+    resulting spec is wrapped.
+    """
+
+    def __init__(self):
+        self.roots: List[ImportRecord] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._started_at: Optional[float] = None
+
+    @property
+    def active(self) -> bool:
+        return self in sys.meta_path
+
+    def start(self) -> "ImportProfiler":
+        """Start recording imports."""
+        if not self.active:
+            sys.meta_path.insert(0, self)
+            self._started_at = time.perf_counter()
+        return self
+
+    def stop(self) -> None:
+        """Stop recording; records made so far are kept."""
+        if self.active:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname: str, path: Optional[Sequence[str]], target: Any = None):
+        if getattr(self._local, "finding", False):
+            return None
+
+        self._local.finding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._local.finding = False
+
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self)
+        return spec
+
+    def _stack(self) -> List[ImportRecord]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _enter(self, name: str) -> ImportRecord:
+        record = ImportRecord(name)
+        stack = self._stack()
+        if stack:
+            stack[-1].children.append(record)
+        else:
+            with self._lock:
+                self.roots.append(record)
+        stack.append(record)
+        return record
+
+    def _exit(self) -> None:
+        self._stack().pop()
+
+    def total_ms(self) -> float:
+        """Time spent in top-level imports."""
+        with self._lock:
+            return sum(record.total_ms for record in self.roots)
+
+    def slowest(self, limit: int = 10) -> List[ImportRecord]:
+        """Modules with the highest self time."""
+        records = []
+        pending = list(self.roots)
+        while pending:
+            record = pending.pop()
+            records.append(record)
+            pending.extend(record.children)
+        return sorted(records, key=lambda record: -record.self_ms)[:limit]
+
+    def report(self, min_ms: float = 1.0) -> str:
+        """
+        Format the import tree, hiding subtrees faster than min_ms.
+
+        Args:
+            min_ms: Cumulative time below which a module is left out
+
+        Returns:
+            Multi-line report, one module per line
+        """
+        lines = [
+            f"Imports: {self.total_ms():.1f} ms in {len(self.roots)} top-level imports",
+            f"{'total ms':>10} {'self ms':>10}  module",
+        ]
+
+        def walk(record: ImportRecord, depth: int) -> None:
+            if record.total_ms < min_ms:
+                return
+            lines.append(
+                f"{record.total_ms:>10.1f} {record.self_ms:>10.1f}  {'  ' * depth}{record.name}"
+            )
+            for child in record.children:
+                walk(child, depth + 1)
+
+        for record in list(self.roots):
+            walk(record, 0)
+        return "\n".join(lines)
+
+
+def start_if_requested(argv: Optional[Sequence[str]] = None) -> Optional[ImportProfiler]:
+    """
+    Start an import profiler if the command line or environment asks for one.
+
+    Called by entry points before their own imports, so argument parsing
+    (which happens later) cannot be used for the flag.
+
+    Args:
+        argv: Command line to check for --profile-imports (default: sys.argv)
+
+    Returns:
+        The started profiler, or None
+    """
+    argv = sys.argv if argv is None else argv
+    if ARGV_FLAG in argv or os.environ.get(ENV_VAR, "") not in ("", "0"):
+        return ImportProfiler().start()
+    return None
@@ -0,0 +1,236 @@
+"""
+Lazy, once-only construction of expensive subsystems.
+
+A class declares each subsystem as a method decorated with @subsystem.
+The first access builds it (under a per-instance, per-name lock, so
+concurrent first accesses build it exactly once) and stores it on the
+instance; later accesses are plain attribute lookups. Build times are
+recorded for startup reporting.
+
+Assigning the attribute replaces the subsystem without building it,
+which keeps test doubles and backward-compatible setters working.
+
+Heavy third-party modules are deferred the same way with lazy_import:
+the module is imported on first attribute access, so only the code
+paths that use it pay for it.
+"""
+from __future__ import annotations
+
+import importlib.util
+import sys
+import threading
+import time
+import types
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional
+
+_LOCKS_ATTR = "_subsystem_locks"
+_TIMINGS_ATTR = "_subsystem_timings"
+_locks_guard = threading.Lock()
+
+# Every module name passed to lazy_import. Artemis snapshots this when it
+# installs its import guard, so deferred modules declared at import time
+# may still load later; anything declared after that stays blocked.
+_deferred_names: set[str] = set()
+
+# Module a DeferredModule is importing on this thread. The Artemis guard
+# lets a deferred name through only while its DeferredModule loads it,
+# not on any later plain import of the same name.
+_resolving = threading.local()
+
+
+class subsystem:
+    """
+    Decorator for a method that builds a lazily constructed subsystem.
+
+    Like functools.cached_property, but thread-safe and timed.
+    """
+
+    def __init__(self, factory: Callable[[Any], Any]):
+        self.factory = factory
+        self.name = factory.__name__
+        self.__doc__ = factory.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+
+        # Non-data descriptor: once built, the instance attribute shadows
+        # this and lookups never get here
+        values = instance.__dict__
+        if self.name in values:
+            return values[self.name]
+
+        with _lock_for(instance, self.name):
+            if self.name in values:
+                return values[self.name]
+
+            started = time.perf_counter()
+            value = self.factory(instance)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+
+            values[self.name] = value
+            values.setdefault(_TIMINGS_ATTR, {})[self.name] = round(elapsed_ms, 3)
+            return value
+
+
+def _lock_for(instance: Any, name: str) -> threading.RLock:
+    with _locks_guard:
+        locks = instance.__dict__.setdefault(_LOCKS_ATTR, {})
+        lock = locks.get(name)
+        if lock is None:
+            # Reentrant, so a factory that recursively needs itself fails
+            # with RecursionError instead of deadlocking
+            lock = locks[name] = threading.RLock()
+        return lock
+
+
+def is_built(instance: Any, name: str) -> bool:
+    """True if the subsystem has been built (or assigned)."""
+    return name in instance.__dict__
+
+
+def subsystem_timings(instance: Any) -> Dict[str, float]:
+    """Milliseconds spent building each subsystem built so far."""
+    return dict(instance.__dict__.get(_TIMINGS_ATTR, {}))
+
+
+def subsystem_names(cls: type) -> list[str]:
+    """Names of the @subsystem attributes declared on a class."""
+    names = []
+    for klass in reversed(cls.__mro__):
+        for name, value in vars(klass).items():
+            if isinstance(value, subsystem) and name not in names:
+                names.append(name)
+    return names
+
+
+def prewarm(
+    instance: Any,
+    names: Iterable[str],
+    background: bool = True,
+) -> Optional[threading.Thread]:
+    """
+    Build subsystems ahead of first use.
+
+    Args:
+        instance: Object declaring the subsystems
+        names: Subsystems to build, in order
+        background: Build on a daemon thread instead of blocking
+
+    Returns:
+        The prewarm thread, if one was started
+
+    Raises:
+        ValueError: If a name is not a subsystem of the instance
+    """
+    names = list(names)
+    unknown = set(names) - set(subsystem_names(type(instance)))
+    if unknown:
+        raise ValueError(f"Unknown subsystems: {sorted(unknown)}")
+    if not names:
+        return None
+
+    def build() -> None:
+        for name in names:
+            try:
+                getattr(instance, name)
+            except Exception:
+                # Left unbuilt; first use raises the error where it can be handled
+                pass
+
+    if not background:
+        build()
+        return None
+
+    thread = threading.Thread(target=build, name="subsystem-prewarm", daemon=True)
+    thread.start()
+    return thread
+
+
+class DeferredModule(types.ModuleType):
+    """Stand-in for a module that is imported on first attribute access."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_deferred_module"] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_deferred_module"]
+        if module is None:
+            module = sys.modules.get(self.__name__)
+        if module is None:
+            # A plain import statement equivalent, marked as this
+            # placeholder's resolution so the Artemis guard allows it
+            _resolving.name = self.__name__
+            try:
+                __import__(self.__name__)
+            finally:
+                _resolving.name = None
+            module = sys.modules[self.__name__]
+        self.__dict__["_deferred_module"] = module
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __dir__(self) -> list[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_deferred_module"] is not None else "deferred"
+        return f"<module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name: str) -> DeferredModule:
+    """
+    Defer importing a module until it is first used.
+
+    Call at module level, like the import it replaces:
+
+        chromadb = lazy_import("chromadb")
+
+    Import errors surface at first use rather than here; check
+    module_available() first for optional dependencies.
+
+    Args:
+        name: Absolute module name
+
+    Returns:
+        Placeholder that forwards attribute access to the real module
+    """
+    _deferred_names.add(name)
+    module = sys.modules.get(name)
+    deferred = DeferredModule(name)
+    if module is not None:
+        deferred.__dict__["_deferred_module"] = module
+    return deferred
+
+
+def is_loaded(module: Any) -> bool:
+    """True unless module is a DeferredModule that has not been imported yet."""
+    if isinstance(module, DeferredModule):
+        return module.__dict__["_deferred_module"] is not None
+    return True
+
+
+def module_available(name: str) -> bool:
+    """True if a top-level module can be imported, without importing it."""
+    if name in sys.modules:
+        return True
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def deferred_imports() -> FrozenSet[str]:
+    """Names of all modules declared with lazy_import so far."""
+    return frozenset(_deferred_names)
+
+
+def resolving_import() -> Optional[str]:
+    """Module a DeferredModule on this thread is importing right now, if any."""
+    return getattr(_resolving, "name", None)
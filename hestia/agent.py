@@ -18,8 +18,10 @@ ENABLED IN v0.2:
 """
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
@@ -36,8 +38,11 @@ from artemis.security_summary import SecuritySummary
 from artemis.plan_compiler import PlanCompiler, PlanDraft, StepParseError, ValidationError
 
 from athena.service import AthenaService
+from core.lazy import is_built, prewarm, subsystem, subsystem_timings
+from .context_engine import ContextSessions
 from .intent_classifier import IntentClassifier
 from .ollama_client import OllamaClient
+from .response_cache import ResponseCache
 from domains.hephaestus.service import HephaestusService
 from domains.hermes.service import HermesService
 from domains.apollo.service import ApolloService
@@ -51,6 +56,11 @@ MAX_MEMORY_CHARS = 2000  # Max total characters for memory block
 MAX_LLM_CONTEXT_CHARS = 8000  # Max prompt size before user warning
 EXCERPT_MAX_CHARS = 200  # Max chars per memory or knowledge excerpt
 
+# Blocking handler bounds (overridable via config)
+HANDLER_WORKERS = 8  # Threads shared by all domain and store handlers
+HANDLER_CONCURRENCY = 4  # Max running handlers per intent
+HANDLER_DEADLINE = 10.0  # Seconds before the user gets a timeout reply
+
 
 class AgentResponse(BaseModel):
     """Agent response with optional memory confirmation."""
@@ -62,6 +72,27 @@ class AgentResponse(BaseModel):
     memory_saved: bool = False  # Track if memory was saved
 
 
+class AgentStreamChunk(BaseModel):
+    """One piece of a streamed agent response."""
+    response_id: str
+    text: str  # Text added by this chunk
+    intent: str = "general"
+    done: bool = False  # Set on the last chunk
+
+
+# Intents answered by a domain or store handler, never by the LLM
+DIRECT_INTENTS = frozenset({
+    "memory_query",
+    "knowledge_query",
+    "hephaestus_query",
+    "hermes_query",
+    "apollo_query",
+    "dionysus_query",
+    "pluto_query",
+    "athena_query",
+})
+
+
 class HestiaAgent:
     """
     Hestia agent with optional LLM reasoning and memory.
@@ -82,76 +113,145 @@ class HestiaAgent:
     def __init__(self, config: Optional[Dict[str, Any]] = None, kernel: Optional[Any] = None):
         config = config or {}
         
+        self._config = config
         self.intent_classifier = IntentClassifier()
         self.enable_llm = config.get("enable_llm", False)
         self.enable_memory = config.get("enable_memory", False)
         self.enable_athena = config.get("enable_athena", True)
         self._kernel = kernel  # Kernel reference for policy visibility
         
-        # # LLM reasoning → plan
-        # # No execution authority
-        # # No autonomy
-        # # Fail-closed
-        self._plan_compiler = PlanCompiler(kernel=kernel)
-        
-        # Optional LLM client
-        self.llm_client: Optional[OllamaClient] = None
-        if self.enable_llm:
-            self.llm_client = OllamaClient(
-                base_url=config.get("ollama_url", "http://localhost:11434"),
-                model=config.get("ollama_model", "mistral:latest"),
-                timeout=config.get("ollama_timeout", 60)
+        # Domain and store handlers are synchronous; they run on a bounded
+        # thread pool so a slow one doesn't stall the event loop
+        self.offload_handlers = config.get("offload_handlers", True)
+        self._handler_workers = config.get("handler_workers", HANDLER_WORKERS)
+        self._handler_concurrency = config.get("handler_concurrency", {})
+        self._handler_deadline = config.get("handler_deadline", HANDLER_DEADLINE)
+        self._handler_deadlines = config.get("handler_deadlines", {})
+        self._handler_executor: Optional[ThreadPoolExecutor] = None
+        self._handler_limits: Dict[str, asyncio.Semaphore] = {}
+        self.handler_timeouts = 0
+        
+        self._llm_initialized = False
+        
+        # Subsystems below are built on first use; config["prewarm"]
+        # names any to build now on a background thread
+        self._prewarm_thread = prewarm(self, config.get("prewarm", []))
+    
+    # ========================================================================
+    # SUBSYSTEMS (built on first use, once, thread-safe)
+    # ========================================================================
+    
+    @subsystem
+    def _plan_compiler(self) -> PlanCompiler:
+        """LLM reasoning → plan. No execution authority, no autonomy, fail-closed."""
+        return PlanCompiler(kernel=self._kernel)
+    
+    @subsystem
+    def llm_client(self) -> Optional[OllamaClient]:
+        """Optional LLM client (None unless enable_llm)."""
+        if not self.enable_llm:
+            return None
+        
+        config = self._config
+        # Opt-in response cache; only used for deterministic options
+        # (e.g. ollama_options={"temperature": 0})
+        llm_cache = None
+        if config.get("llm_cache_path"):
+            llm_cache = ResponseCache(
+                config["llm_cache_path"],
+                max_bytes=config.get("llm_cache_max_bytes", 32 * 1024 * 1024)
             )
+        return OllamaClient(
+            base_url=config.get("ollama_url", "http://localhost:11434"),
+            model=config.get("ollama_model", "mistral:latest"),
+            timeout=config.get("ollama_timeout", 60),
+            max_concurrency=config.get("ollama_max_concurrency", 1),
+            max_queue=config.get("ollama_max_queue", 8),
+            options=config.get("ollama_options"),
+            cache=llm_cache,
+            keep_alive=config.get("ollama_keep_alive", "30m")
+        )
+    
+    @subsystem
+    def memory_service(self) -> Any:
+        """
+        Memory service (Mnemosyne).
         
-        # Memory service (Mnemosyne) - always initialized
-        # BUG-2.1 FIX: Never None; always returns a service (possibly disabled)
-        # Guarantee: memory_service.read() never raises AttributeError
+        BUG-2.1 FIX: Never None; always returns a service (possibly disabled)
+        Guarantee: memory_service.read() never raises AttributeError
+        """
         from mnemosyne.service import MnemosyneService
         from mnemosyne.service_config import MnemosyneConfig
         
         memory_config = MnemosyneConfig(
             enabled=self.enable_memory,
-            db_path=config.get("memory_db_path", "./data/memory.db")
+            db_path=self._config.get("memory_db_path", "./data/memory.db")
         )
-        self.memory_service = MnemosyneService(config=memory_config)
-        self.memory_store = None  # Backward compatibility
-        # Expose the underlying store for backward compatibility
-        if self.memory_service.memory_store:
-            self.memory_store = self.memory_service.memory_store
-        
-        # Optional knowledge retriever (v0.1 knowledge system)
-        self.knowledge_retriever = None
-        if self.enable_athena:
-            from athena.knowledge_store import KnowledgeStore
-            self.knowledge_retriever = KnowledgeStore(
-                store_path=config.get("knowledge_path", "./data/knowledge.json")
-            )
-
-        # Athena service (knowledge base search, read-only, intent-gated)
+        return MnemosyneService(config=memory_config)
+    
+    @subsystem
+    def memory_store(self) -> Any:
+        """Underlying store of memory_service, exposed for backward compatibility."""
+        return self.memory_service.memory_store or None
+    
+    @subsystem
+    def knowledge_retriever(self) -> Any:
+        """Optional knowledge retriever (v0.1 knowledge system)."""
+        if not self.enable_athena:
+            return None
+        
+        from athena.knowledge_store import KnowledgeStore
+        return KnowledgeStore(
+            store_path=self._config.get("knowledge_path", "./data/knowledge.json")
+        )
+    
+    @subsystem
+    def athena(self) -> AthenaService:
+        """Athena service (knowledge base search, read-only, intent-gated)."""
         from athena.config import AthenaConfig
         athena_config = AthenaConfig(
-            enabled=config.get("enable_athena", False),
-            data_dir=config.get("athena_data_dir", "./data/notes"),
-            index_dir=config.get("athena_index_dir", "./.athena_index"),
+            enabled=self._config.get("enable_athena", False),
+            data_dir=self._config.get("athena_data_dir", "./data/notes"),
+            index_dir=self._config.get("athena_index_dir", "./.athena_index"),
         )
-        self.athena = AthenaService(config=athena_config)
-        
-        # Hephaestus domain (code reasoning, deterministic)
-        self.hephaestus = HephaestusService()
-        
-        # Hermes domain (text transformation, deterministic)
-        self.hermes = HermesService()
-        
-        # Apollo domain (health/wellness information, deterministic)
-        self.apollo = ApolloService()
-        
-        # Dionysus domain (music/art/culture information, deterministic)
-        self.dionysus = DionysusService()
-        
-        # Pluto domain (financial/economic concepts information, deterministic)
-        self.pluto = PlutoService()
-        
-        self._llm_initialized = False
+        return AthenaService(config=athena_config)
+    
+    @subsystem
+    def hephaestus(self) -> HephaestusService:
+        """Hephaestus domain (code reasoning, deterministic)."""
+        return HephaestusService()
+    
+    @subsystem
+    def hermes(self) -> HermesService:
+        """Hermes domain (text transformation, deterministic)."""
+        return HermesService()
+    
+    @subsystem
+    def apollo(self) -> ApolloService:
+        """Apollo domain (health/wellness information, deterministic)."""
+        return ApolloService()
+    
+    @subsystem
+    def dionysus(self) -> DionysusService:
+        """Dionysus domain (music/art/culture information, deterministic)."""
+        return DionysusService()
+    
+    @subsystem
+    def pluto(self) -> PlutoService:
+        """Pluto domain (financial/economic concepts information, deterministic)."""
+        return PlutoService()
+    
+    @subsystem
+    def sessions(self) -> ContextSessions:
+        """Per-session contexts (explicit writes only, LRU/TTL bounded)."""
+        return ContextSessions(
+            max_sessions=self._config.get("max_sessions", ContextSessions.DEFAULT_MAX_SESSIONS),
+            ttl_seconds=self._config.get("session_ttl_seconds"),
+        )
+    
+    def startup_timings(self) -> Dict[str, float]:
+        """Milliseconds spent building each subsystem built so far."""
+        return subsystem_timings(self)
     
     async def initialize(self) -> None:
         """Initialize LLM client if enabled."""
@@ -171,10 +271,32 @@ class HestiaAgent:
                 print("Falling back to deterministic responses.")
                 self.enable_llm = False
     
+    async def warm_up(self) -> Optional[float]:
+        """
+        Preload the LLM so the first chat doesn't pay the model-load time.
+        
+        Returns:
+            Warm-up time in milliseconds, or None if the LLM is off or
+            the warm-up failed (the first request then loads the model)
+        """
+        if not (self.enable_llm and self._llm_initialized):
+            return None
+        
+        try:
+            return await self.llm_client.warm_up()
+        except Exception as e:
+            print(f"WARNING: Ollama warm-up failed: {e}")
+            return None
+    
     async def cleanup(self) -> None:
-        """Cleanup LLM client if initialized."""
+        """Cleanup LLM client if initialized, the handler pool and session contexts."""
         if self.llm_client and self._llm_initialized:
             await self.llm_client.cleanup()
+        if is_built(self, "sessions"):
+            self.sessions.clear()
+        if self._handler_executor:
+            self._handler_executor.shutdown(wait=False)
+            self._handler_executor = None
     
     def current_security_posture(self) -> LockdownPolicy:
         """
@@ -267,7 +389,7 @@ class HestiaAgent:
         
         # Handle explicit memory query (NEVER goes through LLM)
         if intent == "memory_query":
-            response_text = self._handle_memory_query()
+            response_text = await self._run_handler(intent, self._handle_memory_query)
             return AgentResponse(
                 text=response_text,
                 intent=intent,
@@ -276,7 +398,7 @@ class HestiaAgent:
 
         # Handle explicit knowledge query (NO LLM, read-only lookup)
         if intent == "knowledge_query":
-            response_text = self._handle_knowledge_query(user_input)
+            response_text = await self._run_handler(intent, self._handle_knowledge_query, user_input)
             return AgentResponse(
                 text=response_text,
                 intent=intent,
@@ -285,7 +407,7 @@ class HestiaAgent:
         
         # Handle Hephaestus domain (code reasoning, NO LLM, deterministic)
         if intent == "hephaestus_query":
-            response_text = self._handle_hephaestus_query(user_input)
+            response_text = await self._run_handler(intent, self._handle_hephaestus_query, user_input)
             return AgentResponse(
                 text=response_text,
                 intent=intent,
@@ -294,7 +416,7 @@ class HestiaAgent:
         
         # Handle Hermes domain (text transformation, NO LLM, deterministic)
         if intent == "hermes_query":
-            response_text = self._handle_hermes_query(user_input)
+            response_text = await self._run_handler(intent, self._handle_hermes_query, user_input)
             return AgentResponse(
                 text=response_text,
                 intent=intent,
@@ -303,7 +425,7 @@ class HestiaAgent:
         
         # Handle Apollo domain (health/wellness information, NO LLM, deterministic)
         if intent == "apollo_query":
-            response_text = self._handle_apollo_query(user_input)
+            response_text = await self._run_handler(intent, self._handle_apollo_query, user_input)
             return AgentResponse(
                 text=response_text,
                 intent=intent,
@@ -312,7 +434,7 @@ class HestiaAgent:
         
         # Handle Dionysus domain (music/art/culture information, NO LLM, deterministic)
         if intent == "dionysus_query":
-            response_text = self._handle_dionysus_query(user_input)
+            response_text = await self._run_handler(intent, self._handle_dionysus_query, user_input)
             return AgentResponse(
                 text=response_text,
                 intent=intent,
@@ -321,7 +443,7 @@ class HestiaAgent:
         
         # Handle Pluto domain (financial/economic concepts information, NO LLM, deterministic)
         if intent == "pluto_query":
-            response_text = self._handle_pluto_query(user_input)
+            response_text = await self._run_handler(intent, self._handle_pluto_query, user_input)
             return AgentResponse(
                 text=response_text,
                 intent=intent,
@@ -330,7 +452,7 @@ class HestiaAgent:
         
         # Handle Athena domain (knowledge base search, NO LLM, read-only)
         if intent == "athena_query":
-            response_text = self._handle_athena_query(user_input)
+            response_text = await self._run_handler(intent, self._handle_athena_query, user_input)
             return AgentResponse(
                 text=response_text,
                 intent=intent,
@@ -349,6 +471,74 @@ class HestiaAgent:
             confidence=0.8
         )
 
+    async def process_stream(self, user_input: Any) -> AsyncIterator[AgentStreamChunk]:
+        """
+        Process input like process(), streaming LLM output as it arrives.
+        
+        Domain and store intents, and deterministic responses, produce a
+        single chunk. LLM responses produce one chunk per piece of text
+        Ollama sends, then an empty chunk with done=True.
+        
+        Args:
+            user_input: Raw text input from user, or an interface's
+                UserInput (text plus session_id, user_id, metadata)
+            
+        Yields:
+            AgentStreamChunk objects sharing one response_id
+        """
+        user_input = getattr(user_input, "text", user_input)
+        intent = self.intent_classifier.classify(user_input)
+        
+        if intent in DIRECT_INTENTS or not (self.enable_llm and self._llm_initialized):
+            response = await self.process(user_input)
+            yield AgentStreamChunk(
+                response_id=response.response_id,
+                text=response.text,
+                intent=response.intent,
+                done=True
+            )
+            return
+        
+        response_id = str(uuid4())
+        async for text in self._stream_llm_response(intent, user_input):
+            yield AgentStreamChunk(response_id=response_id, text=text, intent=intent)
+        yield AgentStreamChunk(response_id=response_id, text="", intent=intent, done=True)
+
+    async def _run_handler(self, intent: str, handler: Callable[..., str], *args: Any) -> str:
+        """
+        Run a synchronous handler on the handler pool.
+        
+        At most handler_concurrency[intent] (default HANDLER_CONCURRENCY)
+        handlers of one intent run at once, so one slow domain cannot take
+        every thread. The deadline covers waiting for a slot and running;
+        past it the user gets a timeout reply. The thread cannot be
+        interrupted, so its slot stays taken until it actually finishes.
+        """
+        if not self.offload_handlers:
+            return handler(*args)
+        
+        limit = self._handler_limits.get(intent)
+        if limit is None:
+            limit = asyncio.Semaphore(self._handler_concurrency.get(intent, HANDLER_CONCURRENCY))
+            self._handler_limits[intent] = limit
+        if self._handler_executor is None:
+            self._handler_executor = ThreadPoolExecutor(
+                max_workers=self._handler_workers,
+                thread_name_prefix="hestia-handler"
+            )
+        
+        deadline = self._handler_deadlines.get(intent, self._handler_deadline)
+        loop = asyncio.get_running_loop()
+        try:
+            async with asyncio.timeout(deadline):
+                await limit.acquire()
+                future = loop.run_in_executor(self._handler_executor, handler, *args)
+                future.add_done_callback(lambda _: limit.release())
+                return await asyncio.shield(future)
+        except TimeoutError:
+            self.handler_timeouts += 1
+            return f"Sorry, that took too long (over {deadline}s). Please try again."
+    
     def should_use_memory_for_context(self, user_input: str) -> bool:
         """Return True only when user explicitly asks to use past memories."""
         if not (self.enable_memory and self.memory_store):
@@ -719,11 +909,13 @@ class HestiaAgent:
             print(f"ERROR: Failed to save memory: {e}")
             return False
     
-    async def _generate_llm_response(self, intent: str, user_input: str) -> str:
-        """Generate response using LLM with strict context bounds and transparency."""
-        if not self.llm_client:
-            return self._generate_deterministic_response(intent, user_input)
+    def _build_llm_prompt(self, intent: str, user_input: str) -> Tuple[str, str, str]:
+        """
+        Build the LLM request with strict context bounds.
         
+        Returns:
+            (prompt, system_prompt, truncation_notice)
+        """
         # Construct system prompt based on intent
         system_prompt = self._build_system_prompt(intent)
         prompt = user_input
@@ -750,6 +942,15 @@ class HestiaAgent:
             else:
                 prompt = prompt[:max_user_size]
         
+        return prompt, system_prompt, truncation_notice
+    
+    async def _generate_llm_response(self, intent: str, user_input: str) -> str:
+        """Generate response using LLM with strict context bounds and transparency."""
+        if not self.llm_client:
+            return self._generate_deterministic_response(intent, user_input)
+        
+        prompt, system_prompt, truncation_notice = self._build_llm_prompt(intent, user_input)
+        
         try:
             response = await self.llm_client.generate(
                 prompt=prompt,
@@ -764,6 +965,29 @@ class HestiaAgent:
             # Explicit failure handling
             return f"LLM error: {e}\n\nFallback: {self._generate_deterministic_response(intent, user_input)}"
     
+    async def _stream_llm_response(self, intent: str, user_input: str) -> AsyncIterator[str]:
+        """Stream an LLM response with the same bounds and failure handling."""
+        if not self.llm_client:
+            yield self._generate_deterministic_response(intent, user_input)
+            return
+        
+        prompt, system_prompt, truncation_notice = self._build_llm_prompt(intent, user_input)
+        
+        stream = self.llm_client.generate_stream(prompt=prompt, system_prompt=system_prompt)
+        try:
+            async for text in stream:
+                yield text
+        except Exception as e:
+            # Explicit failure handling, after whatever was already sent
+            yield f"\nLLM error: {e}\n\nFallback: {self._generate_deterministic_response(intent, user_input)}"
+            return
+        finally:
+            # Close the Ollama stream promptly if our consumer went away
+            await stream.aclose()
+        
+        if truncation_notice:
+            yield truncation_notice
+    
     def _build_system_prompt(self, intent: str) -> str:
         """Build minimal system prompt based on intent."""
         base = "You are Hestia, a helpful personal assistant. "
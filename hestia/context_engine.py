@@ -3,20 +3,48 @@ Stage-2 Context Engine v1
 
 RAM-only, volatile, deterministic context for cross-domain pipelines.
 - TTL: 900-1800 seconds
-- Size: 1 context per process, max 20 entries, 4096 tokens total
+- Size: max 20 entries, 4096 tokens total per context
+- One context per session, held in a bounded LRU session map
 - No persistence, no sliding expiration, fail-closed on errors
 - Domains receive read-only snapshots only
+- Pipelines execute left to right; completed steps are memoized so a
+  retry only re-executes steps whose inputs changed
+
+Context events are logged as JSON at DEBUG, sampled one in
+LOG_SAMPLE_EVERY per event type; rejections are logged at ERROR
+every time.
 """
 
+import hashlib
+import heapq
+import inspect
+import itertools
 import json
 import logging
+import sys
+import threading
+from collections import OrderedDict, defaultdict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Log one in this many occurrences of each context event
+LOG_SAMPLE_EVERY = 100
+
+_event_counters: Dict[str, "itertools.count"] = defaultdict(itertools.count)
+
+
+def _log_event(event: Dict[str, Any]) -> None:
+    """Log a sampled context event at DEBUG (JSON built only if it is logged)."""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    if next(_event_counters[event["event"]]) % LOG_SAMPLE_EVERY:
+        return
+    logger.debug(json.dumps({**event, "sampled_every": LOG_SAMPLE_EVERY}))
+
 
 class ContextState(str, Enum):
     """Context lifecycle states."""
@@ -83,11 +111,106 @@ class ContextEntry:
         return asdict(self)
 
 
+class StepMemo:
+    """
+    Memo table of completed pipeline step outputs.
+
+    Keyed by (domain, step input hash, context hash, policy epoch). The
+    step input hash covers the method, its args and the output of the
+    previous step, so a re-run reuses every step whose inputs are
+    unchanged and executes the rest. Failed steps are never stored.
+
+    RAM-only and bounded; least recently used entries are evicted.
+    """
+
+    DEFAULT_MAX_ENTRIES = 1024
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._outputs: "OrderedDict[Tuple[str, str, str, int], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str, str, int]) -> Tuple[bool, Any]:
+        """Return (found, output) for a step key."""
+        with self._lock:
+            if key not in self._outputs:
+                self.misses += 1
+                return False, None
+            self._outputs.move_to_end(key)
+            self.hits += 1
+            return True, self._outputs[key]
+
+    def put(self, key: Tuple[str, str, str, int], output: Any) -> None:
+        """Store a completed step's output."""
+        with self._lock:
+            self._outputs[key] = output
+            self._outputs.move_to_end(key)
+            while len(self._outputs) > self.max_entries:
+                self._outputs.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every stored output."""
+        with self._lock:
+            self._outputs.clear()
+
+    def __len__(self) -> int:
+        return len(self._outputs)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get memo statistics."""
+        return {
+            "entries": len(self._outputs),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def _is_json_native(value: Any) -> bool:
+    """True if value round-trips through JSON unchanged (str keys, no tuples)."""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return True
+    if isinstance(value, list):
+        return all(_is_json_native(item) for item in value)
+    if isinstance(value, dict):
+        return all(isinstance(key, str) and _is_json_native(item) for key, item in value.items())
+    return False
+
+
+def _digest(value: Any) -> Optional[str]:
+    """
+    SHA-256 of value's canonical JSON, or None if value is not JSON-native.
+
+    Anything else could only be keyed by its str(), which need not
+    reflect its content, so distinct values could share a digest.
+    """
+    if not _is_json_native(value):
+        return None
+    try:
+        encoded = json.dumps(value, sort_keys=True, allow_nan=False)
+    except ValueError:
+        return None
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _guardian_policy_epoch() -> Optional[int]:
+    """Policy epoch of the bootstrapped ArtemisGuardian, or None if there is none."""
+    # Looked up, not imported: if core.bootstrap was never loaded nothing
+    # was bootstrapped, and importing it would pull Artemis into hestia
+    bootstrap = sys.modules.get("core.bootstrap")
+    if bootstrap is None or not bootstrap.SystemState.is_artemis_initialized():
+        return None
+    return bootstrap.SystemState.get_artemis().policy_epoch()
+
+
 class ContextEngine:
     """
     Stage-2 Context Engine v1: RAM-only, volatile, deterministic.
 
-    - Single context per process (class variable)
+    - One context per session (see ContextSessions); get_instance()
+      keeps the original single process-wide context
     - TTL: 900-1800 seconds (no sliding, no auto-extend)
     - Sizes: max 20 entries, 4096 total tokens, 512 per entry
     - Fail-closed: overflow rejects, expiration destroys
@@ -95,6 +218,7 @@ class ContextEngine:
     """
 
     _instance: Optional['ContextEngine'] = None  # Singleton
+    _sessions: Optional['ContextSessions'] = None  # Process-wide session map
 
     # Hard constants
     DEFAULT_TTL_SECONDS = 900      # 15 minutes
@@ -103,18 +227,27 @@ class ContextEngine:
     MAX_TOTAL_TOKENS = 4096
     MAX_ENTRY_TOKENS = 512
 
-    def __init__(self):
-        """Initialize context engine."""
+    def __init__(self, on_tokens_changed: Optional[Callable[[int], None]] = None):
+        """
+        Initialize context engine.
+
+        Args:
+            on_tokens_changed: Called with the token delta whenever the
+                running total changes (used by ContextSessions)
+        """
         self._entries: List[ContextEntry] = []
+        self._tokens: int = 0  # Running total, kept in step with _entries
         self._created_at: datetime = datetime.now()
         self._ttl_seconds: int = self.DEFAULT_TTL_SECONDS
         self._state: ContextState = ContextState.ACTIVE
+        self._on_tokens_changed = on_tokens_changed
+        self._step_memo: Optional[StepMemo] = None
 
-        logger.info(json.dumps({
+        _log_event({
             "event": "context_created",
             "timestamp": self._created_at.isoformat(),
             "ttl_seconds": self._ttl_seconds,
-        }))
+        })
 
     @classmethod
     def get_instance(cls) -> 'ContextEngine':
@@ -123,12 +256,27 @@ class ContextEngine:
             cls._instance = cls()
         return cls._instance
 
+    @classmethod
+    def sessions(cls) -> 'ContextSessions':
+        """Get or create the process-wide per-session context map."""
+        if cls._sessions is None:
+            cls._sessions = ContextSessions()
+        return cls._sessions
+
+    @classmethod
+    def for_session(cls, session_id: str) -> 'ContextEngine':
+        """Get the context for a session, creating it if needed."""
+        return cls.sessions().get(session_id)
+
     @classmethod
     def reset_instance(cls) -> None:
-        """Destroy singleton (for testing)."""
+        """Destroy singleton and all session contexts (for testing)."""
         if cls._instance is not None:
             cls._instance._state = ContextState.DESTROYED
             cls._instance = None
+        if cls._sessions is not None:
+            cls._sessions.clear()
+            cls._sessions = None
 
     # ========== TTL & Expiration ==========
 
@@ -141,10 +289,10 @@ class ContextEngine:
             raise ValueError(f"TTL must not exceed {self.MAX_TTL_SECONDS} seconds")
 
         self._ttl_seconds = seconds
-        logger.info(json.dumps({
+        _log_event({
             "event": "context_ttl_set",
             "ttl_seconds": seconds,
-        }))
+        })
 
     def ttl_seconds_remaining(self) -> float:
         """Get remaining TTL in seconds."""
@@ -164,12 +312,23 @@ class ContextEngine:
         elapsed = (datetime.now() - self._created_at).total_seconds()
         if elapsed > self._ttl_seconds:
             self._state = ContextState.EXPIRED
-            logger.info(json.dumps({
+            _log_event({
                 "event": "context_expired",
                 "elapsed_seconds": elapsed,
                 "ttl_seconds": self._ttl_seconds,
                 "entry_count": len(self._entries),
-            }))
+            })
+
+    @property
+    def expires_at(self) -> datetime:
+        """When the context expires under its current TTL."""
+        return self._created_at + timedelta(seconds=self._ttl_seconds)
+
+    @property
+    def expired(self) -> bool:
+        """True once the context can no longer be used (expired, cleared or destroyed)."""
+        self._check_expiration()
+        return self._state != ContextState.ACTIVE
 
     # ========== Entry Management ==========
 
@@ -206,7 +365,7 @@ class ContextEngine:
             }))
             raise ValueError(f"Context full: max {self.MAX_ENTRIES} entries")
 
-        total_tokens = self._total_tokens() + entry_tokens
+        total_tokens = self._tokens + entry_tokens
         if total_tokens > self.MAX_TOTAL_TOKENS:
             logger.error(json.dumps({
                 "event": "context_append_rejected",
@@ -225,19 +384,28 @@ class ContextEngine:
         )
 
         self._entries.append(entry)
+        self._add_tokens(entry_tokens)
 
-        logger.info(json.dumps({
+        _log_event({
             "event": "context_append_attempt",
             "success": True,
             "source_domain": source_domain,
             "entry_tokens": entry_tokens,
             "total_tokens": total_tokens,
             "entry_count": len(self._entries),
-        }))
+        })
 
     def _total_tokens(self) -> int:
         """Get total token count."""
-        return sum(e.tokens for e in self._entries)
+        return self._tokens
+
+    def _add_tokens(self, delta: int) -> None:
+        """Update the running total and notify the owner."""
+        if not delta:
+            return
+        self._tokens += delta
+        if self._on_tokens_changed is not None:
+            self._on_tokens_changed(delta)
 
     def entry_count(self) -> int:
         """Get number of entries."""
@@ -260,19 +428,19 @@ class ContextEngine:
         self._check_expiration()
 
         if self._state != ContextState.ACTIVE:
-            logger.info(json.dumps({
+            _log_event({
                 "event": "context_snapshot_issued",
                 "state": self._state,
                 "entry_count": 0,
-            }))
+            })
             return tuple()
 
-        logger.info(json.dumps({
+        _log_event({
             "event": "context_snapshot_issued",
             "state": self._state,
             "entry_count": len(self._entries),
             "total_tokens": self._total_tokens(),
-        }))
+        })
 
         return tuple(self._entries)
 
@@ -299,10 +467,10 @@ class ContextEngine:
             "created_at": self._created_at.isoformat(),
         }
 
-        logger.info(json.dumps({
+        _log_event({
             "event": "context_inspected",
             **metadata,
-        }))
+        })
 
         return metadata
 
@@ -316,13 +484,18 @@ class ContextEngine:
 
     def clear(self) -> None:
         """Explicitly clear context."""
+        self._release(ContextState.CLEARED, "user_clear")
+
+    def _release(self, state: ContextState, reason: str) -> None:
+        """Drop all entries and move to a terminal state."""
         self._entries.clear()
-        self._state = ContextState.CLEARED
+        self._add_tokens(-self._tokens)
+        self._state = state
 
-        logger.info(json.dumps({
+        _log_event({
             "event": "context_destroyed",
-            "reason": "user_clear",
-        }))
+            "reason": reason,
+        })
 
     # ========== Pipeline Parsing ==========
 
@@ -391,11 +564,11 @@ class ContextEngine:
         pipeline = Pipeline(steps=tuple(steps))
         pipeline.validate()
 
-        logger.info(json.dumps({
+        _log_event({
             "event": "pipeline_declared",
             "step_count": len(steps),
             "domains": [s.domain_id for s in steps],
-        }))
+        })
 
         return pipeline
 
@@ -444,3 +617,268 @@ class ContextEngine:
             args[key] = val
 
         return args
+
+    # ========== Pipeline Execution ==========
+
+    @property
+    def step_memo(self) -> StepMemo:
+        """Memo of this context's completed pipeline steps."""
+        if self._step_memo is None:
+            self._step_memo = StepMemo()
+        return self._step_memo
+
+    def context_hash(self) -> str:
+        """Hash of the entries' content and sources (not their timestamps)."""
+        self._check_expiration()
+        if self._state != ContextState.ACTIVE:
+            return _digest([])
+        return _digest([[e.content, e.source_domain] for e in self._entries])
+
+    def execute_pipeline(
+        self,
+        pipeline: Pipeline,
+        domains: Dict[str, Any],
+        policy_epoch: Optional[int] = None,
+        memo: Optional[StepMemo] = None,
+    ) -> Any:
+        """
+        Execute pipeline steps sequentially, left to right.
+
+        Each step calls domains[domain_id].method(**args). A method that
+        accepts a `context` argument also receives a read-only snapshot:
+        this context's entries plus one entry per earlier step output.
+
+        Completed steps are memoized, so retrying or replaying a pipeline
+        re-executes only the steps whose inputs (args, previous output,
+        context, policy epoch) changed. Without a policy epoch, either
+        passed or read from the bootstrapped ArtemisGuardian, nothing is
+        memoized: a result could not be invalidated by a policy change.
+        Nor is a step whose args or input are not JSON-native.
+
+        Args:
+            pipeline: Parsed pipeline
+            domains: Domain id -> domain instance
+            policy_epoch: Artemis policy epoch (default: the bootstrapped
+                ArtemisGuardian's policy_epoch(), if any)
+            memo: Step memo to use (default: this context's step_memo)
+
+        Returns:
+            Output of the last step
+
+        Raises:
+            ValueError: If the context is not ACTIVE, or a domain or method is unknown
+            RuntimeError: If a step fails (the pipeline aborts)
+        """
+        self._check_expiration()
+        if self._state != ContextState.ACTIVE:
+            raise ValueError(f"Cannot execute pipeline on {self._state} context")
+
+        pipeline.validate()
+        if policy_epoch is None:
+            policy_epoch = _guardian_policy_epoch()
+        memoize = policy_epoch is not None
+        memo = memo if memo is not None else self.step_memo
+        context_hash = self.context_hash()
+        snapshot = list(self._entries)
+        output: Any = None
+
+        for i, step in enumerate(pipeline.steps):
+            domain = domains.get(step.domain_id)
+            if domain is None:
+                raise ValueError(f"Step {i}: unknown domain '{step.domain_id}'")
+            method = getattr(domain, step.method, None)
+            if not callable(method) or step.method.startswith("_"):
+                raise ValueError(f"Step {i}: unknown method '{step.domain_id}.{step.method}'")
+
+            step_hash = _digest({"method": step.method, "args": step.args, "input": output})
+            key = (step.domain_id, step_hash, context_hash, policy_epoch)
+            # Steps whose args or input are not JSON-native have no
+            # faithful key and always run
+            cacheable = memoize and step_hash is not None
+
+            found, output = memo.get(key) if cacheable else (False, None)
+            if found:
+                _log_event({"event": "pipeline_step_reused", "step": i, "domain": step.domain_id})
+            else:
+                kwargs = dict(step.args)
+                if "context" in inspect.signature(method).parameters:
+                    kwargs["context"] = tuple(snapshot)
+                try:
+                    output = method(**kwargs)
+                except Exception as e:
+                    logger.error(json.dumps({
+                        "event": "pipeline_step_failed",
+                        "step": i,
+                        "domain": step.domain_id,
+                        "error": str(e),
+                    }))
+                    raise RuntimeError(
+                        f"Pipeline aborted at step {i} ({step.domain_id}.{step.method}): {e}"
+                    ) from e
+                if cacheable:
+                    memo.put(key, output)
+                _log_event({"event": "pipeline_step_executed", "step": i, "domain": step.domain_id})
+
+            text = str(output)
+            snapshot.append(ContextEntry(
+                content=text,
+                source_domain=step.domain_id,
+                timestamp=datetime.now().isoformat(),
+                tokens=max(1, len(text) // 4),
+            ))
+
+        return output
+
+
+class ContextSessions:
+    """
+    Bounded map of session id -> ContextEngine.
+
+    Least recently used sessions are evicted once max_sessions is
+    reached. Expired contexts are evicted when looked up and, in
+    deadline order from a heap, on every get, so a recently used session
+    cannot shield expired ones behind it and lookups stay O(log n)
+    amortized however many sessions are live. A running token total
+    across all held contexts is maintained from the contexts' own
+    append/clear deltas.
+
+    Thread-safe. Each context itself belongs to one session and is not
+    locked.
+    """
+
+    DEFAULT_MAX_SESSIONS = 4096
+
+    def __init__(self, max_sessions: int = DEFAULT_MAX_SESSIONS, ttl_seconds: Optional[int] = None):
+        """
+        Initialize session map.
+
+        Args:
+            max_sessions: Contexts held before the least recently used is evicted
+            ttl_seconds: TTL for new contexts (default: ContextEngine.DEFAULT_TTL_SECONDS)
+        """
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self.evictions = 0
+        self.expirations = 0
+        self._contexts: "OrderedDict[str, ContextEngine]" = OrderedDict()
+        # (expires_at, seq, session_id, context); entries for contexts no
+        # longer held are skipped when they surface
+        self._deadlines: List[Tuple[datetime, int, str, ContextEngine]] = []
+        self._seq = itertools.count()
+        self._tokens = 0
+        self._lock = threading.Lock()
+
+    def _on_tokens_changed(self, delta: int) -> None:
+        with self._lock:
+            self._tokens += delta
+
+    def get(self, session_id: str) -> ContextEngine:
+        """
+        Get a session's context, creating it if missing or expired.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            The session's ACTIVE context
+        """
+        with self._lock:
+            self._evict_expired()
+
+            context = self._contexts.get(session_id)
+            if context is not None:
+                if not context.expired:
+                    self._contexts.move_to_end(session_id)
+                    return context
+                self._remove(session_id, ContextState.EXPIRED, "expired")
+                self.expirations += 1
+
+            while len(self._contexts) >= self.max_sessions:
+                oldest = next(iter(self._contexts))
+                self._remove(oldest, ContextState.DESTROYED, "session_evicted")
+                self.evictions += 1
+
+            context = ContextEngine(on_tokens_changed=self._on_tokens_changed)
+            if self.ttl_seconds is not None:
+                context.set_ttl(self.ttl_seconds)
+            self._contexts[session_id] = context
+            self._push_deadline(session_id, context)
+            return context
+
+    def peek(self, session_id: str) -> Optional[ContextEngine]:
+        """Get a session's context without creating it or refreshing its recency."""
+        with self._lock:
+            return self._contexts.get(session_id)
+
+    def drop(self, session_id: str) -> bool:
+        """Destroy a session's context. Returns False if it was not held."""
+        with self._lock:
+            if session_id not in self._contexts:
+                return False
+            self._remove(session_id, ContextState.DESTROYED, "session_dropped")
+            return True
+
+    def clear(self) -> None:
+        """Destroy every session's context."""
+        with self._lock:
+            for session_id in list(self._contexts):
+                self._remove(session_id, ContextState.DESTROYED, "session_dropped")
+            self._deadlines.clear()
+
+    def total_tokens(self) -> int:
+        """Tokens held across all sessions not yet evicted."""
+        return self._tokens
+
+    def __len__(self) -> int:
+        return len(self._contexts)
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._contexts
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get session map statistics."""
+        return {
+            "sessions": len(self._contexts),
+            "max_sessions": self.max_sessions,
+            "total_tokens": self._tokens,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def _push_deadline(self, session_id: str, context: ContextEngine) -> None:
+        """Schedule a context's expiry sweep. Caller holds the lock."""
+        heapq.heappush(self._deadlines, (context.expires_at, next(self._seq), session_id, context))
+
+        # Drop entries of evicted or dropped contexts once they dominate
+        if len(self._deadlines) > 2 * len(self._contexts) + 64:
+            self._deadlines = [
+                entry for entry in self._deadlines
+                if self._contexts.get(entry[2]) is entry[3]
+            ]
+            heapq.heapify(self._deadlines)
+
+    def _evict_expired(self) -> None:
+        """Evict every context whose deadline has passed, soonest first."""
+        now = datetime.now()
+        while self._deadlines and self._deadlines[0][0] <= now:
+            _, _, session_id, context = heapq.heappop(self._deadlines)
+            if self._contexts.get(session_id) is not context:
+                continue  # Already evicted, dropped or replaced
+            if context.expired:
+                self._remove(session_id, ContextState.EXPIRED, "expired")
+                self.expirations += 1
+            else:
+                # TTL changed after it was scheduled
+                self._push_deadline(session_id, context)
+
+    def _remove(self, session_id: str, state: ContextState, reason: str) -> None:
+        """Pop a context and release its tokens. Caller holds the lock."""
+        context = self._contexts.pop(session_id)
+        # Detach first: the lock is held, so settle the total here
+        context._on_tokens_changed = None
+        self._tokens -= context._tokens
+        # An expired or cleared context keeps the state it already reached
+        context._release(state if context._state == ContextState.ACTIVE else context._state, reason)
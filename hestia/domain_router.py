@@ -1,10 +1,18 @@
 """
 Hestia Domain Router - Routes requests to domain intelligence modules.
+
+Routes are compiled into an immutable dispatch table mapping each
+capability to its enabled domains in priority order (the fallback
+chain). The table is rebuilt only when the route set changes, so
+routing a request is one dict lookup however many domains are
+registered.
 """
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
-from typing import Dict, List, Optional, Set
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
@@ -31,6 +39,22 @@ class DomainRoute(BaseModel):
         use_enum_values = True
 
 
+class RouteRequest(BaseModel):
+    """One request in a route_many batch."""
+    capability: DomainCapability
+    user_id: str
+    session_id: str
+    input_data: Dict[str, Any]
+    context: Optional[Dict[str, Any]] = None
+
+
+# Capability -> enabled domain names, highest priority first
+DispatchTable = Mapping[DomainCapability, Tuple[str, ...]]
+
+# Requests of one route_many batch in flight at once
+ROUTE_MANY_CONCURRENCY = 8
+
+
 class DomainRouter:
     """
     Routes user requests to appropriate domain modules.
@@ -41,6 +65,9 @@ class DomainRouter:
     - Permission checks
     - Result aggregation
     - Error handling
+    
+    Change routes through add_route() and enable_domain() so the
+    dispatch table is rebuilt.
     """
     
     def __init__(self, service_registry: ServiceRegistry):
@@ -50,6 +77,9 @@ class DomainRouter:
         # Capability to domain routing table
         self.routes: Dict[DomainCapability, List[DomainRoute]] = {}
         
+        # Compiled from routes on first use after a change
+        self._dispatch: Optional[DispatchTable] = None
+        
         # Domain cache
         self.domains: Dict[str, IDomainModule] = {}
         
@@ -58,6 +88,7 @@ class DomainRouter:
             "requests_routed": 0,
             "successful_routes": 0,
             "failed_routes": 0,
+            "table_builds": 0,
             "domain_usage": {}
         }
         
@@ -87,22 +118,13 @@ class DomainRouter:
                     
                     # Build routing table
                     for capability_info in capabilities:
-                        route = DomainRoute(
+                        self.add_route(DomainRoute(
                             capability=capability_info.capability,
                             domain_name=domain_name,
                             requires_permissions=(
                                 ["memory:read"] if capability_info.requires_memory_access else []
                             )
-                        )
-                        
-                        if capability_info.capability not in self.routes:
-                            self.routes[capability_info.capability] = []
-                        
-                        self.routes[capability_info.capability].append(route)
-                        self.routes[capability_info.capability].sort(
-                            key=lambda r: r.priority,
-                            reverse=True
-                        )
+                        ))
                     
                     self.logger.info(
                         "Domain discovered",
@@ -118,38 +140,58 @@ class DomainRouter:
                     )
         
         # Log routing table
-        for capability, routes in self.routes.items():
+        for capability, chain in self.dispatch_table.items():
             self.logger.debug(
                 "Routing configured",
                 capability=capability.value,
-                routes=[r.domain_name for r in routes]
+                routes=list(chain)
             )
         
         return domains_capabilities
     
+    def add_route(self, route: DomainRoute) -> None:
+        """Register a route; the dispatch table is rebuilt on next use."""
+        # DomainRoute stores the enum value (use_enum_values)
+        capability = DomainCapability(route.capability)
+        self.routes.setdefault(capability, []).append(route)
+        self._dispatch = None
+    
+    @property
+    def dispatch_table(self) -> DispatchTable:
+        """Capability -> fallback chain of enabled domains, highest priority first."""
+        table = self._dispatch
+        if table is None:
+            table = self._dispatch = self._compile_routes()
+        return table
+    
+    def _compile_routes(self) -> DispatchTable:
+        """Build the immutable dispatch table from the current routes."""
+        table = {}
+        for capability, routes in self.routes.items():
+            # Stable sort: equal priorities keep registration order
+            ordered = sorted(
+                (r for r in routes if r.enabled),
+                key=lambda r: r.priority,
+                reverse=True
+            )
+            chain = tuple(dict.fromkeys(r.domain_name for r in ordered))
+            if chain:
+                table[capability] = chain
+        
+        self.stats["table_builds"] += 1
+        return MappingProxyType(table)
+    
     def get_available_capabilities(self) -> List[DomainCapability]:
-        """Get all available capabilities."""
-        return list(self.routes.keys())
+        """Get all capabilities with at least one enabled domain."""
+        return list(self.dispatch_table.keys())
     
     def find_domain_for_capability(
         self,
         capability: DomainCapability
     ) -> Optional[str]:
         """Find the best domain for a capability."""
-        if capability not in self.routes:
-            return None
-        
-        # Get enabled routes sorted by priority
-        enabled_routes = [
-            r for r in self.routes[capability]
-            if r.enabled
-        ]
-        
-        if not enabled_routes:
-            return None
-        
-        # Return highest priority domain
-        return enabled_routes[0].domain_name
+        chain = self.dispatch_table.get(capability)
+        return chain[0] if chain else None
     
     async def route_to_domain(
         self,
@@ -164,15 +206,30 @@ class DomainRouter:
         
         Returns structured domain result.
         """
-        self.stats["requests_routed"] += 1
-        
         # Find domain
         domain_name = self.find_domain_for_capability(capability)
         
         if not domain_name:
+            self.stats["requests_routed"] += 1
             self.stats["failed_routes"] += 1
             raise ValueError(f"No domain found for capability: {capability.value}")
         
+        return await self._dispatch_to(
+            domain_name, capability, user_id, session_id, input_data, context
+        )
+    
+    async def _dispatch_to(
+        self,
+        domain_name: str,
+        capability: DomainCapability,
+        user_id: str,
+        session_id: str,
+        input_data: Dict[str, any],
+        context: Optional[Dict[str, any]]
+    ) -> DomainResult:
+        """Send a request to one domain."""
+        self.stats["requests_routed"] += 1
+        
         # Get domain service
         if domain_name not in self.domains:
             # Try to get from service registry
@@ -254,34 +311,35 @@ class DomainRouter:
         
         Tries domains in priority order until one succeeds.
         """
-        if capability not in self.routes:
-            raise ValueError(f"No routes for capability: {capability.value}")
-        
-        # Get enabled routes in priority order
-        routes = [
-            r for r in self.routes[capability]
-            if r.enabled
-        ]
-        
-        if not routes:
+        return await self._route_chain(
+            self.dispatch_table, capability, user_id, session_id, input_data, context
+        )
+    
+    async def _route_chain(
+        self,
+        table: DispatchTable,
+        capability: DomainCapability,
+        user_id: str,
+        session_id: str,
+        input_data: Dict[str, any],
+        context: Optional[Dict[str, any]]
+    ) -> DomainResult:
+        """Walk a capability's fallback chain until a domain succeeds."""
+        chain = table.get(capability)
+        if not chain:
             raise ValueError(f"No enabled routes for capability: {capability.value}")
         
         errors = []
         
-        for route in routes:
+        for domain_name in chain:
             try:
-                result = await self.route_to_domain(
-                    capability=capability,
-                    user_id=user_id,
-                    session_id=session_id,
-                    input_data=input_data,
-                    context=context
+                return await self._dispatch_to(
+                    domain_name, capability, user_id, session_id, input_data, context
                 )
-                return result
                 
             except Exception as e:
                 errors.append({
-                    "domain": route.domain_name,
+                    "domain": domain_name,
                     "error": str(e)
                 })
                 continue
@@ -297,17 +355,65 @@ class DomainRouter:
             f"All domains failed for {capability.value}. Errors: {errors}"
         )
     
-    def get_domain_capabilities(self, domain_name: str) -> List[DomainCapability]:
-        """Get capabilities provided by a specific domain."""
-        capabilities = []
+    async def route_many(
+        self,
+        requests: Iterable[RouteRequest],
+        fallback: bool = True,
+        max_concurrency: int = ROUTE_MANY_CONCURRENCY
+    ) -> List[Union[DomainResult, Exception]]:
+        """
+        Route a batch of requests concurrently.
         
-        for capability, routes in self.routes.items():
-            for route in routes:
-                if route.domain_name == domain_name and route.enabled:
-                    capabilities.append(capability)
-                    break
+        The whole batch uses one snapshot of the dispatch table. A failed
+        request does not fail the batch: its slot holds the exception.
+        
+        Args:
+            requests: Requests to route
+            fallback: Walk each capability's fallback chain (otherwise
+                only the highest priority domain is tried)
+            max_concurrency: Most requests in flight at once
+        
+        Returns:
+            Results (or exceptions) in request order
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        
+        table = self.dispatch_table
+        limit = asyncio.Semaphore(max_concurrency)
+        
+        async def route_one(request: RouteRequest) -> DomainResult:
+            async with limit:
+                return await route_unbounded(request)
+        
+        async def route_unbounded(request: RouteRequest) -> DomainResult:
+            if fallback:
+                return await self._route_chain(
+                    table, request.capability, request.user_id, request.session_id,
+                    request.input_data, request.context
+                )
+            
+            chain = table.get(request.capability)
+            if not chain:
+                self.stats["requests_routed"] += 1
+                self.stats["failed_routes"] += 1
+                raise ValueError(f"No domain found for capability: {request.capability.value}")
+            return await self._dispatch_to(
+                chain[0], request.capability, request.user_id, request.session_id,
+                request.input_data, request.context
+            )
         
-        return capabilities
+        return await asyncio.gather(
+            *(route_one(request) for request in requests),
+            return_exceptions=True
+        )
+    
+    def get_domain_capabilities(self, domain_name: str) -> List[DomainCapability]:
+        """Get capabilities provided by a specific domain."""
+        return [
+            capability for capability, chain in self.dispatch_table.items()
+            if domain_name in chain
+        ]
     
     def enable_domain(self, domain_name: str, enabled: bool = True) -> bool:
         """Enable or disable a domain."""
@@ -320,6 +426,7 @@ class DomainRouter:
                     domain_affected = True
         
         if domain_affected:
+            self._dispatch = None
             status = "enabled" if enabled else "disabled"
             self.logger.info(f"Domain {status}", domain=domain_name)
         
@@ -6,7 +6,34 @@ DISABLED IN v0.1:
 - Complex intent parsing
 - Confidence scoring
 """
-from typing import Dict, Any
+import re
+from typing import Dict, Any, Iterable, List
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+_VOWELS = frozenset("aeiou")
+
+
+def _inflections(word: str) -> set:
+    """
+    Inflected forms a single-word pattern also matches.
+
+    Words shorter than four letters match exactly, so "art" does not
+    match "arts" and "fun" does not match "fund".
+    """
+    forms = {word}
+    if len(word) < 4:
+        return forms
+
+    forms.update(word + suffix for suffix in ("s", "es", "ed", "ing", "er", "ers"))
+    if word.endswith("e"):
+        forms.update((word + "d", word + "rs", word[:-1] + "ing"))
+    elif word.endswith("y") and word[-2] not in _VOWELS:
+        forms.update((word[:-1] + "ies", word[:-1] + "ied"))
+    elif word[-1] not in _VOWELS | {"w", "x", "y"} and word[-2] in _VOWELS and word[-3] not in _VOWELS:
+        # Doubled final consonant: debug -> debugging
+        forms.update(word + word[-1] + suffix for suffix in ("ed", "ing", "er"))
+    return forms
 
 
 class IntentClassifier:
@@ -129,59 +156,95 @@ class IntentClassifier:
             "search my study material",
         ]
     
+        self.compile()
+
+    def _tiers(self) -> List[tuple]:
+        """(intent, patterns) in priority order, highest first."""
+        tiers = [
+            ("memory_query", self.memory_patterns),
+            ("knowledge_query", self.knowledge_patterns),
+            ("hephaestus_query", self.hephaestus_patterns),
+            ("hermes_query", self.hermes_patterns),
+            ("apollo_query", self.apollo_patterns),
+            ("dionysus_query", self.dionysus_patterns),
+            ("pluto_query", self.pluto_patterns),
+            ("athena_query", self.athena_patterns),
+        ]
+        # Each keyword is its own tier, in dict order
+        tiers.extend((intent, [keyword]) for keyword, intent in self.keyword_map.items())
+        return tiers
+
+    def compile(self) -> None:
+        """
+        Build the matcher from the pattern lists.
+
+        Called by __init__; call again after editing the lists.
+
+        Patterns match whole words only ("hi" does not match "this").
+        Single words map to their tier rank in one dict, so a message's
+        words are looked up in one set intersection. Phrases are indexed
+        by their first word and only checked when that word occurs.
+        """
+        self._intents: List[str] = []
+        self._word_ranks: Dict[str, int] = {}
+        self._phrases: Dict[str, List[tuple]] = {}
+
+        for rank, (intent, patterns) in enumerate(self._tiers()):
+            self._intents.append(intent)
+            for pattern in patterns:
+                words = _WORD.findall(pattern.lower())
+                if not words:
+                    continue
+                if len(words) == 1:
+                    for form in _inflections(words[0]):
+                        self._word_ranks.setdefault(form, rank)
+                    continue
+                for form in _inflections(words[-1]):
+                    phrase = " " + " ".join(words[:-1] + [form]) + " "
+                    self._phrases.setdefault(words[0], []).append((rank, phrase))
+
+        self._vocabulary = frozenset(self._word_ranks)
+        self._phrase_starts = frozenset(self._phrases)
+
     def classify(self, text: str) -> str:
         """
-        Classify intent using simple keyword matching.
-        
+        Classify intent using keyword matching.
+
+        All tiers are matched in one pass over the message's words; the
+        highest-priority tier that matches wins, wherever it occurs.
+
         Returns:
             str: Intent name (memory_query, knowledge_query, hephaestus_query, general, etc.)
         """
-        text_lower = text.lower().strip()
-        
-        # Check for explicit memory query patterns FIRST
-        for pattern in self.memory_patterns:
-            if pattern in text_lower:
-                return "memory_query"
-
-        # Check for explicit knowledge search patterns
-        for pattern in self.knowledge_patterns:
-            if pattern in text_lower:
-                return "knowledge_query"
-        
-        # Check for Hephaestus domain patterns (code reasoning)
-        for pattern in self.hephaestus_patterns:
-            if pattern in text_lower:
-                return "hephaestus_query"
-        
-        # Check for Hermes domain patterns (text transformation)
-        for pattern in self.hermes_patterns:
-            if pattern in text_lower:
-                return "hermes_query"
-        
-        # Check for Apollo domain patterns (health/wellness information)
-        for pattern in self.apollo_patterns:
-            if pattern in text_lower:
-                return "apollo_query"
-        
-        # Check for Dionysus domain patterns (music/art/culture information)
-        for pattern in self.dionysus_patterns:
-            if pattern in text_lower:
-                return "dionysus_query"
-        
-        # Check for Pluto domain patterns (financial/economic concepts information)
-        for pattern in self.pluto_patterns:
-            if pattern in text_lower:
-                return "pluto_query"
-        
-        # Check for Athena domain patterns (knowledge base search)
-        for pattern in self.athena_patterns:
-            if pattern in text_lower:
-                return "athena_query"
-        
-        # Check for keyword matches
-        for keyword, intent in self.keyword_map.items():
-            if keyword in text_lower:
-                return intent
-        
+        words = _WORD.findall(text.lower())
+        present = set(words)
+        best = len(self._intents)
+
+        for word in present & self._vocabulary:
+            rank = self._word_ranks[word]
+            if rank < best:
+                best = rank
+
+        starts = present & self._phrase_starts
+        if starts:
+            joined = " " + " ".join(words) + " "
+            for start in starts:
+                for rank, phrase in self._phrases[start]:
+                    if rank < best and phrase in joined:
+                        best = rank
+
+        if best < len(self._intents):
+            return self._intents[best]
+
         # Default fallback
         return "general"
+
+    def classify_many(self, texts: Iterable[str]) -> List[str]:
+        """
+        Classify a batch of messages.
+
+        Returns:
+            List of intent names, in input order
+        """
+        classify = self.classify
+        return [classify(text) for text in texts]
@@ -1,45 +1,135 @@
 """
 HEARTH Ollama Client - Minimal LLM Interface (v0.1)
 
-Pure function: text input → text output
-No state, no logging, no complex prompting.
+Text input → text output, whole or streamed. No logging, no complex
+prompting. The client holds admission-control state (concurrency slots,
+queue depth, latency samples) and an optional deterministic response
+cache; see OllamaClient.
 """
 from __future__ import annotations
 
 import asyncio
-from typing import Optional
+import json
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Union
 
-try:
-    import aiohttp
-    AIOHTTP_AVAILABLE = True
-except ImportError:
-    AIOHTTP_AVAILABLE = False
+from core.lazy import lazy_import, module_available
+from .response_cache import ResponseCache, cache_key, is_deterministic
+
+# Loaded by initialize(); deterministic mode never needs it
+aiohttp = lazy_import("aiohttp")
+AIOHTTP_AVAILABLE = module_available("aiohttp")
+
+
+# Queue-wait and latency samples kept for percentiles
+QUEUE_WAIT_SAMPLES = 1024
+
+# A response counts as cold when Ollama spent this long loading the model
+COLD_LOAD_SECONDS = 0.1
+
+
+def _percentile_ms(samples, q: float) -> float:
+    """Percentile of a sample of seconds, in milliseconds."""
+    values = sorted(samples)
+    if not values:
+        return 0.0
+    return round(values[min(len(values) - 1, int(q * len(values)))] * 1000, 3)
+
+
+class OllamaBusyError(RuntimeError):
+    """
+    Generation refused before reaching Ollama.
+    
+    Raised when the wait queue is full, or when a request's deadline
+    passes while it is still queued. Nothing was sent, so the request
+    is safe to retry after retry_after seconds.
+    """
+    
+    retriable = True
+    
+    def __init__(self, message: str, retry_after: float = 1.0):
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class OllamaClient:
     """
     Minimal Ollama client for LLM reasoning.
     
-    Pure function wrapper around Ollama API.
+    Thin wrapper around the Ollama generate API.
+    
+    Admission control: a local model serves one or a few generations
+    at a time, so at most max_concurrency generations are in flight and
+    at most max_queue more wait for a slot. Further requests fail fast
+    with OllamaBusyError instead of piling up behind the model.
+    
+    Response cache (opt-in): with a ResponseCache, requests whose
+    options make sampling deterministic are answered from the cache
+    when possible, without queueing.
+    
+    Model residency: every request sends keep_alive, so Ollama keeps the
+    model loaded that long after its last use (None leaves Ollama's own
+    default, 5 minutes). warm_up() loads the model before the first
+    request needs it.
     """
     
     def __init__(
         self,
         base_url: str = "http://localhost:11434",
         model: str = "mistral:latest",
-        timeout: int = 60
+        timeout: int = 60,
+        max_concurrency: int = 1,
+        max_queue: int = 8,
+        options: Optional[Dict[str, Any]] = None,
+        cache: Optional[ResponseCache] = None,
+        keep_alive: Optional[Union[str, int]] = "30m"
     ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if max_queue < 0:
+            raise ValueError("max_queue must be non-negative")
+        
         self.base_url = base_url
         self.model = model
         self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.options = dict(options or {})
+        self.cache = cache
+        self.keep_alive = keep_alive
         self.session: Optional[aiohttp.ClientSession] = None
+        
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._queued = 0
+        self._in_flight = 0
+        self._service_time = 0.0  # Moving average of generation seconds
+        self._queue_waits: deque = deque(maxlen=QUEUE_WAIT_SAMPLES)
+        self.admitted = 0
+        self.rejected = 0
+        self.deadline_expired = 0
+        self.cache_bypassed = 0
+        
+        # Time to first response, split by whether Ollama had to load
+        # the model first
+        self.warm_up_ms: Optional[float] = None
+        self._cold_latencies: deque = deque(maxlen=QUEUE_WAIT_SAMPLES)
+        self._warm_latencies: deque = deque(maxlen=QUEUE_WAIT_SAMPLES)
     
     async def initialize(self) -> None:
         """Initialize HTTP session."""
         if not AIOHTTP_AVAILABLE:
             raise RuntimeError("aiohttp not installed. Run: pip install aiohttp")
         
+        # One pooled keep-alive connection per generation slot, plus one
+        # for health checks, so admitted requests never wait on the pool
+        connector = aiohttp.TCPConnector(
+            limit=self.max_concurrency + 1,
+            keepalive_timeout=60
+        )
         self.session = aiohttp.ClientSession(
+            connector=connector,
             timeout=aiohttp.ClientTimeout(total=self.timeout)
         )
     
@@ -63,7 +153,52 @@ class OllamaClient:
         except Exception:
             return False
     
-    async def generate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+    async def warm_up(self) -> float:
+        """
+        Load the model so the first real request doesn't pay for it.
+        
+        Sends an empty prompt, which Ollama answers by loading the model
+        (with this client's options and keep_alive) and generating
+        nothing.
+        
+        Returns:
+            Milliseconds the warm-up took (the model load time when cold)
+            
+        Raises:
+            RuntimeError: If Ollama is unavailable or request fails
+        """
+        if not self.session:
+            raise RuntimeError("Client not initialized. Call initialize() first.")
+        
+        payload = self._payload("", None, None, stream=False)
+        started = time.monotonic()
+        
+        async with self._admit(None):
+            try:
+                async with self.session.post(
+                    f"{self.base_url}/api/generate",
+                    json=payload
+                ) as response:
+                    if response.status != 200:
+                        error_text = await response.text()
+                        raise RuntimeError(f"Ollama API error ({response.status}): {error_text}")
+                    await response.json()
+                    
+            except asyncio.TimeoutError as e:
+                raise RuntimeError(f"Ollama warm-up timed out after {self.timeout}s") from e
+            except aiohttp.ClientError as e:
+                raise RuntimeError(f"Ollama connection failed: {e}") from e
+        
+        self.warm_up_ms = round((time.monotonic() - started) * 1000, 3)
+        return self.warm_up_ms
+    
+    async def generate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        deadline: Optional[float] = None,
+        options: Optional[Dict[str, Any]] = None
+    ) -> str:
         """
         Generate text from prompt.
         
@@ -72,38 +207,261 @@ class OllamaClient:
         Args:
             prompt: User input text
             system_prompt: Optional system context
+            deadline: Seconds the whole call may take, queueing included
+            options: Ollama sampling options, over the client's defaults
             
         Returns:
             Generated text response
             
         Raises:
+            OllamaBusyError: If the queue is full or the deadline passed while queued
             RuntimeError: If Ollama is unavailable or request fails
         """
         if not self.session:
             raise RuntimeError("Client not initialized. Call initialize() first.")
         
+        payload = self._payload(prompt, system_prompt, options, stream=False)
+        key = self._cache_key(payload)
+        if key:
+            cached = await asyncio.to_thread(self.cache.get, key)
+            if cached is not None:
+                return cached.strip()
+        
+        async with self._admit(deadline) as remaining:
+            started = time.monotonic()
+            try:
+                async with asyncio.timeout(remaining):
+                    async with self.session.post(
+                        f"{self.base_url}/api/generate",
+                        json=payload
+                    ) as response:
+                        if response.status != 200:
+                            error_text = await response.text()
+                            raise RuntimeError(f"Ollama API error ({response.status}): {error_text}")
+                        
+                        result = await response.json()
+                        self._record_latency(time.monotonic() - started, result)
+                        text = result.get("response", "")
+                        if key:
+                            await asyncio.to_thread(self.cache.put, key, self.model, text)
+                        return text.strip()
+                    
+            except asyncio.TimeoutError as e:
+                limit = self.timeout if remaining is None else min(self.timeout, deadline)
+                raise RuntimeError(f"Ollama request timed out after {limit}s") from e
+            except aiohttp.ClientError as e:
+                raise RuntimeError(f"Ollama connection failed: {e}") from e
+    
+    async def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        deadline: Optional[float] = None,
+        options: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Generate text from prompt, yielding chunks as Ollama produces them.
+        
+        Ollama streams newline-delimited JSON objects; each is parsed as
+        soon as its line arrives. Stopping iteration early (aclose(), or
+        cancellation when the caller's client disconnects) closes the
+        connection, which makes Ollama stop generating.
+        
+        The generation slot is held until the stream ends or is closed.
+        A cached response arrives as a single chunk; a streamed one is
+        cached only if it ran to completion.
+        
+        Args:
+            prompt: User input text
+            system_prompt: Optional system context
+            deadline: Seconds to wait for a generation slot
+            options: Ollama sampling options, over the client's defaults
+            
+        Yields:
+            Response text chunks, in order
+            
+        Raises:
+            OllamaBusyError: If the queue is full or the deadline passed while queued
+            RuntimeError: If Ollama is unavailable or request fails
+        """
+        if not self.session:
+            raise RuntimeError("Client not initialized. Call initialize() first.")
+        
+        payload = self._payload(prompt, system_prompt, options, stream=True)
+        key = self._cache_key(payload)
+        if key:
+            cached = await asyncio.to_thread(self.cache.get, key)
+            if cached is not None:
+                if cached:
+                    yield cached
+                return
+        
+        # A long generation may outlast the total timeout; bound the wait
+        # for each chunk instead
+        timeout = aiohttp.ClientTimeout(total=None, sock_read=self.timeout)
+        
+        async with self._admit(deadline):
+            started = time.monotonic()
+            first_chunk = None
+            try:
+                async with self.session.post(
+                    f"{self.base_url}/api/generate",
+                    json=payload,
+                    timeout=timeout
+                ) as response:
+                    if response.status != 200:
+                        error_text = await response.text()
+                        raise RuntimeError(f"Ollama API error ({response.status}): {error_text}")
+                    
+                    done = False
+                    parts = []
+                    try:
+                        async for line in response.content:
+                            if not line.strip():
+                                continue
+                            chunk = json.loads(line)
+                            if "error" in chunk:
+                                raise RuntimeError(f"Ollama API error: {chunk['error']}")
+                            if chunk.get("response"):
+                                if first_chunk is None:
+                                    first_chunk = time.monotonic() - started
+                                parts.append(chunk["response"])
+                                yield chunk["response"]
+                            if chunk.get("done"):
+                                done = True
+                                self._record_latency(
+                                    first_chunk if first_chunk is not None else time.monotonic() - started,
+                                    chunk
+                                )
+                                break
+                    finally:
+                        if not done:
+                            # Drop the connection rather than returning it to
+                            # the pool, so the server sees the disconnect
+                            response.close()
+                    
+                    # A stream that ends without done was cut short
+                    if key and done:
+                        await asyncio.to_thread(self.cache.put, key, self.model, "".join(parts))
+                    
+            except asyncio.TimeoutError as e:
+                raise RuntimeError(f"Ollama stream stalled for {self.timeout}s") from e
+            except aiohttp.ClientError as e:
+                raise RuntimeError(f"Ollama connection failed: {e}") from e
+            except json.JSONDecodeError as e:
+                raise RuntimeError(f"Ollama sent malformed stream data: {e}") from e
+    
+    def _payload(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        options: Optional[Dict[str, Any]],
+        stream: bool
+    ) -> Dict[str, Any]:
+        """Build an /api/generate request body."""
         payload = {
             "model": self.model,
             "prompt": prompt,
-            "stream": False
+            "stream": stream
         }
         
         if system_prompt:
             payload["system"] = system_prompt
         
+        merged = {**self.options, **(options or {})}
+        if merged:
+            payload["options"] = merged
+        
+        if self.keep_alive is not None:
+            payload["keep_alive"] = self.keep_alive
+        
+        return payload
+    
+    def _record_latency(self, seconds: float, result: Dict[str, Any]) -> None:
+        """File a time-to-first-response as cold or warm by Ollama's load_duration."""
+        if result.get("load_duration", 0) / 1e9 >= COLD_LOAD_SECONDS:
+            self._cold_latencies.append(seconds)
+        else:
+            self._warm_latencies.append(seconds)
+    
+    def _cache_key(self, payload: Dict[str, Any]) -> Optional[str]:
+        """Cache key for a request, or None if it must not be cached."""
+        if not self.cache:
+            return None
+        if not is_deterministic(payload.get("options")):
+            self.cache_bypassed += 1
+            return None
+        return cache_key(payload["model"], payload["prompt"], payload.get("system"), payload.get("options"))
+    
+    @asynccontextmanager
+    async def _admit(self, deadline: Optional[float]) -> AsyncIterator[Optional[float]]:
+        """
+        Hold a generation slot for the duration of the block.
+        
+        Yields:
+            Seconds left of the deadline after queueing (None if no deadline)
+        """
+        if self._slots.locked() and self._queued >= self.max_queue:
+            self.rejected += 1
+            raise OllamaBusyError(
+                f"Ollama is busy ({self._in_flight} generating, {self._queued} queued)",
+                retry_after=self._estimate_wait()
+            )
+        
+        started = time.monotonic()
+        self._queued += 1
         try:
-            async with self.session.post(
-                f"{self.base_url}/api/generate",
-                json=payload
-            ) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise RuntimeError(f"Ollama API error ({response.status}): {error_text}")
-                
-                result = await response.json()
-                return result.get("response", "").strip()
-                
-        except asyncio.TimeoutError:
-            raise RuntimeError(f"Ollama request timed out after {self.timeout}s")
-        except aiohttp.ClientError as e:
-            raise RuntimeError(f"Ollama connection failed: {e}")
+            async with asyncio.timeout(deadline):
+                await self._slots.acquire()
+        except TimeoutError:
+            self.deadline_expired += 1
+            raise OllamaBusyError(
+                f"Deadline of {deadline}s passed waiting for Ollama",
+                retry_after=self._estimate_wait()
+            ) from None
+        finally:
+            self._queued -= 1
+        
+        admitted = time.monotonic()
+        self._queue_waits.append(admitted - started)
+        self.admitted += 1
+        self._in_flight += 1
+        try:
+            yield None if deadline is None else max(0.0, deadline - (admitted - started))
+        finally:
+            self._in_flight -= 1
+            self._slots.release()
+            elapsed = time.monotonic() - admitted
+            self._service_time = elapsed if not self._service_time else 0.8 * self._service_time + 0.2 * elapsed
+    
+    def _estimate_wait(self) -> float:
+        """Expected seconds until a new request would get a slot."""
+        backlog = self._queued + self._in_flight
+        return round(max(self._service_time, 0.1) * backlog / self.max_concurrency, 3)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get client statistics; times are in milliseconds."""
+        waits = self._queue_waits
+        
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "in_flight": self._in_flight,
+            "queued": self._queued,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "deadline_expired": self.deadline_expired,
+            "queue_wait_p50_ms": _percentile_ms(waits, 0.50),
+            "queue_wait_p95_ms": _percentile_ms(waits, 0.95),
+            "queue_wait_max_ms": _percentile_ms(waits, 1.0),
+            "cache": self.cache.get_stats() if self.cache else None,
+            "cache_bypassed": self.cache_bypassed,
+            "keep_alive": self.keep_alive,
+            "warm_up_ms": self.warm_up_ms,
+            "cold_samples": len(self._cold_latencies),
+            "cold_latency_p50_ms": _percentile_ms(self._cold_latencies, 0.50),
+            "cold_latency_p99_ms": _percentile_ms(self._cold_latencies, 0.99),
+            "warm_samples": len(self._warm_latencies),
+            "warm_latency_p50_ms": _percentile_ms(self._warm_latencies, 0.50),
+            "warm_latency_p99_ms": _percentile_ms(self._warm_latencies, 0.99),
+        }
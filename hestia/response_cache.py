@@ -0,0 +1,175 @@
+"""
+Persistent LLM response cache for OllamaClient.
+
+Content-addressed: the key hashes the model, prompt, system prompt and
+sampling options, so identical requests (repeated help questions,
+pipeline steps re-run on retries and dry runs) skip generation. Only
+deterministic requests are cached; with sampling on, a cached answer
+would hide the variation the caller asked for.
+
+Stored in SQLite and bounded by total response bytes, evicting the
+least recently used entries first.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+def is_deterministic(options: Optional[Dict[str, Any]]) -> bool:
+    """True when Ollama sampling is reproducible: temperature 0 or a fixed seed."""
+    if not options:
+        return False
+    return options.get("temperature") == 0 or options.get("seed") is not None
+
+
+def cache_key(
+    model: str,
+    prompt: str,
+    system_prompt: Optional[str],
+    options: Optional[Dict[str, Any]],
+) -> str:
+    """Key for (model, prompt hash, system prompt hash, options)."""
+    parts = [
+        model,
+        hashlib.sha256(prompt.encode("utf-8")).hexdigest(),
+        hashlib.sha256((system_prompt or "").encode("utf-8")).hexdigest(),
+        json.dumps(options or {}, sort_keys=True),
+    ]
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    SQLite-backed LRU of generated responses.
+
+    Each operation opens its own short-lived connection, so one cache can
+    be shared by threads and processes.
+    """
+
+    def __init__(self, db_path: Path, max_bytes: int = 32 * 1024 * 1024):
+        """
+        Initialize cache.
+
+        Args:
+            db_path: SQLite file location
+            max_bytes: Budget for stored response text (UTF-8 bytes)
+        """
+        self.db_path = Path(db_path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30.0)
+
+    def _ensure_schema(self) -> None:
+        """Create cache table if not exists."""
+        conn = self._connect()
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS llm_responses_last_used ON llm_responses (last_used)"
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return a cached response, marking it most recently used."""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT response FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            conn.execute(
+                "UPDATE llm_responses SET last_used = ? WHERE key = ?", (time.time(), key)
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+        self.hits += 1
+        return row[0]
+
+    def put(self, key: str, model: str, response: str) -> None:
+        """Store a response, evicting least recently used entries over budget."""
+        size = len(response.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+
+        conn = self._connect()
+        try:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO llm_responses (key, model, response, size, last_used)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (key, model, response, size, time.time())
+            )
+
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_responses").fetchone()[0]
+            if total > self.max_bytes:
+                oldest = conn.execute(
+                    "SELECT key, size FROM llm_responses ORDER BY last_used ASC"
+                )
+                evict = []
+                for old_key, old_size in oldest:
+                    if total <= self.max_bytes:
+                        break
+                    evict.append((old_key,))
+                    total -= old_size
+                conn.executemany("DELETE FROM llm_responses WHERE key = ?", evict)
+                self.evictions += len(evict)
+
+            conn.commit()
+        finally:
+            conn.close()
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM llm_responses")
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get_stats(self) -> dict:
+        """Get cache statistics."""
+        conn = self._connect()
+        try:
+            entries, stored = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_responses"
+            ).fetchone()
+        finally:
+            conn.close()
+
+        return {
+            "entries": entries,
+            "bytes": stored,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -115,8 +115,9 @@ class HearthCLI:
         """Ingest a document into Athena."""
         from ...athena.document_ingestor import DocumentIngestor
         from ...athena.chunker import DocumentChunker, ChunkingConfig
+        from ...athena.config import AthenaConfig
         
-        ingestor = DocumentIngestor()
+        ingestor = DocumentIngestor(config=AthenaConfig())
         chunker = DocumentChunker(ChunkingConfig())
         
         try:
@@ -124,6 +125,11 @@ class HearthCLI:
                 # Ingest document
                 document = await ingestor.ingest_document(file_path)
                 
+                if document.is_duplicate:
+                    console.print(f"[yellow]{file_path.name} already ingested[/yellow]")
+                    console.print(f"  Document ID: {document.document_id}")
+                    return
+                
                 # Chunk document
                 chunks = chunker.chunk_document(document)
                 
@@ -2,17 +2,20 @@
 HEARTH REST API - FastAPI-based REST interface.
 """
 import asyncio
+import json
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional
 from uuid import uuid4
 
 from fastapi import Depends, FastAPI, HTTPException, Security, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from ...core.kernel import HearthKernel, KernelConfig
 from ...hestia.agent import HestiaAgent, UserInput
+from ...hestia.context_engine import ContextSessions
 from ...shared.logging.structured_logger import StructuredLogger
 
 
@@ -36,6 +39,7 @@ class ChatRequest(BaseModel):
     session_id: Optional[str] = None
     user_id: str = "api_user"
     metadata: Dict[str, Any] = Field(default_factory=dict)
+    stream: bool = False  # Reply with Server-Sent Events as text is generated
 
 
 class ChatResponse(BaseModel):
@@ -49,6 +53,12 @@ class ChatResponse(BaseModel):
     actions_executed: List[Dict] = Field(default_factory=list)
 
 
+class ContextAppendRequest(BaseModel):
+    """Explicit write to a session's context."""
+    content: str
+    source_domain: str = "user"
+
+
 class SystemStatus(BaseModel):
     """System status response."""
     status: str
@@ -57,6 +67,11 @@ class SystemStatus(BaseModel):
     version: str = "0.1.0"
 
 
+def sse_event(event: str, data: Dict) -> str:
+    """Format one Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
 class HearthAPI:
     """HEARTH REST API application."""
     
@@ -145,7 +160,6 @@ class HearthAPI:
             
             # Create user input
             session_id = request.session_id or str(uuid4())
-            
             user_input = UserInput(
                 text=request.message,
                 session_id=session_id,
@@ -153,6 +167,13 @@ class HearthAPI:
                 metadata=request.metadata
             )
             
+            if request.stream:
+                return StreamingResponse(
+                    self._stream_chat(user_input),
+                    media_type="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+                )
+            
             # Process input
             start_time = datetime.now()
             response = await self.agent.process_input(user_input)
@@ -189,6 +210,43 @@ class HearthAPI:
             # TODO: Implement memory retrieval
             return {"memories": [], "count": 0}
         
+        @self.app.get("/sessions/{session_id}/context")
+        async def get_session_context(
+            session_id: str,
+            credentials: HTTPAuthorizationCredentials = Security(security)
+        ):
+            """Get a session's context entries."""
+            await self._verify_api_key(credentials)
+            
+            context = self._sessions().peek(session_id)
+            entries = [entry.to_dict() for entry in context.snapshot()] if context else []
+            return {"session_id": session_id, "entries": entries, "count": len(entries)}
+        
+        @self.app.post("/sessions/{session_id}/context")
+        async def append_session_context(
+            session_id: str,
+            request: ContextAppendRequest,
+            credentials: HTTPAuthorizationCredentials = Security(security)
+        ):
+            """Append an entry to a session's context (explicit writes only)."""
+            await self._verify_api_key(credentials)
+            
+            context = self._sessions().get(session_id)
+            context.append(request.content, source_domain=request.source_domain)
+            return {"session_id": session_id, "token_count": context.token_count()}
+        
+        @self.app.delete("/sessions/{session_id}")
+        async def drop_session(
+            session_id: str,
+            credentials: HTTPAuthorizationCredentials = Security(security)
+        ):
+            """Drop a session's context."""
+            await self._verify_api_key(credentials)
+            
+            if not self._sessions().drop(session_id):
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Unknown session")
+            return {"session_id": session_id, "dropped": True}
+        
         @self.app.post("/ingest")
         async def ingest_document(
             file: UploadFile,
@@ -200,6 +258,54 @@ class HearthAPI:
             # TODO: Implement document ingestion
             return {"status": "not implemented"}
     
+    async def _stream_chat(self, user_input: UserInput) -> AsyncIterator[str]:
+        """
+        Stream a chat reply as Server-Sent Events.
+        
+        Sends a "token" event per chunk of text and a final "done" event.
+        When the client disconnects, Starlette cancels this generator, and
+        closing the agent stream closes the Ollama request with it.
+        """
+        session_id = user_input.session_id
+        start_time = datetime.now()
+        first_token_ms = None
+        stream = self.agent.process_stream(user_input)
+        
+        try:
+            async for chunk in stream:
+                if chunk.text:
+                    if first_token_ms is None:
+                        first_token_ms = (datetime.now() - start_time).total_seconds() * 1000
+                    yield sse_event("token", {"text": chunk.text})
+                
+                if chunk.done:
+                    processing_time = (datetime.now() - start_time).total_seconds() * 1000
+                    yield sse_event("done", {
+                        "response_id": chunk.response_id,
+                        "session_id": session_id,
+                        "intent": chunk.intent,
+                        "timestamp": datetime.now(),
+                        "first_token_ms": first_token_ms,
+                        "processing_time_ms": processing_time,
+                    })
+                    logger.info(
+                        "API chat stream processed",
+                        session_id=session_id,
+                        first_token_ms=first_token_ms,
+                        processing_time_ms=processing_time
+                    )
+        finally:
+            await stream.aclose()
+    
+    def _sessions(self) -> ContextSessions:
+        """The agent's session contexts, or 503 if the agent is not up."""
+        if not self.agent:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Agent not available"
+            )
+        return self.agent.sessions
+    
     async def _verify_api_key(self, credentials: HTTPAuthorizationCredentials):
         """Verify API key."""
         if credentials.credentials != API_KEY:
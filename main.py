@@ -5,6 +5,11 @@ import asyncio
 import sys
 from typing import Optional
 
+# Before any other project import, so the whole startup is recorded
+from core.import_profile import start_if_requested
+
+_import_profiler = start_if_requested()
+
 # DISABLED IN v0.1 — not part of execution spine
 # from mnemosyne.memory_store import MemoryStore
 # from domains.hermes.service import HermesService
@@ -12,9 +17,10 @@ from typing import Optional
 # from domains.apollo.service import ApolloService
 # from domains.dionysus.service import DionysusService
 
-from core.kernel import HearthKernel, KernelConfig
-from core.bootstrap import bootstrap_hearth
-from hestia.agent import HestiaAgent
+# The profiler has to be running before these execute, hence E402
+from core.kernel import HearthKernel, KernelConfig  # noqa: E402
+from core.bootstrap import bootstrap_hearth  # noqa: E402
+from hestia.agent import HestiaAgent  # noqa: E402
 
 
 class HearthApplication:
@@ -24,18 +30,21 @@ class HearthApplication:
     Config:
     - enable_llm: Enable Ollama-based reasoning (default: False)
     - enable_memory: Enable append-only memory with user confirmation (default: False)
+    - show_timings: Print per-subsystem startup timings on exit (default: False)
     """
     
     def __init__(
         self,
         config_path: Optional[str] = None,
         enable_llm: bool = False,
-        enable_memory: bool = False
+        enable_memory: bool = False,
+        show_timings: bool = False
     ):
         self.kernel: Optional[HearthKernel] = None
         self.agent: Optional[HestiaAgent] = None
         self.enable_llm = enable_llm
         self.enable_memory = enable_memory
+        self.show_timings = show_timings
     
     def load_configuration(self) -> KernelConfig:
         """Load minimal hardcoded configuration."""
@@ -111,6 +120,11 @@ class HearthApplication:
         # Initialize agent (will setup LLM if enabled)
         await self.agent.initialize()
         
+        # Load the model now rather than inside the first request
+        warm_up_ms = await self.agent.warm_up()
+        if warm_up_ms is not None:
+            print(f"[Hestia] Model warm-up: {warm_up_ms:.0f} ms")
+        
         # DISABLED IN v0.1 — no service registration, domains
         # await self.kernel.register_service(self.agent)
     
@@ -159,6 +173,9 @@ class HearthApplication:
             response = await self.process_input(user_input)
             print(f"Response: {response}")
             
+            if self.show_timings:
+                self.print_timings()
+            
             return 0
             
         except KeyboardInterrupt:
@@ -172,6 +189,13 @@ class HearthApplication:
         finally:
             await self.cleanup()
     
+    def print_timings(self) -> None:
+        """Print build time of each agent subsystem built so far (lazy ones on first use)."""
+        timings = self.agent.startup_timings() if self.agent else {}
+        print("Subsystem startup (ms):")
+        for name, elapsed_ms in sorted(timings.items(), key=lambda item: -item[1]):
+            print(f"  {name:<20} {elapsed_ms:>10.1f}")
+    
     async def cleanup(self) -> None:
         """Cleanup resources."""
         if self.agent:
@@ -193,11 +217,26 @@ def main() -> int:
         action="store_true",
         help="Enable append-only memory with user confirmation"
     )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Print per-subsystem startup timings"
+    )
+    parser.add_argument(
+        "--profile-imports",
+        action="store_true",
+        help="Print a per-module import-time tree on exit (also HEARTH_PROFILE_IMPORTS=1)"
+    )
     
     args = parser.parse_args()
     
-    app = HearthApplication(enable_llm=args.llm, enable_memory=args.memory)
-    return asyncio.run(app.run_once())
+    app = HearthApplication(enable_llm=args.llm, enable_memory=args.memory, show_timings=args.timings)
+    try:
+        return asyncio.run(app.run_once())
+    finally:
+        if _import_profiler is not None:
+            _import_profiler.stop()
+            print(_import_profiler.report(), file=sys.stderr)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,67 @@
+"""
+Tests for the parallel file hasher.
+"""
+
+import hashlib
+import os
+
+from artemis import file_hasher
+from artemis.file_hasher import hash_file, hash_files
+
+
+def make_files(tmp_path, sizes):
+    paths = []
+    for i, size in enumerate(sizes):
+        path = tmp_path / f"f{i}.bin"
+        path.write_bytes(os.urandom(size))
+        paths.append(str(path))
+    return paths
+
+
+def expected(path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def test_hash_file_matches_hashlib_across_block_boundaries(tmp_path):
+    block = file_hasher.BLOCK_SIZE
+    for path in make_files(tmp_path, [0, 1, block - 1, block, block + 1, 3 * block + 7]):
+        assert hash_file(path) == expected(path)
+
+
+def test_small_block_size(tmp_path):
+    (path,) = make_files(tmp_path, [10_000])
+    assert hash_file(path, block_size=4096) == expected(path)
+
+
+def test_hash_files_is_ordered_and_matches_serial(tmp_path):
+    paths = make_files(tmp_path, [i * 997 for i in range(40)])
+    paths.reverse()
+
+    parallel = hash_files(paths, max_workers=4)
+    serial = hash_files(paths, max_workers=1)
+    assert list(parallel) == paths
+    assert parallel == serial
+    assert all(parallel[path] == expected(path) for path in paths)
+
+
+def test_unreadable_file_is_none(tmp_path):
+    paths = make_files(tmp_path, [10] * 10)
+    paths.insert(3, str(tmp_path / "missing.bin"))
+
+    hashes = hash_files(paths, max_workers=4)
+    assert hashes[paths[3]] is None
+    assert sum(value is not None for value in hashes.values()) == 10
+
+
+def test_empty(tmp_path):
+    assert hash_files([]) == {}
+
+
+def test_duplicate_paths_keep_their_own_hash(tmp_path):
+    paths = make_files(tmp_path, [i * 101 for i in range(40)])
+    duplicated = paths[:5] + paths[:5] + paths[5:]
+
+    hashes = hash_files(duplicated, max_workers=4)
+    assert list(hashes) == paths
+    assert all(hashes[path] == expected(path) for path in paths)
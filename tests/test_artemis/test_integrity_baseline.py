@@ -0,0 +1,232 @@
+"""
+Tests for IntegrityBaseline stat-signature fast path.
+"""
+
+import json
+import os
+
+import pytest
+
+from artemis import integrity_baseline
+from artemis.integrity_baseline import IntegrityBaseline
+
+
+def write(path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def retime(path, seconds: int = -10) -> None:
+    """Change mtime, as an edit would (into the past: future mtimes are never trusted)."""
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + seconds * 1_000_000_000))
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    # Freshly written files are inside the racy window; trust them here
+    monkeypatch.setattr(integrity_baseline, "RACY_WINDOW_NS", 0)
+    write(tmp_path / "core" / "kernel.py", "kernel = 1\n")
+    write(tmp_path / "core" / "sub" / "util.py", "util = 1\n")
+    write(tmp_path / "artemis" / "guard.py", "guard = 1\n")
+    return tmp_path
+
+
+@pytest.fixture
+def baseline(tree, tmp_path):
+    baseline = IntegrityBaseline(baseline_path=tmp_path / ".baseline")
+    baseline.create_baseline(tree)
+    return baseline
+
+
+class TestStatFastPath:
+
+    def test_unchanged_tree_hashes_nothing(self, baseline, tree):
+        assert baseline.verify_files(tree) == (True, [])
+        stats = baseline.get_verification_stats()
+        assert stats["mode"] == "stat"
+        assert stats["files"] == 3
+        assert stats["hashed"] == 0
+
+    def test_only_changed_file_is_rehashed(self, baseline, tree):
+        target = tree / "core" / "kernel.py"
+        write(target, "kernel = 2\n")  # same size
+        retime(target)
+
+        is_valid, mismatches = baseline.verify_files(tree)
+        assert not is_valid
+        assert [(m["file"], m["status"]) for m in mismatches] == [
+            (os.path.join("core", "kernel.py"), "modified")
+        ]
+        assert baseline.get_verification_stats()["hashed"] == 1
+
+        # Still reported on the next check
+        assert not baseline.verify_files(tree)[0]
+
+    def test_touched_but_identical_file_is_trusted_again(self, baseline, tree):
+        target = tree / "core" / "kernel.py"
+        retime(target)
+
+        assert baseline.verify_files(tree) == (True, [])
+        assert baseline.get_verification_stats()["hashed"] == 1
+        baseline.verify_files(tree)
+        assert baseline.get_verification_stats()["hashed"] == 0
+
+    def test_missing_and_added_files(self, baseline, tree):
+        os.remove(tree / "artemis" / "guard.py")
+        write(tree / "core" / "sub" / "new.py", "new = 1\n")
+
+        is_valid, mismatches = baseline.verify_files(tree)
+        assert not is_valid
+        assert {(m["file"], m["status"]) for m in mismatches} == {
+            (os.path.join("artemis", "guard.py"), "missing"),
+            (os.path.join("core", "sub", "new.py"), "added"),
+        }
+
+    def test_new_critical_directory_is_walked(self, baseline, tree):
+        assert baseline.verify_files(tree) == (True, [])
+        write(tree / "stage4" / "evil.py", "import os\n")
+
+        is_valid, mismatches = baseline.verify_files(tree)
+        assert not is_valid
+        assert [(m["file"], m["status"]) for m in mismatches] == [
+            (os.path.join("stage4", "evil.py"), "added")
+        ]
+
+    def test_pycache_ignored(self, baseline, tree):
+        write(tree / "core" / "__pycache__" / "kernel.py", "cached\n")
+        assert baseline.verify_files(tree) == (True, [])
+
+
+class TestFullVerification:
+
+    def test_full_rehashes_everything(self, baseline, tree):
+        baseline.verify_files(tree, full=True)
+        stats = baseline.get_verification_stats()
+        assert stats["mode"] == "full"
+        assert stats["hashed"] == 3
+
+    def test_full_catches_edit_with_restored_timestamps(self, baseline, tree):
+        target = tree / "core" / "kernel.py"
+        st = os.stat(target)
+        write(target, "kernel = 9\n")
+        os.utime(target, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert not baseline.verify_files(tree, full=True)[0]
+
+    def test_paranoid(self, tree, tmp_path):
+        baseline = IntegrityBaseline(baseline_path=tmp_path / ".baseline", paranoid=True)
+        baseline.create_baseline(tree)
+        baseline.verify_files(tree)
+        assert baseline.get_verification_stats()["hashed"] == 3
+
+    def test_periodic_full_rehash(self, tree, tmp_path, monkeypatch):
+        baseline = IntegrityBaseline(baseline_path=tmp_path / ".baseline", full_rehash_seconds=60)
+        baseline.create_baseline(tree)
+        clock = [1000.0]
+        monkeypatch.setattr(integrity_baseline.time, "monotonic", lambda: clock[0])
+
+        baseline.verify_files(tree)
+        assert baseline.get_verification_stats()["mode"] == "full"
+        clock[0] += 30
+        baseline.verify_files(tree)
+        assert baseline.get_verification_stats()["mode"] == "stat"
+        clock[0] += 31
+        baseline.verify_files(tree)
+        assert baseline.get_verification_stats()["mode"] == "full"
+
+
+def test_recently_modified_files_are_always_rehashed(tmp_path):
+    write(tmp_path / "core" / "kernel.py", "kernel = 1\n")
+    baseline = IntegrityBaseline(baseline_path=tmp_path / ".baseline")
+    baseline.create_baseline(tmp_path)
+
+    baseline.verify_files(tmp_path)
+    assert baseline.get_verification_stats()["hashed"] == 1
+
+
+def test_loaded_baseline_hashes_on_first_verification(baseline, tree, tmp_path):
+    baseline.save_baseline()
+    loaded = IntegrityBaseline(baseline_path=tmp_path / ".baseline")
+    assert loaded.load_baseline()
+
+    assert loaded.verify_files(tree) == (True, [])
+    assert loaded.get_verification_stats()["hashed"] == 3
+    loaded.verify_files(tree)
+    assert loaded.get_verification_stats()["hashed"] == 0
+
+
+def test_parallel_baseline_matches_serial(tree, tmp_path):
+    for i in range(20):
+        write(tree / "domains" / f"d{i}.py", f"d = {i}\n")
+
+    serial = IntegrityBaseline(baseline_path=tmp_path / ".s", hash_workers=1).create_baseline(tree)
+    parallel = IntegrityBaseline(baseline_path=tmp_path / ".p", hash_workers=4).create_baseline(tree)
+    assert list(parallel.items()) == list(serial.items())
+
+
+def test_repeated_paths_keep_their_own_hash(tree, tmp_path):
+    rel_paths = [f"domains/d{i}.py" for i in range(10)]
+    for i, rel_path in enumerate(rel_paths):
+        write(tree / rel_path, f"d = {i}\n")
+
+    baseline = IntegrityBaseline(baseline_path=tmp_path / ".b", hash_workers=4)
+    hashes = baseline._hash_all(str(tree), rel_paths[:3] + rel_paths)
+    assert list(hashes) == rel_paths
+    assert hashes == baseline._hash_all(str(tree), rel_paths)
+    assert len(set(hashes.values())) == len(rel_paths)
+
+
+class TestMerkleBaseline:
+
+    def test_saved_format_and_root(self, baseline, tree, tmp_path):
+        baseline.save_baseline()
+        record = json.loads((tmp_path / ".baseline").read_text())
+        assert record["format"] == integrity_baseline.BASELINE_FORMAT
+        assert record["root"] == baseline.root_hash()
+        assert record["files"] == baseline.load_baseline()
+
+        loaded = IntegrityBaseline(baseline_path=tmp_path / ".baseline")
+        loaded.load_baseline()
+        assert loaded.root_hash() == baseline.root_hash()
+
+    def test_tampered_baseline_file_is_rejected(self, baseline, tmp_path):
+        baseline.save_baseline()
+        path = tmp_path / ".baseline"
+        record = json.loads(path.read_text())
+        rel_path = next(iter(record["files"]))
+        record["files"][rel_path] = "0" * 64
+        os.chmod(path, 0o644)
+        path.write_text(json.dumps(record))
+
+        with pytest.raises(RuntimeError, match="root hash"):
+            IntegrityBaseline(baseline_path=path).load_baseline()
+
+    def test_flat_baseline_still_loads(self, baseline, tree, tmp_path):
+        path = tmp_path / ".flat"
+        files = IntegrityBaseline(baseline_path=path).create_baseline(tree)
+        path.write_text(json.dumps(files))
+
+        loaded = IntegrityBaseline(baseline_path=path)
+        loaded.load_baseline()
+        assert loaded.root_hash() == baseline.root_hash()
+        assert loaded.verify_files(tree) == (True, [])
+
+    def test_verification_reports_root_and_changed_directories(self, baseline, tree):
+        baseline.verify_files(tree)
+        stats = baseline.get_verification_stats()
+        assert stats["root"] == baseline.root_hash()
+        assert stats["changed_directories"] == []
+
+        target = tree / "core" / "sub" / "util.py"
+        write(target, "util = 2\n")
+        retime(target)
+        baseline.verify_files(tree)
+        stats = baseline.get_verification_stats()
+        assert stats["root"] != baseline.root_hash()
+        assert stats["changed_directories"] == ["", "core", os.path.join("core", "sub")]
+
+        write(target, "util = 1\n")
+        retime(target, -20)
+        baseline.verify_files(tree)
+        assert baseline.get_verification_stats()["root"] == baseline.root_hash()
@@ -0,0 +1,74 @@
+"""
+Tests for the Merkle tree over integrity baselines.
+"""
+
+import os
+
+from artemis.merkle import ROOT, MerkleTree
+
+FILES = {
+    os.path.join("core", "kernel.py"): "a" * 64,
+    os.path.join("core", "sub", "util.py"): "b" * 64,
+    os.path.join("core", "sub", "deep", "x.py"): "c" * 64,
+    os.path.join("artemis", "guard.py"): "d" * 64,
+}
+
+
+def test_directory_hashes():
+    tree = MerkleTree(FILES)
+    assert set(tree.hashes) == {
+        ROOT, "core", os.path.join("core", "sub"), os.path.join("core", "sub", "deep"), "artemis"
+    }
+    assert tree.root == tree.hashes[ROOT]
+
+
+def test_root_is_deterministic_and_order_independent():
+    reordered = dict(reversed(list(FILES.items())))
+    assert MerkleTree(reordered).root == MerkleTree(FILES).root
+
+
+def test_any_change_changes_root():
+    roots = {MerkleTree(FILES).root}
+    for rel_path in FILES:
+        changed = dict(FILES, **{rel_path: "e" * 64})
+        roots.add(MerkleTree(changed).root)
+    renamed = {k.replace("kernel", "kernel2"): v for k, v in FILES.items()}
+    roots.add(MerkleTree(renamed).root)
+    assert len(roots) == len(FILES) + 2
+
+
+def test_with_changes_matches_rebuild():
+    tree = MerkleTree(FILES)
+    deep = os.path.join("core", "sub", "deep", "x.py")
+    changes = {
+        deep: "f" * 64,
+        os.path.join("artemis", "guard.py"): None,
+        os.path.join("domains", "new", "mod.py"): "0" * 64,
+    }
+    hashes = tree.with_changes(changes)
+
+    expected = {k: v for k, v in {**FILES, **changes}.items() if v is not None}
+    rebuilt = MerkleTree(expected)
+    assert hashes[ROOT] == rebuilt.root
+    assert hashes[os.path.join("core", "sub")] == rebuilt.hashes[os.path.join("core", "sub")]
+    assert hashes["artemis"] is None
+
+    # Only ancestors of changed files were recomputed
+    assert "core" in hashes and os.path.join("core", "sub") in hashes
+    assert tree.changed_directories(hashes) == sorted([
+        ROOT, "artemis", "core", os.path.join("core", "sub"),
+        os.path.join("core", "sub", "deep"), "domains", os.path.join("domains", "new"),
+    ])
+    # The tree itself is unchanged
+    assert tree.root == MerkleTree(FILES).root
+
+
+def test_no_changes():
+    tree = MerkleTree(FILES)
+    hashes = tree.with_changes({})
+    assert hashes == {ROOT: tree.root}
+    assert tree.changed_directories(hashes) == []
+
+
+def test_empty():
+    assert MerkleTree({}).root == MerkleTree({}).with_changes({})[ROOT]
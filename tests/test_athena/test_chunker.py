@@ -0,0 +1,108 @@
+"""
+Tests for the semantic document chunker.
+
+Verifies chunk_text, overlap handling, sentence splitting fallback,
+and once-per-process tokenizer loading.
+"""
+
+from itertools import pairwise
+
+from athena import chunker
+from athena.chunker import (
+    ChunkBoundary,
+    ChunkingConfig,
+    ChunkingStrategy,
+    DocumentChunker,
+    get_sentence_tokenizer,
+)
+
+
+def _paragraphs(count: int, words: int = 30) -> str:
+    return "\n\n".join(
+        " ".join(f"p{i}w{j}" for j in range(words)) + "." for i in range(count)
+    )
+
+
+class TestChunkText:
+
+    def test_chunk_text_returns_chunks(self):
+        """chunk_text works on raw text without an ingested document."""
+        chunks = DocumentChunker(ChunkingConfig(chunk_size=500, chunk_overlap=0)).chunk_text(
+            _paragraphs(20), document_id="doc-1"
+        )
+        assert chunks
+        assert all(c.document_id == "doc-1" for c in chunks)
+        assert [c.chunk_index for c in chunks] == list(range(len(chunks)))
+
+    def test_positions_match_content(self):
+        text = _paragraphs(30)
+        for chunk in DocumentChunker(ChunkingConfig(chunk_size=400)).chunk_text(text):
+            assert text[chunk.start_position:chunk.end_position].strip() == chunk.content
+
+    def test_empty_text(self):
+        assert DocumentChunker().chunk_text("   \n\n  ") == []
+
+    def test_max_chunks(self):
+        config = ChunkingConfig(chunk_size=100, chunk_overlap=0, max_chunks=3)
+        assert len(DocumentChunker(config).chunk_text(_paragraphs(50))) == 3
+
+    def test_fixed_strategy(self):
+        config = ChunkingConfig(strategy=ChunkingStrategy.FIXED, chunk_size=200, chunk_overlap=20)
+        chunks = DocumentChunker(config).chunk_text(_paragraphs(10))
+        assert chunks
+        assert all(c.metadata["is_semantic"] is False for c in chunks)
+
+
+class TestMergeBoundaries:
+
+    def _merge(self, boundaries, **config):
+        chunker_ = DocumentChunker(ChunkingConfig(min_chunk_size=1, **config))
+        return list(chunker_._merge_boundaries_into_chunks(iter(boundaries)))
+
+    def test_no_overlap_partitions_boundaries(self):
+        boundaries = [ChunkBoundary(i * 60, i * 60 + 58) for i in range(10)]
+        ranges = self._merge(boundaries, chunk_size=120, chunk_overlap=0)
+        assert ranges[0] == (0, 118, True)
+        # Every boundary appears in exactly one chunk
+        starts = [start for start, _, _ in ranges]
+        assert starts == sorted(set(starts))
+        assert ranges[-1][1] == boundaries[-1].end
+
+    def test_overlap_reuses_trailing_boundary(self):
+        boundaries = [ChunkBoundary(i * 60, i * 60 + 58) for i in range(10)]
+        ranges = self._merge(boundaries, chunk_size=180, chunk_overlap=30)
+        for (_, prev_end, _), (start, _, _) in pairwise(ranges):
+            assert start < prev_end  # Overlapping window
+        assert ranges[-1][1] == boundaries[-1].end
+
+    def test_single_oversized_boundary_progresses(self):
+        boundaries = [ChunkBoundary(i * 500, i * 500 + 499) for i in range(5)]
+        ranges = self._merge(boundaries, chunk_size=100, chunk_overlap=200)
+        assert len(ranges) == 5
+
+    def test_non_semantic_flag(self):
+        boundaries = [ChunkBoundary(0, 50), ChunkBoundary(50, 100, is_semantic=False)]
+        assert self._merge(boundaries, chunk_size=1000, chunk_overlap=0) == [(0, 100, False)]
+
+
+class TestSentenceTokenizer:
+
+    def test_regex_fallback_preserves_text(self):
+        text = "First sentence. Second one!  Third?\nFourth"
+        pieces = chunker._regex_sent_tokenize(text)
+        assert "".join(pieces) == text
+        assert len(pieces) == 4
+
+    def test_tokenizer_loaded_once(self, monkeypatch):
+        monkeypatch.setattr(chunker, "_sentence_tokenizers", {})
+        first = get_sentence_tokenizer("english")
+        assert get_sentence_tokenizer("english") is first
+
+    def test_long_paragraph_split_into_sentence_boundaries(self):
+        sentence = "This is a reasonably long sentence about chunking. "
+        text = sentence * 60
+        config = ChunkingConfig(chunk_size=300, chunk_overlap=0, max_chunk_size=1000)
+        boundaries = list(DocumentChunker(config)._detect_semantic_boundaries(text))
+        assert len(boundaries) == 60
+        assert all(b.boundary_type == "sentence" for b in boundaries)
+        assert all(text[b.start:b.end] == sentence.strip() for b in boundaries)
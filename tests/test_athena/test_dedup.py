@@ -0,0 +1,179 @@
+"""
+Tests for MinHash/LSH near-duplicate detection at ingest time.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from athena.config import AthenaConfig
+from athena.dedup import NearDuplicateDetector, optimal_bands
+from athena.ingestor import AthenaIngestor
+
+BOILERPLATE = (
+    "Department of Mechanical Engineering. Course syllabus, semester two. "
+    "All lecture notes are for internal circulation only. Page footer text."
+)
+
+
+class TestNearDuplicateDetector:
+
+    def test_exact_duplicate_links_to_canonical(self):
+        detector = NearDuplicateDetector(threshold=0.9)
+        assert detector.check(BOILERPLATE, "a_0") is None
+        assert detector.check(BOILERPLATE, "b_0") == "a_0"
+        assert detector.links == {"b_0": "a_0"}
+        assert detector.stats.duplicates == 1
+        assert detector.stats.embedding_calls_saved == 1
+        assert detector.stats.text_bytes_saved == len(BOILERPLATE)
+
+    def test_near_duplicate_detected(self):
+        detector = NearDuplicateDetector(threshold=0.8)
+        detector.check(BOILERPLATE, "a_0")
+        variant = BOILERPLATE.replace("semester two", "semester 2").upper()
+        assert detector.check(variant, "b_0") == "a_0"
+
+    def test_distinct_text_not_flagged(self):
+        detector = NearDuplicateDetector(threshold=0.8)
+        detector.check(BOILERPLATE, "a_0")
+        other = "Heat transfer by conduction follows Fourier's law in solids and fluids."
+        assert detector.check(other, "b_0") is None
+        assert detector.stats.duplicates == 0
+
+    def test_signature_deterministic(self):
+        first = NearDuplicateDetector().signature(BOILERPLATE)
+        second = NearDuplicateDetector().signature(BOILERPLATE)
+        assert (first == second).all()
+
+    def test_drop_mode_keeps_no_links(self):
+        detector = NearDuplicateDetector(record_links=False)
+        detector.check(BOILERPLATE, "a_0")
+        assert detector.check(BOILERPLATE, "b_0") == "a_0"
+        assert detector.links == {}
+
+    def test_optimal_bands(self):
+        bands, rows = optimal_bands(128, 0.9)
+        assert bands * rows == 128
+        assert abs((1 / bands) ** (1 / rows) - 0.9) < 0.1
+
+    def test_forget_document(self):
+        detector = NearDuplicateDetector()
+        detector.check(BOILERPLATE, "a_0", document_id="a")
+        assert detector.check(BOILERPLATE, "b_0", document_id="b", duplicate_id="b@0") == "a_0"
+
+        detector.forget("b")
+        assert detector.links == {}
+        detector.forget("a")
+        assert detector.check(BOILERPLATE, "a_0", document_id="a") is None
+
+    def test_forget_releases_entries(self):
+        detector = NearDuplicateDetector()
+        detector.check(BOILERPLATE, "a_0", document_id="a")
+        detector.check("Heat transfer by conduction in solids.", "a_1", document_id="a")
+        assert len(detector) == 2
+
+        detector.forget("a")
+        assert len(detector) == 0
+        assert all(not bucket for bucket in detector._buckets)
+
+    def test_save_and_load(self, tmp_path):
+        detector = NearDuplicateDetector()
+        detector.check(BOILERPLATE, "a_0", document_id="a")
+        detector.save(tmp_path / "sigs.npz")
+
+        restored = NearDuplicateDetector()
+        assert restored.load(tmp_path / "sigs.npz")
+        assert restored.check(BOILERPLATE, "b_0", document_id="b") == "a_0"
+        restored.forget("a")
+        assert len(restored) == 0
+
+        # Signatures from different hash functions are not comparable
+        assert not NearDuplicateDetector(seed=2).load(tmp_path / "sigs.npz")
+
+    def test_invalid_threshold(self):
+        with pytest.raises(ValueError):
+            NearDuplicateDetector(threshold=0)
+
+
+class TestIngestDedup:
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        return AthenaConfig(
+            data_dir=tmp_path / "notes",
+            index_dir=tmp_path / "index",
+            chunk_size=200,
+            chunk_overlap=0,
+            dedup_mode="link",
+        )
+
+    @pytest.fixture
+    def pdfs(self, tmp_path):
+        paths = []
+        for name in ("original.pdf", "copy.pdf"):
+            path = tmp_path / name
+            path.write_bytes(b"%PDF-1.4")
+            paths.append(path)
+        return paths
+
+    @staticmethod
+    def ingest(ingestor, pdf_path):
+        pages = [(1, 0, f"\n--- Page 1 ---\n{BOILERPLATE}\n")]
+        with patch("athena.ingestor.iter_pdf_pages", side_effect=lambda *a, **k: iter(pages)):
+            return ingestor.ingest_pdf(pdf_path)
+
+    def test_duplicate_pages_not_indexed(self, config, pdfs):
+        ingestor = AthenaIngestor(config, Mock())
+        original, copy = pdfs
+
+        first = self.ingest(ingestor, original)
+        second = self.ingest(ingestor, copy)
+
+        assert first["chunks_created"] == 1
+        assert first["duplicates_skipped"] == 0
+        assert second["success"] is True
+        assert second["chunks_created"] == 0
+        assert second["duplicates_skipped"] == 1
+        assert ingestor.retriever.add_documents.call_count == 1
+        assert ingestor.canonical_for("copy.pdf@0") == "original.pdf_0"
+
+    def test_reingest_is_not_its_own_duplicate(self, config, pdfs):
+        ingestor = AthenaIngestor(config, Mock())
+        original, _ = pdfs
+
+        self.ingest(ingestor, original)
+        again = self.ingest(ingestor, original)
+
+        assert again["chunks_created"] == 1
+        assert again["duplicates_skipped"] == 0
+
+    def test_links_persist_across_restarts(self, config, pdfs):
+        original, copy = pdfs
+        ingestor = AthenaIngestor(config, Mock())
+        self.ingest(ingestor, original)
+        self.ingest(ingestor, copy)
+        assert config.dedup_links_path.exists()
+
+        restarted = AthenaIngestor(config, Mock())
+        assert restarted.canonical_for("copy.pdf@0") == "original.pdf_0"
+
+    def test_duplicates_found_across_runs(self, config, pdfs):
+        original, copy = pdfs
+        self.ingest(AthenaIngestor(config, Mock()), original)
+
+        restarted = AthenaIngestor(config, Mock())
+        second = self.ingest(restarted, copy)
+        assert second["duplicates_skipped"] == 1
+        assert restarted.canonical_for("copy.pdf@0") == "original.pdf_0"
+
+    def test_drop_mode_writes_no_links(self, config, pdfs):
+        config.dedup_mode = "drop"
+        ingestor = AthenaIngestor(config, Mock())
+        for path in pdfs:
+            self.ingest(ingestor, path)
+        assert not config.dedup_links_path.exists()
+        assert ingestor.canonical_for("copy.pdf@0") is None
+
+    def test_dedup_off_by_default(self, tmp_path):
+        config = AthenaConfig(data_dir=tmp_path / "notes", index_dir=tmp_path / "index")
+        assert AthenaIngestor(config, Mock()).dedup is None
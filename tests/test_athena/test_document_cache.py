@@ -0,0 +1,126 @@
+"""
+Tests for the processed-document cache.
+
+Verifies byte-bounded LRU eviction, persistence across instances,
+and stat-based checksum reuse.
+"""
+
+import hashlib
+import os
+import time
+
+from athena import document_cache
+from athena.document_cache import ProcessedDocumentCache, file_checksum
+
+
+class TestFileChecksum:
+
+    def test_matches_hashlib(self, tmp_path):
+        path = tmp_path / "doc.bin"
+        data = bytes(range(256)) * 10000
+        path.write_bytes(data)
+        assert file_checksum(path, block_size=4096) == hashlib.sha256(data).hexdigest()
+        assert file_checksum(path) == hashlib.sha256(data).hexdigest()
+
+
+class TestHotLevel:
+
+    def test_byte_bound_evicts_least_recent(self):
+        cache = ProcessedDocumentCache(max_bytes=100, sizeof=len)
+        cache.put("a", "doc-a", "x" * 40)
+        cache.put("b", "doc-b", "y" * 40)
+        cache.get("a")  # a is now most recent
+        cache.put("c", "doc-c", "z" * 40)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.hot_bytes <= 100
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_oversized_value_not_kept_hot(self):
+        cache = ProcessedDocumentCache(max_bytes=10, sizeof=len)
+        cache.put("a", "doc-a", "x" * 50)
+        assert len(cache) == 0
+
+
+class TestPersistentIndex:
+
+    def test_index_survives_restart(self, tmp_path):
+        index = tmp_path / "index.db"
+        first = ProcessedDocumentCache(index_path=index)
+        first.put("abc", "doc-1", "content", metadata_json='{"title": "T"}')
+
+        second = ProcessedDocumentCache(index_path=index)
+        assert second.get("abc") is None
+        entry = second.lookup("abc")
+        assert entry.document_id == "doc-1"
+        assert entry.metadata_json == '{"title": "T"}'
+        assert second.lookup("missing") is None
+
+    def test_checksum_reused_until_file_changes(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(document_cache, "RACY_WINDOW_NS", 0)
+        index = tmp_path / "index.db"
+        path = tmp_path / "notes.txt"
+        path.write_text("version one")
+
+        cache = ProcessedDocumentCache(index_path=index)
+        original = cache.checksum(path)
+
+        calls = []
+        import athena.document_cache as module
+        real = module.file_checksum
+        monkeypatch.setattr(module, "file_checksum", lambda p: calls.append(p) or real(p))
+
+        assert ProcessedDocumentCache(index_path=index).checksum(path) == original
+        assert calls == []
+
+        path.write_text("version two, longer")
+        assert cache.checksum(path) != original
+        assert len(calls) == 1
+
+    def test_same_size_rewrite_with_restored_mtime(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(document_cache, "RACY_WINDOW_NS", 0)
+        path = tmp_path / "notes.txt"
+        path.write_text("AAAA")
+        cache = ProcessedDocumentCache(index_path=tmp_path / "index.db")
+        stale = cache.checksum(path)
+
+        st = os.stat(path)
+        time.sleep(0.05)  # Past the filesystem's timestamp tick
+        path.write_text("BBBB")
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert cache.checksum(path) == hashlib.sha256(b"BBBB").hexdigest() != stale
+
+    def test_recently_modified_file_is_always_rehashed(self, tmp_path, monkeypatch):
+        path = tmp_path / "notes.txt"
+        path.write_text("AAAA")
+        cache = ProcessedDocumentCache(index_path=tmp_path / "index.db")
+        cache.checksum(path)
+
+        calls = []
+        real = document_cache.file_checksum
+        monkeypatch.setattr(document_cache, "file_checksum", lambda p: calls.append(p) or real(p))
+        cache.checksum(path)
+        assert len(calls) == 1
+
+    def test_checksum_memo_is_bounded(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(document_cache, "RACY_WINDOW_NS", 0)
+        cache = ProcessedDocumentCache(index_path=tmp_path / "index.db", max_checksums=2)
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"notes{i}.txt"
+            path.write_text(f"version {i}")
+            cache.checksum(path)
+            paths.append(path)
+
+        calls = []
+        real = document_cache.file_checksum
+        monkeypatch.setattr(document_cache, "file_checksum", lambda p: calls.append(p) or real(p))
+        for path in paths[1:]:
+            cache.checksum(path)
+        assert calls == []
+
+        cache.checksum(paths[0])  # Pruned as the oldest
+        assert calls == [paths[0]]
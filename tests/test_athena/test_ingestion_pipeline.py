@@ -0,0 +1,145 @@
+"""
+Tests for the streaming PDF ingestion pipeline.
+
+Verifies offset-aware chunking, bisect page mapping, and bounded batching.
+"""
+
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from athena.adapters.pdf_adapter import get_text_with_page_numbers, page_for_offset
+from athena.config import AthenaConfig
+from athena.ingestor import AthenaIngestor
+from athena.utils import chunk_text, iter_chunks
+
+
+def _pages(count: int, lines_per_page: int = 20) -> list[tuple[int, int, str]]:
+    """Build (page_number, offset, segment) tuples like iter_pdf_pages."""
+    pages = []
+    offset = 0
+    for page_num in range(1, count + 1):
+        body = "\n".join(
+            f"Page {page_num} line {i} with some filler text." for i in range(lines_per_page)
+        )
+        segment = f"\n--- Page {page_num} ---\n{body}\n"
+        pages.append((page_num, offset, segment))
+        offset += len(segment)
+    return pages
+
+
+class TestIterChunks:
+    """Streaming chunker matches the whole-text chunker."""
+
+    def test_stream_matches_whole_text(self):
+        """Chunking page segments equals chunking the joined text."""
+        segments = [segment for _, _, segment in _pages(12)]
+        streamed = [chunk for _, chunk in iter_chunks(segments, 200, 40)]
+        assert streamed == chunk_text("".join(segments), 200, 40)
+
+    def test_offsets_point_at_chunks(self):
+        """Each yielded offset is the chunk's position in the joined text."""
+        segments = [segment for _, _, segment in _pages(5)]
+        text = "".join(segments)
+        for start, chunk in iter_chunks(segments, 150, 30):
+            assert text[start:start + len(chunk)] == chunk
+
+    def test_short_text_returned_whole(self):
+        """Text shorter than chunk_size is a single chunk."""
+        assert chunk_text("short note", chunk_size=100) == ["short note"]
+        assert chunk_text("", chunk_size=100) == []
+
+    def test_degenerate_overlap_terminates(self):
+        """Overlap larger than a chunk still makes progress."""
+        chunks = chunk_text("a\n" * 200, chunk_size=60, chunk_overlap=80)
+        assert chunks
+
+
+class TestPageMapping:
+    """Bisect page lookup."""
+
+    def test_page_for_offset(self):
+        offsets = [0, 100, 250]
+        pages = [1, 2, 4]
+        assert page_for_offset(offsets, pages, 0) == 1
+        assert page_for_offset(offsets, pages, 99) == 1
+        assert page_for_offset(offsets, pages, 100) == 2
+        assert page_for_offset(offsets, pages, 1000) == 4
+        assert page_for_offset([], [], 10) == 1
+
+    def test_text_with_page_numbers(self):
+        text = "first\nsecond\nthird\n"
+        result = get_text_with_page_numbers(Path("x.pdf"), text, {13: 2, 0: 1})
+        assert result == [("first", 1), ("second", 1), ("third", 2)]
+
+
+class TestStreamingIngest:
+    """AthenaIngestor.ingest_pdf streaming behaviour."""
+
+    @pytest.fixture
+    def ingestor(self, tmp_path):
+        config = AthenaConfig(
+            data_dir=tmp_path / "notes",
+            index_dir=tmp_path / "index",
+            chunk_size=200,
+            chunk_overlap=20,
+            ingest_batch_size=4,
+        )
+        return AthenaIngestor(config, Mock())
+
+    def test_ingest_batches_and_pages(self, ingestor, tmp_path):
+        """Chunks are indexed in bounded batches with correct pages."""
+        pdf_path = tmp_path / "book.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+        pages = _pages(6)
+
+        with patch("athena.ingestor.iter_pdf_pages", return_value=iter(pages)):
+            result = ingestor.ingest_pdf(pdf_path, subject="Math")
+
+        assert result["success"] is True
+        calls = ingestor.retriever.add_documents.call_args_list
+        assert all(len(c.args[0]) <= 4 for c in calls)
+        assert sum(len(c.args[0]) for c in calls) == result["chunks_created"]
+
+        # Batches carry consecutive chunk indices
+        starts = [c.kwargs["start_index"] for c in calls]
+        sizes = [len(c.args[0]) for c in calls]
+        assert starts == [sum(sizes[:i]) for i in range(len(sizes))]
+
+        # Every chunk is labelled with the page it starts on
+        expected = [
+            max(page for page, offset, _ in pages if offset <= start)
+            for start, _ in iter_chunks([s for _, _, s in pages], 200, 20)
+        ]
+        labelled = [doc["page_number"] for c in calls for doc in c.args[0]]
+        assert labelled == expected
+        assert labelled[-1] == 6
+
+    def test_ingest_empty_pdf(self, ingestor, tmp_path):
+        """PDFs with no text report failure without indexing."""
+        pdf_path = tmp_path / "blank.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+
+        with patch("athena.ingestor.iter_pdf_pages", return_value=iter([(1, 0, "")])):
+            result = ingestor.ingest_pdf(pdf_path)
+
+        assert result["success"] is False
+        ingestor.retriever.add_documents.assert_not_called()
+
+    def test_ingest_pages_matches_pdf_path(self, ingestor, tmp_path):
+        """In-memory pages go through the same chunking and page labelling."""
+        pages = _pages(3)
+        texts = [segment.split("---\n", 1)[1].rstrip("\n") for _, _, segment in pages]
+
+        result = ingestor.ingest_pages(texts, "notes.txt", persist=False)
+
+        assert result["success"] is True
+        assert result["file_name"] == "notes.txt"
+        labelled = [
+            doc["page_number"]
+            for c in ingestor.retriever.add_documents.call_args_list
+            for doc in c.args[0]
+        ]
+        assert labelled[0] == 1 and labelled[-1] == 3
+        ingestor.retriever.persist.assert_not_called()
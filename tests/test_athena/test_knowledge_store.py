@@ -0,0 +1,115 @@
+"""
+Tests for the append-only, indexed KnowledgeStore.
+
+Verifies append-only persistence, legacy JSON migration, compaction,
+and that indexed search matches a plain substring scan.
+"""
+
+import json
+import random
+
+import pytest
+
+from athena.knowledge_store import KnowledgeStore
+
+
+def _naive_search(store, query, limit):
+    q = query.lower().strip()
+    if not q:
+        return []
+    return [
+        item for item in store._items
+        if q in item.title.lower() or q in item.content.lower()
+    ][:limit]
+
+
+class TestPersistence:
+
+    def test_add_appends_one_line(self, tmp_path):
+        path = tmp_path / "kb.json"
+        store = KnowledgeStore(store_path=str(path))
+        store.add_item("First", "alpha")
+        before = path.read_text()
+        store.add_item("Second", "beta")
+        after = path.read_text()
+
+        assert after.startswith(before)
+        assert len(after.splitlines()) == 2
+
+    def test_reload(self, tmp_path):
+        path = tmp_path / "kb.json"
+        store = KnowledgeStore(store_path=str(path))
+        item = store.add_item("Thermo", "heat transfer notes")
+
+        reloaded = KnowledgeStore(store_path=str(path))
+        assert [i.id for i in reloaded.search("heat")] == [item.id]
+
+    def test_legacy_json_array_migrated_on_write(self, tmp_path):
+        path = tmp_path / "kb.json"
+        legacy = [{
+            "id": "1", "title": "Old", "content": "legacy entry",
+            "source": "manual_import", "timestamp": "2026-01-01T00:00:00",
+        }]
+        path.write_text(json.dumps(legacy, indent=2))
+
+        store = KnowledgeStore(store_path=str(path))
+        assert store.search("legacy")[0].id == "1"
+
+        store.add_item("New", "fresh entry")
+        lines = path.read_text().splitlines()
+        assert [json.loads(line)["title"] for line in lines] == ["Old", "New"]
+
+    def test_corrupt_lines_skipped_and_compacted(self, tmp_path, monkeypatch):
+        path = tmp_path / "kb.json"
+        store = KnowledgeStore(store_path=str(path))
+        store.add_item("Good", "kept")
+        with path.open("a") as f:
+            f.write("{not json\n" * 5)
+
+        monkeypatch.setattr(KnowledgeStore, "COMPACTION_MIN_DEAD", 2)
+        store = KnowledgeStore(store_path=str(path))
+        assert len(store._items) == 1
+
+        store.add_item("Next", "also kept")
+        assert len(path.read_text().splitlines()) == 2
+
+
+    def test_append_after_torn_line(self, tmp_path):
+        path = tmp_path / "kb.json"
+        store = KnowledgeStore(store_path=str(path))
+        store.add_item("Good", "kept")
+        with path.open("a") as f:
+            f.write('{"id": "torn", "title": "Cut')  # crash mid-append
+
+        store = KnowledgeStore(store_path=str(path))
+        store.add_item("Next", "also kept")
+
+        reloaded = KnowledgeStore(store_path=str(path))
+        assert [item.title for item in reloaded._items] == ["Good", "Next"]
+
+
+class TestIndexedSearch:
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        rng = random.Random(7)
+        words = ["heat", "transfer", "entropy", "python", "vector", "ab", "c-d", "Résumé"]
+        store = KnowledgeStore(store_path=str(tmp_path / "kb.json"))
+        for i in range(300):
+            store.add_item(
+                f"Item {i} {rng.choice(words)}",
+                " ".join(rng.choice(words) for _ in range(12)),
+            )
+        return store
+
+    @pytest.mark.parametrize("query", [
+        "heat", "HEAT TRANSFER", "eat tra", "item 1", "ab", "b", "c-d", "-",
+        "résumé", "zzz", "  python  ", "",
+    ])
+    def test_matches_substring_scan(self, store, query):
+        for limit in (1, 5, 1000):
+            assert store.search(query, limit=limit) == _naive_search(store, query, limit)
+
+    def test_candidates_are_narrowed(self, store):
+        store.add_item("Unique", "quasiparticle")
+        assert list(store._candidates("quasiparticle")) == [len(store._items) - 1]
@@ -0,0 +1,85 @@
+"""
+Tests for the Athena OCR engine.
+
+Verifies the text-layer check, adaptive DPI retry, and persistent cache.
+Tesseract and page rendering are stubbed; no OCR binaries are required.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from athena import ocr_engine
+from athena.ocr_engine import OCRCache, OCRSettings, _ocr_page, needs_ocr
+
+
+class FakeImage:
+    """Minimal stand-in for a rendered PIL page image."""
+
+    def __init__(self, dpi: int):
+        self.mode = "L"
+        self.size = (dpi, dpi)
+        self._bytes = f"page@{dpi}".encode()
+
+    def tobytes(self) -> bytes:
+        return self._bytes
+
+
+@pytest.fixture
+def stub_ocr(monkeypatch):
+    """Stub rendering and tesseract; confidence rises with DPI."""
+    tesseract = Mock(side_effect=lambda image, lang: (f"text@{image.size[0]}", image.size[0] / 5))
+    monkeypatch.setattr(ocr_engine, "_render_page", lambda page, dpi: FakeImage(dpi))
+    monkeypatch.setattr(ocr_engine, "_run_tesseract", tesseract)
+    return tesseract
+
+
+class TestTextLayerCheck:
+
+    def test_needs_ocr(self):
+        settings = OCRSettings(min_text_chars=10)
+        assert needs_ocr(None, settings)
+        assert needs_ocr("   short   ", settings)
+        assert not needs_ocr("a page with a real text layer", settings)
+
+
+class TestAdaptiveDpi:
+
+    def test_high_confidence_skips_retry(self, stub_ocr):
+        """Pages above the confidence bar are OCR'd once."""
+        settings = OCRSettings(base_dpi=400, retry_dpi=600, min_confidence=70)
+        result = _ocr_page(Mock(), 1, settings, None)
+        assert result.dpi == 400
+        assert stub_ocr.call_count == 1
+
+    def test_low_confidence_retries_at_higher_dpi(self, stub_ocr):
+        """Low-confidence pages are retried at retry_dpi."""
+        settings = OCRSettings(base_dpi=200, retry_dpi=400, min_confidence=70)
+        result = _ocr_page(Mock(), 3, settings, None)
+        assert result.page_number == 3
+        assert result.dpi == 400
+        assert result.text == "text@400"
+        assert stub_ocr.call_count == 2
+
+
+class TestOCRCache:
+
+    def test_roundtrip(self, tmp_path):
+        cache = OCRCache(tmp_path / "ocr.db")
+        assert cache.get("abc", 300, "eng") is None
+        cache.put("abc", 300, "eng", "hello", 91.5)
+        assert cache.get("abc", 300, "eng") == ("hello", 91.5)
+        assert cache.get("abc", 300, "deu") is None
+        assert cache.get("abc", 600, "eng") is None
+
+    def test_cache_survives_reopen(self, tmp_path, stub_ocr):
+        """A second engine run on the same page hits the persistent cache."""
+        settings = OCRSettings(base_dpi=400, retry_dpi=600, min_confidence=70)
+
+        first = _ocr_page(Mock(), 1, settings, OCRCache(tmp_path / "ocr.db"))
+        second = _ocr_page(Mock(), 1, settings, OCRCache(tmp_path / "ocr.db"))
+
+        assert first.cached is False
+        assert second.cached is True
+        assert second.text == first.text
+        assert stub_ocr.call_count == 1
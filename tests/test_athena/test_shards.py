@@ -0,0 +1,212 @@
+"""
+Tests for subject/module-sharded indexes and fan-out queries.
+"""
+
+import pytest
+
+from athena.config import AthenaConfig
+from athena.retriever import AthenaRetriever
+from athena.shards import ShardCatalog, merge_ranked, shard_slug
+
+SUBJECTS = {
+    "physics": ["force mass acceleration", "energy work power", "wave frequency optics"],
+    "chemistry": ["acid base reaction", "bond molecule energy", "oxidation catalyst rate"],
+    "biology": ["cell membrane protein", "gene dna energy", "enzyme reaction rate"],
+}
+
+
+def embed(texts):
+    """Deterministic bag-of-letters embedding."""
+    vectors = []
+    for text in texts:
+        vector = [0.0] * 26
+        for char in text.lower():
+            if "a" <= char <= "z":
+                vector[ord(char) - 97] += 1
+        vectors.append(vector)
+    return vectors
+
+
+def make_retriever(tmp_path, shard_by: str) -> AthenaRetriever:
+    config = AthenaConfig(
+        enabled=True,
+        data_dir=tmp_path / "notes",
+        index_dir=tmp_path / shard_by,
+        vector_backend="local",
+        shard_by=shard_by,
+    )
+    retriever = AthenaRetriever(config, embedding_function=embed)
+    for subject, texts in SUBJECTS.items():
+        retriever.add_documents(
+            [{"text": text, "page_number": 1} for text in texts],
+            file_name=f"{subject}.pdf",
+            subject=subject,
+            module=f"{subject}-intro",
+        )
+    retriever.persist()
+    return retriever
+
+
+class TestShardCatalog:
+
+    def test_slugs_are_safe_and_distinct(self):
+        assert shard_slug("C++") != shard_slug("C#")
+        assert shard_slug("Fluid Mechanics/II").startswith("fluid_mechanics_ii_")
+        assert len(shard_slug("x" * 200)) <= 41
+
+    def test_catalog_round_trip(self, tmp_path):
+        catalog = ShardCatalog(tmp_path / "catalog.json")
+        catalog.get_or_create("physics").count = 3
+        catalog.save()
+
+        reloaded = ShardCatalog(tmp_path / "catalog.json")
+        assert "physics" in reloaded
+        assert reloaded.get("physics").count == 3
+        assert reloaded.get("physics").name == shard_slug("physics")
+
+    def test_merge_ranked(self):
+        shard_a = [(0.9, "a1"), (0.5, "a2")]
+        shard_b = [(0.8, "b1"), (0.7, "b2"), (0.1, "b3")]
+        assert merge_ranked([shard_a, shard_b, []], 3) == [(0.9, "a1"), (0.8, "b1"), (0.7, "b2")]
+
+
+class TestShardedRetriever:
+
+    def test_one_index_per_shard(self, tmp_path):
+        retriever = make_retriever(tmp_path, "subject")
+        stats = retriever.get_index_stats()
+        assert stats["shards"] == {"physics": 3, "chemistry": 3, "biology": 3}
+        assert stats["total_chunks"] == 9
+        assert len(list(retriever.config.local_shards_path.iterdir())) == 3
+
+    def test_scoped_query_touches_one_shard(self, tmp_path):
+        retriever = make_retriever(tmp_path, "subject")
+        result = retriever.query("energy", subject_filter="chemistry", top_k=5)
+        assert result.metadata["shards_searched"] == 1
+        assert {source.subject for source in result.sources} == {"chemistry"}
+
+        missing = retriever.query("energy", subject_filter="history")
+        assert missing.sources == []
+
+    def test_non_shard_filter_applies_within_shards(self, tmp_path):
+        retriever = make_retriever(tmp_path, "subject")
+        result = retriever.query("energy", module_filter="biology-intro", top_k=5)
+        assert result.metadata["shards_searched"] == 3
+        assert {source.module for source in result.sources} == {"biology-intro"}
+
+    @pytest.mark.parametrize("shard_by", ["subject", "module"])
+    def test_fan_out_matches_unsharded(self, tmp_path, shard_by):
+        sharded = make_retriever(tmp_path, shard_by)
+        unsharded = make_retriever(tmp_path, "none")
+
+        for question in ("energy reaction", "wave", "protein cell"):
+            expected = unsharded.query(question, top_k=4).sources
+            result = sharded.query(question, top_k=4)
+            assert result.metadata["shards_searched"] == 3
+            assert [s.similarity_score for s in result.sources] == pytest.approx(
+                [s.similarity_score for s in expected]
+            )
+
+    def test_reingest_does_not_inflate_counts(self, tmp_path):
+        retriever = make_retriever(tmp_path, "subject")
+        retriever.add_documents(
+            [{"text": text, "page_number": 1} for text in SUBJECTS["physics"]],
+            file_name="physics.pdf",
+            subject="physics",
+        )
+        assert retriever.get_index_stats()["shards"]["physics"] == 3
+        assert retriever._catalog.get("physics").count == 3
+
+    def test_reload_from_catalog(self, tmp_path):
+        retriever = make_retriever(tmp_path, "subject")
+        reopened = AthenaRetriever(retriever.config, embedding_function=embed)
+        result = reopened.query("acid", subject_filter="chemistry", top_k=1)
+        assert result.total_indexed == 9
+        assert result.sources[0].text == "acid base reaction"
+
+    def test_parallel_fan_out(self, tmp_path, monkeypatch):
+        """Large libraries fan out on the thread pool with identical results."""
+        retriever = make_retriever(tmp_path, "subject")
+        expected = retriever.query("energy", top_k=4).sources
+
+        monkeypatch.setattr("athena.retriever.PARALLEL_FANOUT_MIN_CHUNKS", 0)
+        monkeypatch.setattr("athena.retriever.os.cpu_count", lambda: 4)
+        result = retriever.query("energy", top_k=4)
+
+        assert retriever._executor is not None
+        assert [s.chunk_id for s in result.sources] == [s.chunk_id for s in expected]
+
+
+class FakeCollection:
+    """In-memory stand-in for a Chroma collection that embeds with its function."""
+
+    def __init__(self, embedding_function):
+        self.embedding_function = embedding_function
+        self.rows = []
+        self.queries = []
+
+    def add(self, ids, documents, metadatas):
+        vectors = self.embedding_function(documents)
+        self.rows.extend(zip(vectors, documents, metadatas, strict=True))
+
+    def count(self):
+        return len(self.rows)
+
+    def query(self, query_embeddings, n_results, where=None, query_texts=None):
+        assert query_texts is None
+        self.queries.append(query_embeddings)
+        (query,) = query_embeddings
+        scored = sorted(
+            ((sum(a * b for a, b in zip(query, vector, strict=True)), text, metadata)
+             for vector, text, metadata in self.rows),
+            key=lambda row: -row[0],
+        )[:n_results]
+        return {
+            "documents": [[text for _, text, _ in scored]],
+            "metadatas": [[metadata for _, _, metadata in scored]],
+            "distances": [[1 - score for score, _, _ in scored]],
+        }
+
+
+class FakeClient:
+
+    def __init__(self):
+        self.collections = {}
+
+    def get_or_create_collection(self, name, metadata, embedding_function):
+        if name not in self.collections:
+            self.collections[name] = FakeCollection(embedding_function)
+        return self.collections[name]
+
+
+class TestChromaFanOut:
+
+    def test_query_is_embedded_once(self, tmp_path):
+        calls = []
+
+        def counting_embed(texts):
+            calls.append(list(texts))
+            return embed(texts)
+
+        config = AthenaConfig(
+            enabled=True,
+            data_dir=tmp_path / "notes",
+            index_dir=tmp_path / "index",
+            shard_by="subject",
+        )
+        retriever = AthenaRetriever(config, embedding_function=counting_embed)
+        retriever._chromadb_available = True
+        retriever._client = FakeClient()
+        for subject, texts in SUBJECTS.items():
+            retriever.add_documents(
+                [{"text": text, "page_number": 1} for text in texts],
+                file_name=f"{subject}.pdf",
+                subject=subject,
+            )
+
+        calls.clear()
+        result = retriever.query("energy", top_k=3)
+        assert result.metadata["shards_searched"] == 3
+        assert calls == [["energy"]]
+        assert all(len(c.queries) == 1 for c in retriever._client.collections.values())
+        assert "energy" in result.sources[0].text
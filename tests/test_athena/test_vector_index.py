@@ -0,0 +1,274 @@
+"""
+Tests for the local vector index and its quantized storage formats.
+"""
+
+import numpy as np
+import pytest
+
+from athena.config import AthenaConfig
+from athena.retriever import AthenaRetriever
+from athena.vector_index import MappedTexts, VectorIndex, current_version
+
+
+def clustered_vectors(n: int, dim: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(16, dim))
+    return centers[rng.integers(0, 16, n)] + 0.3 * rng.normal(size=(n, dim))
+
+
+def exact_top_k(vectors: np.ndarray, query: np.ndarray, k: int) -> list[int]:
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    scores = unit @ (query / np.linalg.norm(query))
+    return list(np.argsort(-scores)[:k])
+
+
+@pytest.fixture
+def data():
+    vectors = clustered_vectors(2000, 64)
+    queries = clustered_vectors(20, 64, seed=1)
+    return vectors, queries
+
+
+def build(storage: str, vectors: np.ndarray) -> VectorIndex:
+    index = VectorIndex(dim=vectors.shape[1], storage=storage)
+    ids = [f"doc_{i}" for i in range(len(vectors))]
+    # Several adds exercise capacity growth
+    for start in range(0, len(vectors), 300):
+        index.add(
+            ids[start:start + 300],
+            vectors[start:start + 300],
+            [{"subject": "even" if i % 2 == 0 else "odd"} for i in range(start, min(start + 300, len(vectors)))],
+        )
+    return index
+
+
+class TestVectorIndex:
+
+    def test_float32_matches_brute_force(self, data):
+        vectors, queries = data
+        index = build("float32", vectors)
+        for query in queries:
+            rows = [row for row, _ in index.search(query, top_k=10)]
+            assert rows == exact_top_k(vectors, query, 10)
+
+    @pytest.mark.parametrize("storage", ["float16", "int8"])
+    def test_quantized_recall_and_exact_scores(self, data, storage):
+        vectors, queries = data
+        index = build(storage, vectors)
+        unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+        found = 0
+        for query in queries:
+            hits = index.search(query, top_k=10)
+            truth = set(exact_top_k(vectors, query, 10))
+            found += len(truth & {row for row, _ in hits})
+
+            # Returned scores are float32 re-scores, not quantized estimates
+            q = query / np.linalg.norm(query)
+            for row, score in hits:
+                assert score == pytest.approx(float(unit[row] @ q), abs=1e-5)
+
+        assert found / (10 * len(queries)) >= 0.98
+
+    def test_memory_footprint(self, data):
+        vectors, _ = data
+        float32 = build("float32", vectors).nbytes
+        assert build("float16", vectors).nbytes == float32 // 2
+        assert build("int8", vectors).nbytes < float32 // 3
+
+    def test_metadata_filter(self, data):
+        vectors, queries = data
+        index = build("int8", vectors)
+        hits = index.search(queries[0], top_k=5, where={"subject": "odd"})
+        assert len(hits) == 5
+        assert all(index.metadatas[row]["subject"] == "odd" for row, _ in hits)
+        assert index.search(queries[0], where={"subject": "missing"}) == []
+
+    def test_save_and_load_maps_exact_vectors(self, data, tmp_path):
+        vectors, queries = data
+        index = build("int8", vectors)
+        index.save(tmp_path / "index")
+
+        loaded = VectorIndex.load(tmp_path / "index")
+        assert isinstance(loaded._exact, np.memmap)
+        assert len(loaded) == len(index)
+        assert loaded.search(queries[0], top_k=10) == index.search(queries[0], top_k=10)
+
+        # Saving over a mapped index keeps the mapping readable
+        loaded.add(["extra"], vectors[:1])
+        loaded.save(tmp_path / "index")
+        assert len(VectorIndex.load(tmp_path / "index")) == len(vectors) + 1
+
+    @pytest.mark.parametrize("storage", ["float32", "int8"])
+    def test_add_existing_id_replaces_row(self, storage):
+        index = VectorIndex(dim=4, storage=storage)
+        index.add(["a", "b"], [[1, 0, 0, 0], [0, 1, 0, 0]], [{"v": 1}, {"v": 1}], ["old a", "b"])
+        index.add(["a"], [[0, 0, 1, 0]], [{"v": 2}], ["new a"])
+
+        assert len(index) == 2
+        assert index.ids == ["a", "b"]
+        hits = index.search([0, 0, 1, 0], top_k=5)
+        assert [index.ids[row] for row, score in hits if score > 0.5] == ["a"]
+        assert index.documents[hits[0][0]] == "new a"
+        assert index.search([0, 0, 1, 0], where={"v": 1}, top_k=5)[0][1] < 0.5
+        assert index.search([1, 0, 0, 0], where={"v": 2}, top_k=5)[0][1] < 0.5
+
+    def test_repeated_id_in_one_add_keeps_last(self):
+        index = VectorIndex(dim=2)
+        index.add(["a", "a"], [[1, 0], [0, 1]], documents=["first", "second"])
+        assert len(index) == 1
+        assert index.documents == ["second"]
+        assert index.search([0, 1], top_k=5) == [(0, pytest.approx(1.0))]
+
+    def test_upsert_into_loaded_index(self, data, tmp_path):
+        vectors, _ = data
+        index = build("int8", vectors[:100])
+        index.save(tmp_path / "index")
+
+        loaded = VectorIndex.load(tmp_path / "index")
+        loaded.add(["doc_0"], vectors[50:51], documents=["replaced"])
+        assert len(loaded) == 100
+        assert loaded.search(vectors[50], top_k=2)[0][1] == pytest.approx(1.0, abs=1e-5)
+        rows = {row for row, _ in loaded.search(vectors[50], top_k=2)}
+        assert rows == {0, 50}
+
+    def test_empty_and_invalid(self):
+        index = VectorIndex(dim=4, storage="float16")
+        assert index.search([1, 0, 0, 0]) == []
+        with pytest.raises(ValueError):
+            VectorIndex(dim=4, storage="int4")
+        with pytest.raises(ValueError):
+            index.add(["a", "b"], [[1, 0, 0, 0]])
+
+
+class TestLocalBackend:
+
+    @staticmethod
+    def embed(texts):
+        # Deterministic bag-of-letters embedding
+        vectors = []
+        for text in texts:
+            vector = [0.0] * 26
+            for char in text.lower():
+                if "a" <= char <= "z":
+                    vector[ord(char) - 97] += 1
+            vectors.append(vector)
+        return vectors
+
+    def test_query_and_persist(self, tmp_path):
+        config = AthenaConfig(
+            enabled=True,
+            data_dir=tmp_path / "notes",
+            index_dir=tmp_path / "index",
+            vector_backend="local",
+            vector_storage="int8",
+        )
+        retriever = AthenaRetriever(config, embedding_function=self.embed)
+        retriever.add_documents(
+            [{"text": "zzz buzz fizz", "page_number": 1}, {"text": "aaa banana", "page_number": 2}],
+            file_name="notes.pdf",
+            subject="fruit",
+        )
+        retriever.persist()
+
+        reopened = AthenaRetriever(config, embedding_function=self.embed)
+        result = reopened.query("banana", subject_filter="fruit", top_k=1)
+        assert result.total_indexed == 2
+        assert result.sources[0].text == "aaa banana"
+        assert result.sources[0].page_number == 2
+        assert reopened.get_index_stats()["vector_storage"] == "int8"
+
+
+class TestVersionedStorage:
+
+    def test_versions_publish_and_prune(self, data, tmp_path):
+        vectors, queries = data
+        index = build("int8", vectors)
+        root = tmp_path / "index"
+
+        assert index.save(root) == "v000001"
+        first = VectorIndex.load(root)
+        expected = first.search(queries[0], top_k=5)
+        expected_text = first.documents[expected[0][0]]
+
+        index.add(["more"], vectors[:1])
+        assert index.save(root) == "v000002"
+        assert index.save(root) == "v000003"
+        assert current_version(root) == "v000003"
+        assert sorted(p.name for p in root.iterdir() if p.is_dir()) == ["v000002", "v000003"]
+
+        # The pruned version stays readable through the existing mapping
+        assert first.version == "v000001"
+        assert first.search(queries[0], top_k=5) == expected
+        assert first.documents[expected[0][0]] == expected_text
+
+    def test_load_maps_everything_read_only(self, data, tmp_path):
+        vectors, _ = data
+        index = build("float16", vectors)
+        index.documents = [f"text {i} é" for i in range(len(vectors))]
+        index.save(tmp_path / "index")
+
+        loaded = VectorIndex.load(tmp_path / "index")
+        assert isinstance(loaded._codes, np.memmap)
+        assert not loaded._codes.flags.writeable
+        assert isinstance(loaded.documents, MappedTexts)
+        assert loaded.documents[7] == "text 7 é"
+        assert loaded.documents[-1] == f"text {len(vectors) - 1} é"
+
+        in_ram = VectorIndex.load(tmp_path / "index", mmap=False)
+        assert not isinstance(in_ram._codes, np.memmap)
+        assert list(in_ram.documents) == list(loaded.documents)
+
+    def test_load_unpublished(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            VectorIndex.load(tmp_path)
+
+
+class TestHotSwap:
+
+    def make_config(self, tmp_path, **overrides):
+        return AthenaConfig(
+            enabled=True,
+            data_dir=tmp_path / "notes",
+            index_dir=tmp_path / "index",
+            vector_backend="local",
+            index_reload_interval=0,
+            **overrides,
+        )
+
+    @pytest.mark.parametrize("shard_by", ["none", "subject"])
+    def test_reader_picks_up_new_version(self, tmp_path, shard_by):
+        config = self.make_config(tmp_path, shard_by=shard_by)
+        embed = TestLocalBackend.embed
+
+        writer = AthenaRetriever(config, embedding_function=embed)
+        writer.add_documents([{"text": "alpha beta"}], file_name="a.pdf", subject="one")
+        writer.persist()
+
+        reader = AthenaRetriever(config, embedding_function=embed)
+        assert reader.query("alpha").total_indexed == 1
+
+        writer.add_documents([{"text": "gamma delta"}], file_name="b.pdf", subject="one")
+        writer.add_documents([{"text": "zeta eta"}], file_name="c.pdf", subject="two")
+        writer.persist()
+
+        result = reader.query("gamma", top_k=1)
+        assert result.total_indexed == 3
+        assert result.sources[0].text == "gamma delta"
+
+    def test_reload_interval_throttles_checks(self, tmp_path):
+        config = self.make_config(tmp_path)
+        config.index_reload_interval = 3600
+        embed = TestLocalBackend.embed
+
+        writer = AthenaRetriever(config, embedding_function=embed)
+        writer.add_documents([{"text": "alpha"}], file_name="a.pdf")
+        writer.persist()
+        reader = AthenaRetriever(config, embedding_function=embed)
+        assert reader.query("alpha").total_indexed == 1
+
+        writer.add_documents([{"text": "beta"}], file_name="b.pdf")
+        writer.persist()
+        assert reader.query("beta").total_indexed == 1
+        assert reader.refresh() is True
+        assert reader.query("beta").total_indexed == 2
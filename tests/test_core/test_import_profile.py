@@ -0,0 +1,72 @@
+"""
+Tests for the startup import profiler.
+"""
+
+import sys
+
+import pytest
+
+from core.import_profile import ImportProfiler, start_if_requested
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    """hearth_prof_pkg imports a and b; a imports c."""
+    root = tmp_path / "hearth_prof_pkg"
+    root.mkdir()
+    (root / "__init__.py").write_text("from . import a, b\n")
+    (root / "a.py").write_text("import time\nfrom . import c\ntime.sleep(0.02)\n")
+    (root / "b.py").write_text("")
+    (root / "c.py").write_text("import time\ntime.sleep(0.03)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "hearth_prof_pkg"
+    for name in list(sys.modules):
+        if name.startswith("hearth_prof_pkg"):
+            del sys.modules[name]
+
+
+class TestImportProfiler:
+
+    def test_records_import_tree(self, package):
+        profiler = ImportProfiler().start()
+        try:
+            __import__(package)
+        finally:
+            profiler.stop()
+
+        (root,) = profiler.roots
+        assert root.name == package
+        assert [child.name for child in root.children] == [f"{package}.a", f"{package}.b"]
+        a = root.children[0]
+        assert [child.name for child in a.children] == [f"{package}.c"]
+
+        c = a.children[0]
+        assert c.total_ms >= 30
+        assert a.total_ms >= 50
+        assert 20 <= a.self_ms < a.total_ms
+        assert profiler.slowest(1)[0].name == f"{package}.c"
+
+    def test_report(self, package):
+        profiler = ImportProfiler().start()
+        try:
+            __import__(package)
+        finally:
+            profiler.stop()
+
+        report = profiler.report(min_ms=10)
+        assert f"    {package}.c" in report
+        assert f"{package}.b" not in report
+        assert profiler.roots[0].to_dict()["module"] == package
+
+    def test_stop_removes_hook(self):
+        profiler = ImportProfiler().start()
+        profiler.stop()
+        assert profiler not in sys.meta_path
+
+    def test_start_if_requested(self, monkeypatch):
+        monkeypatch.delenv("HEARTH_PROFILE_IMPORTS", raising=False)
+        assert start_if_requested(["main.py"]) is None
+
+        profiler = start_if_requested(["main.py", "--profile-imports"])
+        assert profiler is not None and profiler.active
+        profiler.stop()
@@ -0,0 +1,184 @@
+"""
+Tests for lazy, once-only subsystem construction.
+"""
+
+import sys
+import threading
+import time
+
+import pytest
+
+from core.lazy import (
+    deferred_imports,
+    is_built,
+    is_loaded,
+    lazy_import,
+    module_available,
+    prewarm,
+    subsystem,
+    subsystem_names,
+    subsystem_timings,
+)
+
+
+class Host:
+    def __init__(self):
+        self.builds = {"slow": 0, "fast": 0}
+
+    @subsystem
+    def slow(self):
+        self.builds["slow"] += 1
+        time.sleep(0.05)
+        return object()
+
+    @subsystem
+    def fast(self):
+        self.builds["fast"] += 1
+        return "fast"
+
+    @subsystem
+    def broken(self):
+        raise RuntimeError("unavailable")
+
+
+class TestSubsystem:
+
+    def test_built_on_first_use_only(self):
+        host = Host()
+        assert not is_built(host, "slow")
+        first = host.slow
+        assert host.slow is first
+        assert host.builds == {"slow": 1, "fast": 0}
+        assert set(subsystem_timings(host)) == {"slow"}
+        assert subsystem_timings(host)["slow"] >= 50
+
+    def test_concurrent_first_access_builds_once(self):
+        host = Host()
+        barrier = threading.Barrier(8)
+        seen = []
+
+        def access():
+            barrier.wait()
+            seen.append(host.slow)
+
+        threads = [threading.Thread(target=access) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert host.builds["slow"] == 1
+        assert len({id(value) for value in seen}) == 1
+
+    def test_assignment_replaces_without_building(self):
+        host = Host()
+        host.slow = "double"
+        assert host.slow == "double"
+        assert host.builds["slow"] == 0
+
+    def test_failed_build_is_retried(self):
+        host = Host()
+        with pytest.raises(RuntimeError):
+            _ = host.broken
+        assert not is_built(host, "broken")
+
+    def test_prewarm(self):
+        host = Host()
+        thread = prewarm(host, ["slow", "broken", "fast"])
+        thread.join()
+        assert is_built(host, "slow") and is_built(host, "fast")
+        assert not is_built(host, "broken")
+
+        assert prewarm(Host(), []) is None
+        with pytest.raises(ValueError):
+            prewarm(host, ["missing"])
+
+    def test_subsystem_names(self):
+        assert subsystem_names(Host) == ["slow", "fast", "broken"]
+
+
+@pytest.fixture
+def heavy_module(tmp_path, monkeypatch):
+    """A throwaway top-level module that records when it is executed."""
+    (tmp_path / "hearth_heavy_dep.py").write_text(
+        "import sys\n"
+        "sys.hearth_heavy_dep_loads = getattr(sys, 'hearth_heavy_dep_loads', 0) + 1\n"
+        "VALUE = 42\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "hearth_heavy_dep"
+    sys.modules.pop("hearth_heavy_dep", None)
+    if hasattr(sys, "hearth_heavy_dep_loads"):
+        del sys.hearth_heavy_dep_loads
+
+
+class TestLazyImport:
+
+    def test_imported_on_first_attribute_access(self, heavy_module):
+        module = lazy_import(heavy_module)
+        assert heavy_module not in sys.modules
+        assert not is_loaded(module)
+
+        assert module.VALUE == 42
+        assert is_loaded(module)
+        assert module.VALUE == 42
+        assert sys.hearth_heavy_dep_loads == 1
+        assert heavy_module in deferred_imports()
+
+    def test_already_imported_module(self):
+        module = lazy_import("json")
+        assert is_loaded(module)
+        assert module.dumps([]) == "[]"
+
+    def test_missing_module_fails_on_use(self):
+        module = lazy_import("hearth_no_such_module")
+        assert not module_available("hearth_no_such_module")
+        with pytest.raises(ImportError):
+            _ = module.anything
+
+    def test_module_available_does_not_import(self, heavy_module):
+        assert module_available(heavy_module)
+        assert heavy_module not in sys.modules
+
+    def test_allowed_through_artemis_import_guard(self, heavy_module):
+        import builtins
+        import importlib
+
+        from artemis.guardian import ArtemisGuardian
+        from artemis.state import SecurityState
+
+        module = lazy_import(heavy_module)
+        guardian = ArtemisGuardian()
+        original_import, original_import_module = builtins.__import__, importlib.import_module
+        guardian._install_import_hardening()
+        try:
+            value = module.VALUE
+            with pytest.raises(RuntimeError):
+                __import__("hearth_undeclared_module")
+        finally:
+            builtins.__import__, importlib.import_module = original_import, original_import_module
+
+        assert value == 42
+        assert guardian.get_state() == SecurityState.COMPROMISED
+
+    def test_guard_allows_only_the_deferred_resolution(self, heavy_module):
+        import builtins
+        import importlib
+
+        from artemis.guardian import ArtemisGuardian
+
+        module = lazy_import(heavy_module)
+        guardian = ArtemisGuardian()
+        original_import, original_import_module = builtins.__import__, importlib.import_module
+        guardian._install_import_hardening()
+        try:
+            # A declared name is not a pass for plain imports
+            with pytest.raises(RuntimeError):
+                __import__(heavy_module)
+            assert module.VALUE == 42
+        finally:
+            builtins.__import__, importlib.import_module = original_import, original_import_module
+
+        # A second placeholder reuses the loaded module without importing
+        assert lazy_import(heavy_module).VALUE == 42
+        assert sys.hearth_heavy_dep_loads == 1
@@ -0,0 +1,22 @@
+"""
+Fixtures for Hestia tests.
+"""
+
+import pytest
+import pytest_asyncio
+
+
+@pytest_asyncio.fixture
+async def ollama():
+    """A running FakeOllama; its base URL is ollama.url."""
+    pytest.importorskip("aiohttp")
+    from aiohttp.test_utils import TestServer
+
+    from tests.test_hestia.fake_ollama import FakeOllama
+
+    fake = FakeOllama()
+    server = TestServer(fake.app())
+    await server.start_server()
+    fake.url = str(server.make_url("")).rstrip("/")
+    yield fake
+    await server.close()
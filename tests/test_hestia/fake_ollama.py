@@ -0,0 +1,91 @@
+"""
+Local fake Ollama server for client tests.
+"""
+
+import asyncio
+import json
+
+from aiohttp import web
+
+TOKENS = ["The", " answer", " is", " 42", "."]
+
+
+class FakeOllama:
+    """
+    Serves /api/tags and /api/generate like Ollama.
+
+    Generation emits TOKENS one every token_delay seconds, as NDJSON when
+    streaming or as one JSON object otherwise. The prompt "fail" returns
+    a 500 error. With truncate set, a stream ends without its done
+    object, as when the server dies mid-generation. The first request after start (or after keep_alive 0)
+    also waits load_delay seconds and reports it as load_duration; an
+    empty prompt only loads the model.
+    """
+
+    def __init__(self, token_delay: float = 0.2, load_delay: float = 0.0):
+        self.token_delay = token_delay
+        self.load_delay = load_delay
+        self.truncate = False
+        self.loaded = False
+        self.disconnected = asyncio.Event()
+        self.tokens_sent = 0
+        self.payloads = []
+        self.active = 0
+        self.max_active = 0
+        self.url = ""
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/api/tags", self.tags)
+        app.router.add_post("/api/generate", self.generate)
+        return app
+
+    async def tags(self, request):
+        return web.json_response({"models": []})
+
+    async def generate(self, request):
+        payload = await request.json()
+        self.payloads.append(payload)
+        if payload["prompt"] == "fail":
+            return web.Response(status=500, text="model not found")
+
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            load_duration = 0
+            if not self.loaded:
+                await asyncio.sleep(self.load_delay)
+                load_duration = int(self.load_delay * 1e9)
+                self.loaded = True
+            if payload.get("keep_alive") == 0:
+                self.loaded = False
+
+            if not payload["prompt"]:
+                return web.json_response(
+                    {"response": "", "done": True, "done_reason": "load", "load_duration": load_duration}
+                )
+            if payload.get("stream", True):
+                return await self._stream(request, load_duration)
+            for _ in TOKENS:
+                await asyncio.sleep(self.token_delay)
+            return web.json_response(
+                {"response": "".join(TOKENS), "done": True, "load_duration": load_duration}
+            )
+        finally:
+            self.active -= 1
+
+    async def _stream(self, request, load_duration: int):
+        response = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+        await response.prepare(request)
+        try:
+            for token in TOKENS:
+                await response.write(json.dumps({"response": token, "done": False}).encode() + b"\n")
+                self.tokens_sent += 1
+                await asyncio.sleep(self.token_delay)
+            if not self.truncate:
+                done = {"response": "", "done": True, "load_duration": load_duration}
+                await response.write(json.dumps(done).encode() + b"\n")
+        except (ConnectionResetError, asyncio.CancelledError):
+            self.disconnected.set()
+            raise
+        return response
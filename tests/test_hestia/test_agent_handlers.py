@@ -0,0 +1,129 @@
+"""
+Tests for HestiaAgent handler offloading and lazy subsystem construction.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from hestia.agent import HestiaAgent
+
+
+def make_agent(**config) -> HestiaAgent:
+    return HestiaAgent({"enable_athena": False, **config})
+
+
+class SlowHandler:
+    """Blocking stand-in for a domain's handle(), tracking concurrency."""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.active = 0
+        self.max_active = 0
+        self.threads = set()
+        self._lock = threading.Lock()
+
+    def __call__(self, user_input: str) -> str:
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        self.threads.add(threading.current_thread().name)
+        time.sleep(self.seconds)
+        with self._lock:
+            self.active -= 1
+        return "slow answer"
+
+
+class TestHandlerOffload:
+
+    @pytest.mark.asyncio
+    async def test_slow_handler_does_not_block_other_requests(self):
+        agent = make_agent()
+        agent.hephaestus.handle = SlowHandler(0.3)
+
+        started = time.perf_counter()
+        slow = asyncio.create_task(agent.process("debug this"))
+        greeting = await agent.process("hello")
+        assert time.perf_counter() - started < 0.2
+        assert greeting.intent == "greeting"
+
+        assert (await slow).text == "slow answer"
+        assert all(name.startswith("hestia-handler") for name in agent.hephaestus.handle.threads)
+        await agent.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_per_intent_limit(self):
+        agent = make_agent(handler_concurrency={"hephaestus_query": 2})
+        agent.hephaestus.handle = handler = SlowHandler(0.05)
+        agent.hermes.handle = other = SlowHandler(0.05)
+
+        await asyncio.gather(
+            *[agent.process("debug this") for _ in range(6)],
+            *[agent.process("rephrase this") for _ in range(6)],
+        )
+        assert handler.max_active == 2
+        assert other.max_active == 4  # HANDLER_CONCURRENCY default
+        await agent.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_deadline(self):
+        agent = make_agent(handler_deadlines={"hephaestus_query": 0.05})
+        agent.hephaestus.handle = handler = SlowHandler(0.3)
+
+        response = await agent.process("debug this")
+        assert "took too long" in response.text
+        assert agent.handler_timeouts == 1
+
+        # The slot is released once the abandoned handler finishes
+        await asyncio.sleep(0.35)
+        assert handler.active == 0
+        assert agent._handler_limits["hephaestus_query"]._value == 4
+        await agent.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_inline_mode(self):
+        agent = make_agent(offload_handlers=False)
+        agent.hermes.handle = handler = SlowHandler(0)
+
+        await agent.process("rephrase this")
+        assert handler.threads == {threading.current_thread().name}
+        assert agent._handler_executor is None
+
+
+class TestLazySubsystems:
+
+    def test_nothing_built_until_used(self, tmp_path):
+        agent = make_agent(memory_db_path=str(tmp_path / "memory.db"))
+        assert agent.startup_timings() == {}
+
+        assert agent.hermes.handle("rephrase this")
+        assert set(agent.startup_timings()) == {"hermes"}
+
+    @pytest.mark.asyncio
+    async def test_process_builds_only_the_routed_domain(self, tmp_path):
+        agent = make_agent(memory_db_path=str(tmp_path / "memory.db"))
+        await agent.process("debug this")
+        assert set(agent.startup_timings()) == {"hephaestus"}
+        await agent.cleanup()
+
+    def test_prewarm_config(self, tmp_path):
+        agent = make_agent(
+            memory_db_path=str(tmp_path / "memory.db"),
+            prewarm=["memory_service", "pluto"],
+        )
+        agent._prewarm_thread.join()
+        assert set(agent.startup_timings()) == {"memory_service", "pluto"}
+
+    @pytest.mark.asyncio
+    async def test_sessions_are_configured_and_cleared(self):
+        agent = make_agent(max_sessions=2, session_ttl_seconds=60)
+        context = agent.sessions.get("alice")
+        context.append("notes")
+        assert agent.sessions.max_sessions == 2
+        assert context.ttl_seconds_remaining() <= 60
+
+        await agent.cleanup()
+        assert len(agent.sessions) == 0
+        assert context.state == "DESTROYED"
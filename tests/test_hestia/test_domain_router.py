@@ -0,0 +1,234 @@
+"""
+Tests for DomainRouter's dispatch table and route_many.
+
+hestia/domain_router.py imports relative to a parent package above the
+repo root, and domains.base does not import against the current
+kernel, so the router is loaded under a throwaway parent package with
+in-memory stand-ins for the modules it imports.
+"""
+
+import asyncio
+import importlib.util
+import sys
+import types
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict
+from uuid import uuid4
+
+import pytest
+
+ROUTER_PATH = Path(__file__).resolve().parents[2] / "hestia" / "domain_router.py"
+PARENT = "_router_under_test"
+
+
+class DomainCapability(Enum):
+    DRAFT_MESSAGE = "draft_message"
+    CODE_ANALYSIS = "code_analysis"
+
+
+@dataclass
+class DomainRequest:
+    domain_name: str
+    capability: DomainCapability
+    user_id: str
+    session_id: str
+    input_data: Dict[str, Any]
+    context: Dict[str, Any] = field(default_factory=dict)
+    request_id: str = field(default_factory=lambda: str(uuid4()))
+
+
+@dataclass
+class DomainResult:
+    request_id: str
+    domain_name: str
+    capability: DomainCapability
+    confidence: float = 0.8
+    processing_time_ms: float = 0.0
+
+
+class IDomainModule:
+    pass
+
+
+class ServiceRegistry:
+    def __init__(self, services=None):
+        self.services = dict(services or {})
+
+    def list_services(self):
+        return {name: type(service) for name, service in self.services.items()}
+
+    def get(self, name, interface):
+        return self.services[name]
+
+
+class StructuredLogger:
+    def __init__(self, name):
+        pass
+
+    def __getattr__(self, level):
+        return lambda *args, **kwargs: None
+
+
+class FakeDomain(IDomainModule):
+    """Domain stand-in tracking how many requests it holds at once."""
+
+    def __init__(self, name, capabilities, fail=False, on_request=None):
+        self.name = name
+        self.capabilities = set(capabilities)
+        self.fail = fail
+        self.on_request = on_request
+        self.active = 0
+        self.max_active = 0
+        self.calls = 0
+
+    def get_domain_name(self):
+        return self.name
+
+    def supports_capability(self, capability):
+        return capability in self.capabilities
+
+    async def process_request(self, request):
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            if self.on_request:
+                self.on_request()
+            await asyncio.sleep(0.01)
+            if self.fail:
+                raise RuntimeError(f"{self.name} failed")
+            return DomainResult(
+                request_id=request.request_id,
+                domain_name=self.name,
+                capability=request.capability,
+            )
+        finally:
+            self.active -= 1
+
+
+def _module(monkeypatch, name, **attrs):
+    module = types.ModuleType(name)
+    module.__path__ = []
+    module.__dict__.update(attrs)
+    monkeypatch.setitem(sys.modules, name, module)
+    return module
+
+
+@pytest.fixture
+def router_module(monkeypatch):
+    _module(monkeypatch, PARENT)
+    for package in ("core", "domains", "shared", "shared.logging", "hestia"):
+        _module(monkeypatch, f"{PARENT}.{package}")
+    _module(monkeypatch, f"{PARENT}.core.service_registry", ServiceRegistry=ServiceRegistry)
+    _module(
+        monkeypatch, f"{PARENT}.domains.base",
+        DomainCapability=DomainCapability,
+        DomainRequest=DomainRequest,
+        DomainResult=DomainResult,
+        IDomainModule=IDomainModule,
+    )
+    _module(
+        monkeypatch, f"{PARENT}.shared.logging.structured_logger",
+        StructuredLogger=StructuredLogger,
+    )
+
+    name = f"{PARENT}.hestia.domain_router"
+    spec = importlib.util.spec_from_file_location(name, ROUTER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, name, module)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_router(router_module, *domains, priorities=None):
+    registry = ServiceRegistry({f"domain_{d.name}": d for d in domains})
+    router = router_module.DomainRouter(registry)
+    for domain in domains:
+        for capability in domain.capabilities:
+            router.add_route(router_module.DomainRoute(
+                capability=capability,
+                domain_name=domain.name,
+                priority=(priorities or {}).get(domain.name, 1),
+            ))
+    return router
+
+
+def make_requests(router_module, count, capability=DomainCapability.DRAFT_MESSAGE):
+    return [
+        router_module.RouteRequest(
+            capability=capability, user_id="u", session_id=str(i), input_data={}
+        )
+        for i in range(count)
+    ]
+
+
+class TestDispatchTable:
+
+    def test_fallback_order_follows_priority(self, router_module):
+        low = FakeDomain("hermes", [DomainCapability.DRAFT_MESSAGE])
+        high = FakeDomain("apollo", [DomainCapability.DRAFT_MESSAGE])
+        router = make_router(router_module, low, high, priorities={"apollo": 5})
+
+        assert router.dispatch_table[DomainCapability.DRAFT_MESSAGE] == ("apollo", "hermes")
+        assert router.find_domain_for_capability(DomainCapability.DRAFT_MESSAGE) == "apollo"
+
+    def test_available_capabilities_need_an_enabled_domain(self, router_module):
+        hermes = FakeDomain("hermes", [DomainCapability.DRAFT_MESSAGE])
+        hephaestus = FakeDomain("hephaestus", [DomainCapability.CODE_ANALYSIS])
+        router = make_router(router_module, hermes, hephaestus)
+
+        router.enable_domain("hephaestus", False)
+        assert router.get_available_capabilities() == [DomainCapability.DRAFT_MESSAGE]
+
+        router.enable_domain("hephaestus")
+        assert set(router.get_available_capabilities()) == set(DomainCapability)
+
+
+class TestRouteMany:
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, router_module):
+        hermes = FakeDomain("hermes", [DomainCapability.DRAFT_MESSAGE])
+        router = make_router(router_module, hermes)
+
+        results = await router.route_many(make_requests(router_module, 20), max_concurrency=3)
+
+        assert all(r.domain_name == "hermes" for r in results)
+        assert hermes.max_active == 3
+
+    @pytest.mark.asyncio
+    async def test_rejects_non_positive_limit(self, router_module):
+        router = make_router(router_module, FakeDomain("hermes", [DomainCapability.DRAFT_MESSAGE]))
+        with pytest.raises(ValueError):
+            await router.route_many(make_requests(router_module, 1), max_concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_failures_fall_back_and_stay_in_their_slot(self, router_module):
+        broken = FakeDomain("apollo", [DomainCapability.DRAFT_MESSAGE], fail=True)
+        hermes = FakeDomain("hermes", [DomainCapability.DRAFT_MESSAGE])
+        router = make_router(router_module, broken, hermes, priorities={"apollo": 5})
+        requests = make_requests(router_module, 2)
+        requests += make_requests(router_module, 1, DomainCapability.CODE_ANALYSIS)
+
+        results = await router.route_many(requests)
+        assert [r.domain_name for r in results[:2]] == ["hermes", "hermes"]
+        assert isinstance(results[2], ValueError)
+
+        results = await router.route_many(requests[:1], fallback=False)
+        assert isinstance(results[0], RuntimeError)
+
+    @pytest.mark.asyncio
+    async def test_batch_routes_from_its_snapshot(self, router_module):
+        def reload_routes():
+            router.routes.clear()
+            router._dispatch = None
+
+        hermes = FakeDomain("hermes", [DomainCapability.DRAFT_MESSAGE], on_request=reload_routes)
+        router = make_router(router_module, hermes)
+
+        results = await router.route_many(make_requests(router_module, 4), max_concurrency=1)
+
+        assert all(r.domain_name == "hermes" for r in results)
+        assert router.get_available_capabilities() == []
@@ -0,0 +1,66 @@
+"""
+Tests for the compiled intent matcher.
+"""
+
+import pytest
+
+from hestia.intent_classifier import IntentClassifier
+
+
+@pytest.fixture(scope="module")
+def classifier():
+    return IntentClassifier()
+
+
+class TestWordBoundaries:
+
+    @pytest.mark.parametrize("text", [
+        "this is fine",
+        "a billion of them",
+        "the fund closed",
+        "start the article",
+        "somehow it worked",
+    ])
+    def test_no_match_inside_words(self, classifier, text):
+        assert classifier.classify(text) == "general"
+
+    @pytest.mark.parametrize("text, intent", [
+        ("Hi!", "greeting"),
+        ("debugging the parser", "hephaestus_query"),
+        ("these errors again", "hephaestus_query"),
+        ("good songs please", "dionysus_query"),
+        ("our budgets", "pluto_query"),
+        ("Search my   notes, please", "athena_query"),
+    ])
+    def test_whole_words_and_inflections(self, classifier, text, intent):
+        assert classifier.classify(text) == intent
+
+
+class TestPriority:
+
+    def test_higher_tier_wins_wherever_it_occurs(self, classifier):
+        assert classifier.classify("how is my budget? show my memories") == "memory_query"
+        assert classifier.classify("what about the music code") == "hephaestus_query"
+
+    def test_longer_phrase_in_higher_tier(self, classifier):
+        # "look up in my" (athena) is a prefix of a knowledge pattern
+        assert classifier.classify("look up in my knowledge base") == "knowledge_query"
+        assert classifier.classify("look up in my pdfs") == "athena_query"
+
+    def test_keyword_order(self, classifier):
+        assert classifier.classify("hello, what is this") == "greeting"
+        assert classifier.classify("tell me why") == "question"
+
+
+class TestBatchAndRecompile:
+
+    def test_classify_many_matches_classify(self, classifier):
+        texts = ["hi", "show memories", "rephrase this", "", "nothing here"]
+        assert classifier.classify_many(texts) == [classifier.classify(t) for t in texts]
+
+    def test_compile_picks_up_edited_patterns(self):
+        classifier = IntentClassifier()
+        classifier.pluto_patterns.append("mortgage")
+        assert classifier.classify("my mortgage") == "general"
+        classifier.compile()
+        assert classifier.classify("my mortgage") == "pluto_query"
@@ -0,0 +1,104 @@
+"""
+Tests for OllamaClient admission control (concurrency cap, queue limit, deadlines).
+"""
+
+import asyncio
+import time
+
+import pytest
+import pytest_asyncio
+
+pytest.importorskip("aiohttp")
+
+from hestia.ollama_client import OllamaBusyError, OllamaClient
+
+
+@pytest_asyncio.fixture
+async def make_client(ollama):
+    clients = []
+
+    async def make(**kwargs):
+        ollama.token_delay = 0.02  # 0.1 s per generation
+        client = OllamaClient(base_url=ollama.url, timeout=5, **kwargs)
+        await client.initialize()
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        await client.cleanup()
+
+
+async def settle(results):
+    return await asyncio.gather(*results, return_exceptions=True)
+
+
+class TestAdmission:
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_capped(self, ollama, make_client):
+        client = await make_client(max_concurrency=2, max_queue=10)
+        results = await settle([client.generate(f"q{i}") for i in range(6)])
+
+        assert all(r == "The answer is 42." for r in results)
+        assert ollama.max_active == 2
+        stats = client.get_stats()
+        assert stats["admitted"] == 6
+        assert stats["in_flight"] == 0 and stats["queued"] == 0
+        # Later requests waited roughly two generations for a slot
+        assert stats["queue_wait_max_ms"] >= 150
+
+    @pytest.mark.asyncio
+    async def test_full_queue_fails_fast(self, ollama, make_client):
+        client = await make_client(max_concurrency=1, max_queue=2)
+        tasks = [asyncio.create_task(client.generate(f"q{i}")) for i in range(3)]
+        await asyncio.sleep(0.01)
+
+        started = time.perf_counter()
+        with pytest.raises(OllamaBusyError) as info:
+            await client.generate("one too many")
+        assert time.perf_counter() - started < 0.05
+        assert info.value.retriable and info.value.retry_after > 0
+
+        assert all(isinstance(r, str) for r in await settle(tasks))
+        assert client.get_stats()["rejected"] == 1
+        assert len(ollama.payloads) == 3
+
+    @pytest.mark.asyncio
+    async def test_deadline_expires_in_queue(self, ollama, make_client):
+        client = await make_client(max_concurrency=1, max_queue=5)
+        first = asyncio.create_task(client.generate("slow"))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(OllamaBusyError, match="Deadline"):
+            await client.generate("hurry", deadline=0.03)
+
+        await first
+        assert client.get_stats()["deadline_expired"] == 1
+        assert [p["prompt"] for p in ollama.payloads] == ["slow"]
+
+    @pytest.mark.asyncio
+    async def test_deadline_bounds_generation(self, make_client):
+        client = await make_client()
+        with pytest.raises(RuntimeError, match="timed out"):
+            await client.generate("too slow", deadline=0.03)
+        # The slot is released after the timeout
+        assert client.get_stats()["in_flight"] == 0
+        assert await client.generate("again") == "The answer is 42."
+
+    @pytest.mark.asyncio
+    async def test_stream_holds_slot_until_closed(self, ollama, make_client):
+        client = await make_client(max_concurrency=1, max_queue=0)
+        stream = client.generate_stream("streaming")
+        await stream.__anext__()
+
+        with pytest.raises(OllamaBusyError):
+            await client.generate("blocked")
+        await stream.aclose()
+        assert await client.generate("now") == "The answer is 42."
+
+    def test_invalid_limits(self):
+        with pytest.raises(ValueError):
+            OllamaClient(max_concurrency=0)
+        with pytest.raises(ValueError):
+            OllamaClient(max_queue=-1)
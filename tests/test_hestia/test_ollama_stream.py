@@ -0,0 +1,111 @@
+"""
+Tests for streamed generation against a local fake Ollama server.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+
+pytest.importorskip("aiohttp")
+
+from hestia.agent import HestiaAgent
+from hestia.ollama_client import OllamaClient
+from tests.test_hestia.fake_ollama import TOKENS
+
+TOKEN_DELAY = 0.2
+
+
+@pytest_asyncio.fixture
+async def client(ollama):
+    client = OllamaClient(base_url=ollama.url, timeout=5)
+    await client.initialize()
+    yield client
+    await client.cleanup()
+
+
+class TestGenerateStream:
+
+    @pytest.mark.asyncio
+    async def test_first_token_arrives_before_generation_ends(self, ollama, client):
+        started = time.perf_counter()
+        arrivals = []
+        chunks = []
+        async for text in client.generate_stream("question"):
+            arrivals.append(time.perf_counter() - started)
+            chunks.append(text)
+
+        assert "".join(chunks) == "".join(TOKENS)
+        assert ollama.payloads[0]["stream"] is True
+        # Time to first token is one chunk, not the whole generation
+        assert arrivals[0] < TOKEN_DELAY
+        assert arrivals[-1] >= TOKEN_DELAY * (len(TOKENS) - 1)
+
+    @pytest.mark.asyncio
+    async def test_closing_the_stream_disconnects(self, ollama, client):
+        stream = client.generate_stream("question")
+        assert await stream.__anext__() == TOKENS[0]
+        await stream.aclose()
+
+        await asyncio.wait_for(ollama.disconnected.wait(), timeout=2)
+        assert ollama.tokens_sent < len(TOKENS)
+
+    @pytest.mark.asyncio
+    async def test_error_status(self, client):
+        with pytest.raises(RuntimeError, match="500"):
+            async for _ in client.generate_stream("fail"):
+                pass
+
+
+class TestAgentStream:
+
+    @pytest_asyncio.fixture
+    async def agent(self, ollama):
+        agent = HestiaAgent({"enable_llm": True, "ollama_url": ollama.url, "enable_athena": False})
+        await agent.initialize()
+        yield agent
+        await agent.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_llm_reply_streams_chunks(self, agent):
+        chunks = [chunk async for chunk in agent.process_stream("tell me something")]
+
+        assert [c.text for c in chunks[:-1]] == TOKENS
+        assert chunks[-1].done and chunks[-1].text == ""
+        assert len({c.response_id for c in chunks}) == 1
+        assert {c.intent for c in chunks} == {"information_request"}
+
+    @pytest.mark.asyncio
+    async def test_accepts_interface_user_input(self, agent):
+        user_input = SimpleNamespace(
+            text="tell me something", session_id="s1", user_id="u1", metadata={}
+        )
+        chunks = [chunk async for chunk in agent.process_stream(user_input)]
+
+        assert [c.text for c in chunks[:-1]] == TOKENS
+        assert {c.intent for c in chunks} == {"information_request"}
+
+    @pytest.mark.asyncio
+    async def test_domain_reply_is_one_chunk(self, agent, ollama):
+        chunks = [chunk async for chunk in agent.process_stream("summarize this text")]
+
+        assert len(chunks) == 1
+        assert chunks[0].done and chunks[0].intent == "hermes_query"
+        assert ollama.payloads == []
+
+    @pytest.mark.asyncio
+    async def test_cancelled_consumer_stops_generation(self, agent, ollama):
+        async def consume():
+            async for _ in agent.process_stream("tell me something"):
+                pass
+
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(TOKEN_DELAY / 2)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        await asyncio.wait_for(ollama.disconnected.wait(), timeout=2)
+        assert ollama.tokens_sent < len(TOKENS)
@@ -0,0 +1,80 @@
+"""
+Tests for model warm-up, keep_alive and the cold/warm latency metric.
+"""
+
+import pytest
+import pytest_asyncio
+
+pytest.importorskip("aiohttp")
+
+from hestia.agent import HestiaAgent
+from hestia.ollama_client import OllamaClient
+
+LOAD_DELAY = 0.3
+
+
+@pytest_asyncio.fixture
+async def make_client(ollama):
+    clients = []
+    ollama.token_delay = 0.0
+    ollama.load_delay = LOAD_DELAY
+
+    async def make(**kwargs):
+        client = OllamaClient(base_url=ollama.url, timeout=5, **kwargs)
+        await client.initialize()
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        await client.cleanup()
+
+
+class TestWarmUp:
+
+    @pytest.mark.asyncio
+    async def test_first_request_is_cold_without_warm_up(self, make_client):
+        client = await make_client()
+        for _ in range(3):
+            await client.generate("hello")
+
+        stats = client.get_stats()
+        assert (stats["cold_samples"], stats["warm_samples"]) == (1, 2)
+        assert stats["cold_latency_p99_ms"] >= LOAD_DELAY * 1000
+        assert stats["warm_latency_p99_ms"] < LOAD_DELAY * 1000
+
+    @pytest.mark.asyncio
+    async def test_warm_up_takes_the_load(self, ollama, make_client):
+        client = await make_client()
+        assert await client.warm_up() >= LOAD_DELAY * 1000
+        assert ollama.payloads[0]["prompt"] == ""
+
+        await client.generate("hello")
+        chunks = [c async for c in client.generate_stream("hello")]
+        assert chunks
+
+        stats = client.get_stats()
+        assert stats["cold_samples"] == 0 and stats["warm_samples"] == 2
+        assert stats["warm_latency_p99_ms"] < LOAD_DELAY * 1000
+
+    @pytest.mark.asyncio
+    async def test_keep_alive_policy_is_sent(self, ollama, make_client):
+        await (await make_client()).generate("a")
+        await (await make_client(keep_alive=-1)).generate("b")
+        await (await make_client(keep_alive=None)).generate("c")
+
+        assert [p.get("keep_alive") for p in ollama.payloads] == ["30m", -1, None]
+        assert "keep_alive" not in ollama.payloads[2]
+
+    @pytest.mark.asyncio
+    async def test_agent_warm_up(self, ollama):
+        ollama.load_delay = LOAD_DELAY
+        agent = HestiaAgent({"enable_llm": True, "ollama_url": ollama.url, "enable_athena": False})
+        assert await agent.warm_up() is None  # Not initialized yet
+
+        await agent.initialize()
+        try:
+            assert await agent.warm_up() >= LOAD_DELAY * 1000
+            assert ollama.loaded
+        finally:
+            await agent.cleanup()
@@ -0,0 +1,108 @@
+"""
+Tests for the persistent LLM response cache.
+"""
+
+import pytest
+import pytest_asyncio
+
+from hestia.ollama_client import OllamaClient
+from hestia.response_cache import ResponseCache, cache_key, is_deterministic
+from tests.test_hestia.fake_ollama import TOKENS
+
+
+class TestResponseCache:
+
+    def test_determinism_rule(self):
+        assert is_deterministic({"temperature": 0})
+        assert is_deterministic({"temperature": 0.8, "seed": 7})
+        assert not is_deterministic({"temperature": 0.2})
+        assert not is_deterministic(None)
+
+    def test_key_covers_every_input(self):
+        base = cache_key("m", "p", "s", {"temperature": 0})
+        assert base == cache_key("m", "p", "s", {"temperature": 0})
+        assert base != cache_key("other", "p", "s", {"temperature": 0})
+        assert base != cache_key("m", "p2", "s", {"temperature": 0})
+        assert base != cache_key("m", "p", None, {"temperature": 0})
+        assert base != cache_key("m", "p", "s", {"temperature": 0, "seed": 1})
+
+    def test_persists_and_counts(self, tmp_path):
+        cache = ResponseCache(tmp_path / "llm.db")
+        assert cache.get("k") is None
+        cache.put("k", "m", "answer")
+
+        reopened = ResponseCache(tmp_path / "llm.db")
+        assert reopened.get("k") == "answer"
+        assert (cache.misses, reopened.hits) == (1, 1)
+        assert reopened.get_stats()["entries"] == 1
+
+    def test_lru_eviction_by_bytes(self, tmp_path):
+        cache = ResponseCache(tmp_path / "llm.db", max_bytes=25)
+        cache.put("a", "m", "x" * 10)
+        cache.put("b", "m", "y" * 10)
+        cache.get("a")  # b is now least recently used
+        cache.put("c", "m", "z" * 10)
+
+        assert cache.get("b") is None
+        assert cache.get("a") and cache.get("c")
+        assert cache.get_stats()["bytes"] == 20
+        assert cache.evictions == 1
+
+
+@pytest_asyncio.fixture
+async def cached_client(ollama, tmp_path):
+    pytest.importorskip("aiohttp")
+    ollama.token_delay = 0.0
+    client = OllamaClient(
+        base_url=ollama.url,
+        options={"temperature": 0},
+        cache=ResponseCache(tmp_path / "llm.db"),
+    )
+    await client.initialize()
+    yield client
+    await client.cleanup()
+
+
+class TestCachedClient:
+
+    @pytest.mark.asyncio
+    async def test_deterministic_requests_are_served_from_cache(self, ollama, cached_client):
+        first = await cached_client.generate("help", system_prompt="be brief")
+        second = await cached_client.generate("help", system_prompt="be brief")
+
+        assert first == second == "The answer is 42."
+        assert len(ollama.payloads) == 1
+        assert ollama.payloads[0]["options"] == {"temperature": 0}
+        stats = cached_client.get_stats()["cache"]
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+
+        # The stream path shares entries with generate()
+        chunks = [c async for c in cached_client.generate_stream("help", system_prompt="be brief")]
+        assert chunks == ["The answer is 42."]
+        assert len(ollama.payloads) == 1
+
+    @pytest.mark.asyncio
+    async def test_sampled_requests_bypass_cache(self, ollama, cached_client):
+        for _ in range(2):
+            await cached_client.generate("help", options={"temperature": 0.7})
+        assert len(ollama.payloads) == 2
+        assert cached_client.get_stats()["cache_bypassed"] == 2
+
+    @pytest.mark.asyncio
+    async def test_only_complete_streams_are_cached(self, ollama, cached_client):
+        stream = cached_client.generate_stream("story")
+        await stream.__anext__()
+        await stream.aclose()
+        assert cached_client.cache.get_stats()["entries"] == 0
+
+        full = "".join([c async for c in cached_client.generate_stream("story")])
+        assert await cached_client.generate("story") == full
+        assert len(ollama.payloads) == 2
+
+    @pytest.mark.asyncio
+    async def test_truncated_stream_is_not_cached(self, ollama, cached_client):
+        ollama.truncate = True
+        chunks = [c async for c in cached_client.generate_stream("story")]
+
+        assert chunks == TOKENS
+        assert cached_client.cache.get_stats()["entries"] == 0
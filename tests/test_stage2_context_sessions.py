@@ -0,0 +1,144 @@
+"""
+Stage-2 Context Engine Tests (Per-Session Contexts)
+
+Session isolation, LRU/TTL eviction and running token totals.
+"""
+
+import logging
+from datetime import datetime, timedelta
+
+import pytest
+
+from hestia import context_engine
+from hestia.context_engine import ContextEngine, ContextSessions
+
+
+class TestContextSessions:
+
+    @pytest.fixture
+    def sessions(self):
+        return ContextSessions(max_sessions=3)
+
+    def test_sessions_are_isolated(self, sessions):
+        sessions.get("alice").append("alice's notes")
+        sessions.get("bob").append("bob's notes")
+
+        assert [e.content for e in sessions.get("alice").snapshot()] == ["alice's notes"]
+        assert [e.content for e in sessions.get("bob").snapshot()] == ["bob's notes"]
+        assert sessions.get("alice") is sessions.get("alice")
+
+    def test_lru_eviction(self, sessions):
+        first = sessions.get("a")
+        sessions.get("b")
+        sessions.get("c")
+        sessions.get("a")  # b is now least recently used
+
+        sessions.get("d")
+        assert "b" not in sessions
+        assert all(name in sessions for name in ("a", "c", "d"))
+        assert sessions.get_stats()["evictions"] == 1
+        assert first.state == "ACTIVE"
+
+    def test_expired_session_is_replaced(self, sessions):
+        old = sessions.get("a")
+        old.append("stale")
+        old._created_at = datetime.now() - timedelta(seconds=old.MAX_TTL_SECONDS + 1)
+
+        new = sessions.get("a")
+        assert new is not old
+        assert old.state == "EXPIRED"
+        assert new.token_count() == 0
+        assert sessions.total_tokens() == 0
+
+    def test_expired_sessions_are_swept(self, monkeypatch):
+        clock = [datetime.now()]
+
+        class _Clock(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return clock[0]
+
+        monkeypatch.setattr(context_engine, "datetime", _Clock)
+        sessions = ContextSessions(max_sessions=10, ttl_seconds=60)
+        sessions.get("a")
+        clock[0] += timedelta(seconds=30)
+        sessions.get("b")
+        sessions.get("a")  # Live b is now least recently used, expiring a behind it
+
+        clock[0] += timedelta(seconds=31)
+        sessions.get("c")
+        assert "a" not in sessions
+        assert "b" in sessions
+        assert sessions.get_stats()["expirations"] == 1
+
+    def test_running_token_total(self, sessions):
+        sessions.get("a").append("x" * 40)  # 10 tokens
+        sessions.get("b").append("y" * 80)  # 20 tokens
+        sessions.get("b").append("z" * 8)   # 2 tokens
+        assert sessions.total_tokens() == 32
+        assert sessions.get("b").token_count() == 22
+
+        sessions.get("b").clear()
+        assert sessions.total_tokens() == 10
+
+        sessions.drop("a")
+        assert sessions.total_tokens() == 0
+        assert len(sessions) == 1
+
+    def test_evicted_context_stops_counting(self, sessions):
+        evicted = sessions.get("a")
+        for name in ("b", "c", "d"):
+            sessions.get(name)
+
+        assert evicted.state == "DESTROYED"
+        with pytest.raises(ValueError):
+            evicted.append("too late")
+        assert sessions.total_tokens() == 0
+
+    def test_session_ttl(self):
+        sessions = ContextSessions(ttl_seconds=60)
+        assert sessions.get("a").ttl_seconds_remaining() <= 60
+
+    def test_for_session(self):
+        ContextEngine.reset_instance()
+        try:
+            context = ContextEngine.for_session("s1")
+            assert ContextEngine.for_session("s1") is context
+            assert ContextEngine.for_session("s2") is not context
+        finally:
+            ContextEngine.reset_instance()
+        assert context.state == "DESTROYED"
+
+
+class TestContextLogging:
+
+    def test_events_are_sampled_debug(self, caplog, monkeypatch):
+        monkeypatch.setattr(context_engine, "LOG_SAMPLE_EVERY", 5)
+        monkeypatch.setattr(context_engine, "_event_counters", context_engine.defaultdict(
+            context_engine.itertools.count
+        ))
+        context = ContextEngine()
+
+        with caplog.at_level(logging.DEBUG, logger="hestia.context_engine"):
+            for i in range(10):
+                context.append(f"entry {i}")
+
+        appends = [r for r in caplog.records if "context_append_attempt" in r.message]
+        assert len(appends) == 2
+        assert all(r.levelno == logging.DEBUG for r in appends)
+
+    def test_nothing_logged_at_info(self, caplog):
+        with caplog.at_level(logging.INFO, logger="hestia.context_engine"):
+            ContextEngine().append("entry")
+        assert caplog.records == []
+
+    def test_rejections_logged_every_time(self, caplog):
+        context = ContextEngine()
+        for i in range(context.MAX_ENTRIES):
+            context.append(f"entry {i}")
+
+        with caplog.at_level(logging.ERROR, logger="hestia.context_engine"):
+            for _ in range(3):
+                with pytest.raises(ValueError):
+                    context.append("one more")
+        assert len(caplog.records) == 3
@@ -5,7 +5,8 @@ Tests for cross-domain pipeline execution with domains.
 """
 
 import pytest
-from hestia.context_engine import ContextEngine, Pipeline, PipelineStep
+from core.bootstrap import SystemState
+from hestia.context_engine import ContextEngine, Pipeline, PipelineStep, StepMemo
 
 
 class MockDomain:
@@ -155,3 +156,163 @@ END
         pipeline = context.parse_pipeline(pipeline_str)
         # Parser validates - execution handles failures
         assert pipeline is not None
+
+
+class FlakyDomain(MockDomain):
+    """Mock domain whose explain() fails a set number of times, then succeeds."""
+    def __init__(self, name, failures):
+        super().__init__(name)
+        self.failures = failures
+
+    def explain(self, level, context=()):
+        self.call_count += 1
+        self.last_called = ("explain", level, tuple(e.source_domain for e in context))
+        if self.failures:
+            self.failures -= 1
+            raise TimeoutError("model timed out")
+        return f"{self.name} explained at {level} level"
+
+
+class TestPipelineStepMemo:
+    """Test step memoization across retries and replays."""
+
+    PIPELINE = """
+PIPELINE:
+  - athena.query(q="energy policy")
+  - hermes.rewrite(style="brief")
+  - hephaestus.explain(level="basic")
+END
+"""
+
+    @pytest.fixture
+    def context(self):
+        ContextEngine.reset_instance()
+        return ContextEngine()
+
+    @pytest.fixture
+    def domains(self):
+        return {
+            "athena": MockDomain("Athena"),
+            "hermes": MockDomain("Hermes"),
+            "hephaestus": FlakyDomain("Hephaestus", failures=1),
+        }
+
+    def test_executes_in_order_with_context(self, context, domains):
+        context.append("User is researching energy")
+        domains["hephaestus"].failures = 0
+        result = context.execute_pipeline(context.parse_pipeline(self.PIPELINE), domains)
+
+        assert result == "Hephaestus explained at basic level"
+        assert domains["athena"].last_called == ("query", "energy policy")
+        # Context snapshot: user entry, then earlier step outputs
+        assert domains["hephaestus"].last_called[2] == ("user", "athena", "hermes")
+
+    def test_retry_reuses_completed_steps(self, context, domains):
+        pipeline = context.parse_pipeline(self.PIPELINE)
+        with pytest.raises(RuntimeError, match="step 2"):
+            context.execute_pipeline(pipeline, domains, policy_epoch=0)
+
+        result = context.execute_pipeline(pipeline, domains, policy_epoch=0)
+        assert result == "Hephaestus explained at basic level"
+        assert domains["athena"].call_count == 1
+        assert domains["hermes"].call_count == 1
+        assert domains["hephaestus"].call_count == 2
+        assert context.step_memo.get_stats()["hits"] == 2
+
+    def test_only_changed_steps_reexecute(self, context, domains):
+        domains["hephaestus"].failures = 0
+        context.execute_pipeline(context.parse_pipeline(self.PIPELINE), domains, policy_epoch=0)
+
+        changed = context.parse_pipeline(self.PIPELINE.replace("basic", "advanced"))
+        context.execute_pipeline(changed, domains, policy_epoch=0)
+        assert domains["athena"].call_count == 1
+        assert domains["hermes"].call_count == 1
+        assert domains["hephaestus"].call_count == 2
+
+        # A new first-step input changes every step's input chain
+        context.execute_pipeline(
+            context.parse_pipeline(self.PIPELINE.replace("energy", "solar")), domains, policy_epoch=0
+        )
+        assert domains["athena"].call_count == 2
+        assert domains["hermes"].call_count == 2
+
+    def test_context_and_policy_epoch_invalidate(self, context, domains):
+        domains["hephaestus"].failures = 0
+        pipeline = context.parse_pipeline(self.PIPELINE)
+        context.execute_pipeline(pipeline, domains, policy_epoch=0)
+
+        context.execute_pipeline(pipeline, domains, policy_epoch=1)
+        assert domains["athena"].call_count == 2
+
+        context.append("new fact")
+        context.execute_pipeline(pipeline, domains, policy_epoch=1)
+        assert domains["athena"].call_count == 3
+
+    def test_epoch_defaults_to_guardian(self, context, domains, monkeypatch):
+        class Guardian:
+            epoch = 0
+
+            def policy_epoch(self):
+                return self.epoch
+
+        guardian = Guardian()
+        monkeypatch.setattr(SystemState, "_artemis", guardian)
+        domains["hephaestus"].failures = 0
+        pipeline = context.parse_pipeline(self.PIPELINE)
+        context.execute_pipeline(pipeline, domains)
+        context.execute_pipeline(pipeline, domains)
+        assert domains["athena"].call_count == 1
+
+        guardian.epoch = 1
+        context.execute_pipeline(pipeline, domains)
+        assert domains["athena"].call_count == 2
+
+    def test_no_epoch_without_guardian_skips_memo(self, context, domains, monkeypatch):
+        monkeypatch.setattr(SystemState, "_artemis", None)
+        domains["hephaestus"].failures = 0
+        pipeline = context.parse_pipeline(self.PIPELINE)
+        context.execute_pipeline(pipeline, domains)
+        context.execute_pipeline(pipeline, domains)
+        assert domains["athena"].call_count == 2
+        assert len(context.step_memo) == 0
+
+    def test_non_json_input_is_not_memoized(self, context, domains):
+        class Opaque:
+            def __init__(self, value):
+                self.value = value
+
+            def __str__(self):
+                return "opaque"
+
+        class Source:
+            value = 1
+
+            def query(self, q):
+                return Opaque(self.value)
+
+        domains["athena"] = Source()
+        domains["hephaestus"].failures = 0
+        pipeline = context.parse_pipeline(self.PIPELINE)
+        context.execute_pipeline(pipeline, domains, policy_epoch=0)
+        context.execute_pipeline(pipeline, domains, policy_epoch=0)
+
+        # The first step is keyed by its JSON args; the next by an opaque input
+        assert domains["hermes"].call_count == 2
+        assert context.step_memo.get_stats()["hits"] == 2
+
+    def test_unknown_domain_or_method(self, context, domains):
+        pipeline = context.parse_pipeline("PIPELINE:\n  - pluto.query(q=\"x\")\nEND")
+        with pytest.raises(ValueError, match="unknown domain"):
+            context.execute_pipeline(pipeline, domains)
+
+        pipeline = context.parse_pipeline("PIPELINE:\n  - athena.delete(q=\"x\")\nEND")
+        with pytest.raises(ValueError, match="unknown method"):
+            context.execute_pipeline(pipeline, domains)
+
+    def test_memo_is_bounded(self):
+        memo = StepMemo(max_entries=2)
+        for i in range(3):
+            memo.put(("d", str(i), "c", 0), i)
+        assert len(memo) == 2
+        assert memo.get(("d", "0", "c", 0)) == (False, None)
+        assert memo.get(("d", "2", "c", 0)) == (True, 2)